@@ -134,7 +134,8 @@ if st.session_state.get("authenticated"):
     current_fellows = st.Page("pages/current-fellows-page.py", title="Current Fellows", default=True)
     alumni = st.Page("pages/alumni-page.py", title="Alumni")
     events = st.Page("pages/events-page.py", title="Events & Attendance")
-    pg = st.navigation([current_fellows, alumni, events])
+    search = st.Page("pages/search-page.py", title="Search")
+    pg = st.navigation([current_fellows, alumni, events, search])
 else:
     pg = st.navigation([st.Page(login_page, title="Log in", default=True)])
 
@@ -0,0 +1,424 @@
+"""
+backends.py — Storage backends for helpers.py
+
+helpers.py talks to storage only through the small StorageBackend protocol
+below, which covers every operation the dashboard performs on the spreadsheet:
+
+  read_tabs     — read whole tabs, or only some of their columns (header row
+                  + data rows), in one request
+  read_header   — read just the header row of a tab
+  read_ids      — read the column A cells (record IDs) of a few rows, in one
+                  request, to check cached row numbers before a write
+  append_rows   — append rows at the bottom of a tab
+  batch_update  — overwrite one or more A1 ranges in a tab
+  delete_row    — delete one row (rows below move up)
+  find          — first row whose cell in a column equals a value
+  version       — cheap change marker for the whole spreadsheet (Drive metadata)
+
+Two implementations:
+
+  GoogleSheetsBackend — the real spreadsheet, via gspread
+  InMemoryBackend     — plain Python lists, with optional artificial latency
+                        per call and call counters; synthetic_workbook() fills
+                        it with a roster of any size for load tests
+
+Rows and columns are 1-based and row 1 is the header, as in Google Sheets.
+Which backend the app uses is set by `backend` in [gsheets] secrets
+("sheets" by default, or "memory"). This module does NOT depend on Streamlit.
+"""
+
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import date, timedelta
+from typing import Protocol
+
+import gspread
+from gspread.utils import a1_range_to_grid_range, absolute_range_name
+
+
+class StorageBackend(Protocol):
+    def read_tabs(self, tabs: list[str], columns: dict[str, list[int]] = None) -> dict[str, list[list]]:
+        """
+        {tab: [header, row2, row3, ...]} for every requested tab. For tabs in
+        `columns` only those 1-based sheet columns are returned, in that order.
+        """
+        ...
+
+    def read_header(self, tab: str) -> list[str]:
+        ...
+
+    def read_ids(self, tab: str, rows: list[int]) -> list[str]:
+        """Column A of each given row, in order ("" for an empty or missing row)."""
+        ...
+
+    def append_rows(self, tab: str, rows: list[list]):
+        """Append rows; return the sheet row number of the first one (None if unknown)."""
+        ...
+
+    def batch_update(self, tab: str, updates: list[dict]) -> None:
+        """Write [{"range": "E5:F5", "values": [[...]]}, ...] to one tab."""
+        ...
+
+    def delete_row(self, tab: str, row_num: int) -> None:
+        ...
+
+    def find(self, tab: str, value: str, column: int = 1):
+        """Row number of the first cell in `column` equal to value, or None."""
+        ...
+
+    def version(self) -> str:
+        """Opaque marker that changes whenever any tab changes."""
+        ...
+
+    def stats(self) -> dict:
+        """Calls made so far, by operation."""
+        ...
+
+
+# ============ GOOGLE SHEETS ============
+
+_UPDATED_RANGE_ROW = re.compile(r"![A-Z]+(\d+)")
+
+
+def _column_letter(col: int) -> str:
+    """1-based column number to its A1 letters: 1 -> "A", 27 -> "AA"."""
+    letters = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files/"
+
+
+def column_spans(columns: list[int]) -> list[tuple[int, int]]:
+    """Group 1-based column numbers into contiguous (first, last) spans: [1,2,3,6] -> [(1,3),(6,6)]."""
+    spans = []
+    for col in sorted(set(columns)):
+        if spans and col == spans[-1][1] + 1:
+            spans[-1] = (spans[-1][0], col)
+        else:
+            spans.append((col, col))
+    return spans
+
+
+def project(grid: list[list], columns: list[int]) -> list[list]:
+    """Keep only the given 1-based columns of a grid, in that order (short rows padded)."""
+    return [[row[c - 1] if c - 1 < len(row) else "" for c in columns] for row in grid]
+
+
+class GoogleSheetsBackend:
+    """
+    The live spreadsheet. `handles` provides spreadsheet() / worksheet(name) /
+    refresh() (helpers._SheetHandles), so no call re-opens the spreadsheet.
+    """
+
+    def __init__(self, handles):
+        self.handles = handles
+        self._lock = threading.Lock()
+        self.calls = Counter()
+
+    def _count(self, op: str) -> None:
+        with self._lock:
+            self.calls[op] += 1
+
+    def read_tabs(self, tabs: list[str], columns: dict[str, list[int]] = None) -> dict[str, list[list]]:
+        self._count("read_tabs")
+        columns = columns or {}
+        # One range per whole tab, or one per contiguous column span (e.g. 'Fellows'!A:C)
+        ranges, owners = [], []
+        for tab in tabs:
+            if tab in columns:
+                for first, last in column_spans(columns[tab]):
+                    ranges.append(absolute_range_name(tab, f"{_column_letter(first)}:{_column_letter(last)}"))
+                    owners.append((tab, first, last))
+            else:
+                ranges.append(absolute_range_name(tab))
+                owners.append((tab, None, None))
+        try:
+            response = self.handles.spreadsheet().values_batch_get(ranges)
+        except gspread.exceptions.APIError as e:
+            # A renamed or deleted tab shows up as an unparseable range
+            if "Unable to parse range" in str(e):
+                self.handles.refresh()
+            raise
+
+        grids, spans = {}, {}
+        for (tab, first, last), value_range in zip(owners, response.get("valueRanges", [])):
+            values = value_range.get("values", [])
+            if first is None:
+                grids[tab] = values
+            else:
+                spans.setdefault(tab, []).append((first, last, values))
+        for tab, parts in spans.items():
+            # Stitch the spans back into full-width rows, then pick the columns asked for
+            height = max(len(values) for _, _, values in parts)
+            width = max(last for _, last, _ in parts)
+            rows = [[""] * width for _ in range(height)]
+            for first, last, values in parts:
+                for r, cells in enumerate(values):
+                    rows[r][first - 1:first - 1 + len(cells)] = cells
+            grids[tab] = project(rows, columns[tab])
+        return grids
+
+    def read_header(self, tab: str) -> list[str]:
+        self._count("read_header")
+        values = self.handles.spreadsheet().values_get(absolute_range_name(tab, "1:1")).get("values", [])
+        return [str(h) for h in values[0]] if values else []
+
+    def read_ids(self, tab: str, rows: list[int]) -> list[str]:
+        self._count("read_ids")
+        ranges = [absolute_range_name(tab, f"A{row_num}") for row_num in rows]
+        response = self.handles.spreadsheet().values_batch_get(ranges)
+        ids = []
+        for value_range in response.get("valueRanges", []):
+            values = value_range.get("values", [])
+            ids.append(str(values[0][0]) if values and values[0] else "")
+        return ids
+
+    def append_rows(self, tab: str, rows: list[list]):
+        self._count("append_rows")
+        response = self.handles.worksheet(tab).append_rows(rows, value_input_option="USER_ENTERED")
+        # The response names the range written (e.g. "'Check-ins'!A57:F57")
+        updated_range = ((response or {}).get("updates") or {}).get("updatedRange", "")
+        match = _UPDATED_RANGE_ROW.search(updated_range)
+        return int(match.group(1)) if match else None
+
+    def batch_update(self, tab: str, updates: list[dict]) -> None:
+        self._count("batch_update")
+        self.handles.worksheet(tab).batch_update(updates, value_input_option="USER_ENTERED")
+
+    def delete_row(self, tab: str, row_num: int) -> None:
+        self._count("delete_row")
+        self.handles.worksheet(tab).delete_rows(row_num)
+
+    def find(self, tab: str, value: str, column: int = 1):
+        self._count("find")
+        cell = self.handles.worksheet(tab).find(value, in_column=column)
+        return cell.row if cell else None
+
+    def version(self) -> str:
+        """
+        The file's Drive version and modifiedTime (drive.readonly scope).
+        One metadata request, billed to the Drive quota rather than Sheets reads
+        (the request gateway throttles it with its separate "drive" bucket).
+        """
+        self._count("version")
+        spreadsheet = self.handles.spreadsheet()
+        response = spreadsheet.client.request(
+            "get", DRIVE_FILES_URL + spreadsheet.id,
+            params={"fields": "version,modifiedTime", "supportsAllDrives": True},
+        )
+        meta = response.json()
+        return f'{meta.get("version", "")}:{meta.get("modifiedTime", "")}'
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.calls)
+
+
+# ============ IN MEMORY ============
+
+class InMemoryBackend:
+    """
+    Tabs held as lists of string rows. Every call sleeps `latency` seconds
+    (to stand in for an API round-trip) and is counted, so page render time
+    and call counts can be measured without a spreadsheet.
+
+    version() stands in for the Drive metadata call: it changes on every
+    write, and touch() simulates someone editing the sheet by hand.
+    """
+
+    def __init__(self, tabs: dict[str, list[list]] = None, latency: float = 0.0, sleep=time.sleep):
+        self._tabs = {tab: [list(map(str, row)) for row in grid] for tab, grid in (tabs or {}).items()}
+        self.latency = latency
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.calls = Counter()
+        self._version = 0
+
+    def _call(self, op: str) -> None:
+        # Round-trip latency is simulated outside the lock, so concurrent
+        # sessions overlap their waits as they would against the real API
+        if self.latency:
+            self._sleep(self.latency)
+        with self._lock:
+            self.calls[op] += 1
+
+    def _grid(self, tab: str) -> list[list]:
+        if tab not in self._tabs:
+            raise gspread.WorksheetNotFound(tab)
+        return self._tabs[tab]
+
+    def read_tabs(self, tabs: list[str], columns: dict[str, list[int]] = None) -> dict[str, list[list]]:
+        self._call("read_tabs")
+        columns = columns or {}
+        with self._lock:
+            return {
+                tab: project(self._grid(tab), columns[tab]) if tab in columns
+                else [list(row) for row in self._grid(tab)]
+                for tab in tabs
+            }
+
+    def read_header(self, tab: str) -> list[str]:
+        self._call("read_header")
+        with self._lock:
+            grid = self._grid(tab)
+            return list(grid[0]) if grid else []
+
+    def read_ids(self, tab: str, rows: list[int]) -> list[str]:
+        self._call("read_ids")
+        with self._lock:
+            grid = self._grid(tab)
+            return [grid[r - 1][0] if 0 < r <= len(grid) and grid[r - 1] else "" for r in rows]
+
+    def append_rows(self, tab: str, rows: list[list]):
+        self._call("append_rows")
+        with self._lock:
+            grid = self._grid(tab)
+            self._version += 1
+            first_row = len(grid) + 1
+            grid.extend(["" if v is None else str(v) for v in row] for row in rows)
+            return first_row
+
+    def batch_update(self, tab: str, updates: list[dict]) -> None:
+        self._call("batch_update")
+        with self._lock:
+            grid = self._grid(tab)
+            self._version += 1
+            for update in updates:
+                bounds = a1_range_to_grid_range(update["range"])
+                first_row, first_col = bounds.get("startRowIndex", 0), bounds.get("startColumnIndex", 0)
+                for r, values in enumerate(update["values"], start=first_row):
+                    while len(grid) <= r:
+                        grid.append([])
+                    row = grid[r]
+                    end = first_col + len(values)
+                    if len(row) < end:
+                        row.extend([""] * (end - len(row)))
+                    row[first_col:end] = ["" if v is None else str(v) for v in values]
+
+    def delete_row(self, tab: str, row_num: int) -> None:
+        self._call("delete_row")
+        with self._lock:
+            del self._grid(tab)[row_num - 1]
+            self._version += 1
+
+    def find(self, tab: str, value: str, column: int = 1):
+        self._call("find")
+        with self._lock:
+            for row_num, row in enumerate(self._grid(tab), start=1):
+                if len(row) >= column and row[column - 1] == value:
+                    return row_num
+            return None
+
+    def version(self) -> str:
+        self._call("version")
+        with self._lock:
+            return str(self._version)
+
+    def touch(self) -> None:
+        """Simulate an edit made directly in the spreadsheet (moves version() only)."""
+        with self._lock:
+            self._version += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.calls)
+
+
+# ============ SYNTHETIC DATA ============
+
+TAB_HEADERS = {
+    "Fellows": [
+        "ID", "Name", "Email", "Congressional Email", "Phone Number", "Cohort", "Fellow Type",
+        "Party", "Office", "Chamber", "Supervisor's Email", "LinkedIn", "Start Date", "End Date",
+        "Status", "Last Check-in", "Prior Role", "Education", "Notes",
+        "Requires Monthly Reports", "Report Start Date", "Report End Month",
+    ],
+    "Check-ins": ["ID", "Fellow ID", "Date", "Check-in Type", "Notes", "Staff Member"],
+    "Status Reports": ["ID", "Fellow ID", "Fellow Name", "Month", "Submitted", "Date Submitted", "Notes", "Late"],
+    "Alumni": [
+        "ID", "Name", "Email", "Phone Number", "Cohort", "Fellow Type", "Party", "Office Served",
+        "Chamber", "Education", "Prior Role", "Current Role", "Currently on the Hill?", "Sector",
+        "Location", "Contact?", "LinkedIn", "Last Engaged", "Engagement Notes", "Notes",
+    ],
+    "Events": [
+        "Event ID", "Event Name", "Date", "Type", "Location", "Venue", "Cohort", "Quarter",
+        "Description", "Required for Fellows?", "Staffed By",
+    ],
+    "Event Attendance": ["Record ID", "Event ID", "Fellow ID", "Fellow Name", "Attended?", "Notes"],
+    "Form Responses 1": ["Timestamp", "Email Address", "First Name", "Last Name"],
+}
+
+# Roughly today's roster; synthetic_workbook(scale=10) is ten times this
+BASE_FELLOWS = 30
+BASE_ALUMNI  = 120
+BASE_EVENTS  = 20
+
+
+def synthetic_workbook(scale: int = 1, seed: int = 0) -> dict[str, list[list]]:
+    """
+    Generate a plausible spreadsheet (all tabs in TAB_HEADERS) with `scale`
+    times the base roster, for InMemoryBackend load tests. Deterministic per seed.
+    """
+    rng = random.Random(seed)
+    new_id = lambda: str(uuid.UUID(int=rng.getrandbits(128)))
+    day = lambda start, span: (start + timedelta(days=rng.randrange(span))).isoformat()
+    tabs = {tab: [list(header)] for tab, header in TAB_HEADERS.items()}
+    cohorts = ["January 2025", "January 2026"]
+    types = ["Congressional Innovation Fellow", "Senior Congressional Innovation Fellow", "AI Security Fellow"]
+    parties = ["Democrat", "Republican", "Independent"]
+    months = [date(2026, m, 1).strftime("%b %Y") for m in range(3, 10)]
+
+    fellows = []
+    for i in range(BASE_FELLOWS * scale):
+        fid, name = new_id(), f"Fellow {i + 1}"
+        fellows.append((fid, name))
+        tabs["Fellows"].append([
+            fid, name, f"fellow{i + 1}@example.org", "", "", rng.choice(cohorts), rng.choice(types),
+            rng.choice(parties), f"Office of Member {i % 200 + 1}", rng.choice(["House", "Senate"]), "", "",
+            "2026-01-12", "2026-12-31", rng.choice(["Active", "Active", "Active", "Flagged", "Ending Soon"]),
+            day(date(2025, 9, 1), 300), "Software Engineer", "B.S. Computer Science",
+            "Works on privacy, AI policy and appropriations oversight.", "TRUE", "2026-03-01", "",
+        ])
+        for _ in range(rng.randrange(1, 6)):
+            tabs["Check-ins"].append([
+                new_id(), fid, day(date(2026, 1, 15), 270), rng.choice(["Call", "In person", "Email"]),
+                "Discussed office priorities and upcoming hearings.", "Staff",
+            ])
+        for month in months:
+            if rng.random() < 0.8:
+                late = rng.random() < 0.1
+                tabs["Status Reports"].append([
+                    new_id(), fid, name, month, "TRUE", day(date(2026, 3, 1), 200), "", "TRUE" if late else "FALSE",
+                ])
+
+    for i in range(BASE_ALUMNI * scale):
+        tabs["Alumni"].append([
+            new_id(), f"Alum {i + 1}", f"alum{i + 1}@example.org", "", str(2016 + i % 10), "CIF",
+            rng.choice(parties), f"Office of Member {i % 300 + 1}", rng.choice(["House", "Senate"]),
+            "M.S. Public Policy", "Data Scientist", "Policy Advisor", "TRUE" if rng.random() < 0.3 else "FALSE",
+            rng.choice(["Government", "Nonprofit", "Private Sector", "Academia"]), "Washington, DC",
+            "TRUE", "", day(date(2024, 1, 1), 900), "Spoke at alumni panel.", "",
+        ])
+
+    for i in range(BASE_EVENTS * scale):
+        eid, when = new_id(), date(2026, 1, 5) + timedelta(days=rng.randrange(350))
+        tabs["Events"].append([
+            eid, f"Event {i + 1}", when.isoformat(), rng.choice(["Happy Hour", "Site Visit", "Speaker Series"]),
+            "Washington, DC", "", "January 2026", f"Q{(when.month - 1) // 3 + 1} {when.year}",
+            "", "TRUE", "Staff",
+        ])
+        # Attendance per event stays roughly constant, so the tab grows linearly with scale
+        for fid, name in rng.sample(fellows, k=min(len(fellows), rng.randrange(5, 15))):
+            tabs["Event Attendance"].append([
+                new_id(), eid, fid, name, "TRUE" if rng.random() < 0.7 else "FALSE", "",
+            ])
+
+    return tabs
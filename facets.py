@@ -0,0 +1,107 @@
+"""
+facets.py — One-pass filtering and per-value counts for the roster filters
+
+The Current Fellows and Alumni pages filter a card list by a handful of
+dropdowns (status, type, party, chamber, cohort, …) and show counts and pie
+charts of the same dimensions. facet() does all of it in one pass:
+
+    result = facet(alumni, {
+        "sector": Facet(lambda a: a["sector"]),
+        "party":  Facet(lambda a: a["party"]),
+        "types":  Facet(lambda a: a["fellow_types"], multi=True),
+    }, {"sector": "Government", "party": None, "types": None})
+
+    result.records           # records matching every selection, in list order
+    result.counts["party"]   # Counter: party -> matches if that party were picked
+    result.pool["party"]     # matches with the party filter cleared ("All Parties")
+    result.totals["sector"]  # Counter over `scope`, ignoring `where` and the selections
+
+counts[name] are the numbers a dropdown shows next to its options: each one is
+what the list would hold if that option were chosen and every other filter
+stayed as it is. A record that fails two or more selections counts nowhere,
+so the pass does no per-facet re-filtering.
+
+This module does NOT depend on Streamlit or gspread.
+"""
+
+from collections import Counter
+from typing import Callable, NamedTuple
+
+
+class Facet(NamedTuple):
+    """
+    One filter dimension: key(record) -> the record's value. With multi=True,
+    key returns several values (e.g. an alum's list of fellow types) and a
+    selection matches if it is any of them.
+    """
+    key: Callable
+    multi: bool = False
+
+
+class FacetResult(NamedTuple):
+    records: list                   # pass `where` and every selection
+    counts: dict[str, Counter]      # facet -> value -> pass `where` and every *other* selection
+    pool: dict[str, int]            # facet -> pass `where` and every other selection
+    totals: dict[str, Counter]      # facet -> value -> in `scope`, no filters applied
+    scope_count: int                # records in `scope`
+
+
+def facet(records: list, facets: dict[str, Facet], selection: dict,
+          where: Callable = None, scope: Callable = None) -> FacetResult:
+    """
+    Filter `records` by `selection` ({facet name: value, or None for no filter})
+    and count every facet's values, in one pass.
+
+    where: extra filter applied before the facets (e.g. the search box); it
+        narrows records, counts and pool but not totals.
+    scope: which records the unfiltered totals cover (default: all of them),
+        for summary metrics and charts that ignore the filters.
+    """
+    names = list(facets)
+    keys = [(spec.key, spec.multi) for spec in facets.values()]
+    wanted = [(i, selection[name]) for i, name in enumerate(names) if selection.get(name) is not None]
+    matched = []
+    counts = {name: Counter() for name in names}
+    pool = dict.fromkeys(names, 0)
+    totals = {name: Counter() for name in names}
+    scope_count = 0
+
+    for record in records:
+        in_scope = scope is None or scope(record)
+        passes = where is None or where(record)
+        if not (in_scope or passes):
+            continue
+        values = [key(record) if multi else (key(record),) for key, multi in keys]
+        if in_scope:
+            scope_count += 1
+            for name, vals in zip(names, values):
+                totals[name].update(vals)
+        if not passes:
+            continue
+
+        missed = None                       # index of the one failed selection
+        for i, want in wanted:
+            if want not in values[i]:
+                if missed is not None:
+                    break                   # fails two selections: counts nowhere
+                missed = i
+        else:
+            if missed is None:
+                matched.append(record)
+                for name, vals in zip(names, values):
+                    counts[name].update(vals)
+                    pool[name] += 1
+            else:
+                name = names[missed]
+                counts[name].update(values[missed])
+                pool[name] += 1
+
+    return FacetResult(matched, counts, pool, totals, scope_count)
+
+
+def count_label(counts: Counter, all_label: str = None, all_count: int = 0) -> Callable:
+    """
+    format_func for a filter selectbox: "Democrat (12)". `all_label` (e.g.
+    "All Parties") shows `all_count`, usually FacetResult.pool[name].
+    """
+    return lambda option: f"{option} ({all_count if option == all_label else counts[option]})"
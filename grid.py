@@ -0,0 +1,86 @@
+"""
+grid.py — Paginated card grids for the dashboard pages
+
+The Current Fellows, Alumni and Events pages filter and sort their cached
+records, then hand the result to card_grid(), which draws only the current
+page of cards and a row of page controls under them:
+
+    from grid import card_grid
+    card_grid(filtered_fellows, show_fellow_card, key="fellows_grid")
+
+Each card has its own buttons, so drawing every match meant hundreds of
+widgets on every rerun. A page holds page_sizes[0] cards by default (the user
+can pick a larger size), so a rerun draws the same number of widgets however
+long the list is.
+
+The page number and size live in session state under `key`. The grid goes back
+to page 1 whenever the list itself changes — a new filter, search or sort — and
+stays put when a card is only edited.
+"""
+
+import math
+import streamlit as st
+
+PAGE_SIZES = (12, 24, 48, 96)
+
+
+def _set_page(page_key: str, page: int) -> None:
+    """on_click callback for Prev / Next (widget state can only change before the widget is drawn)."""
+    st.session_state[page_key] = page
+
+
+def card_grid(items: list, render, key: str, columns: int = 3,
+              page_sizes: tuple = PAGE_SIZES, item_id=lambda item: item["id"]) -> list:
+    """
+    Draw one page of `items`, `columns` cards per row, calling render(item) for
+    each, then the page controls. Returns the items that were drawn.
+
+    Controls are only shown when the list is longer than the smallest page size.
+    item_id(item) identifies a record for detecting that the list has changed.
+    """
+    page_key, size_key, list_key = f"{key}_page", f"{key}_page_size", f"{key}_list"
+
+    # Back to page 1 when the filtered/sorted list changes
+    signature = hash(tuple(item_id(item) for item in items))
+    if st.session_state.get(list_key) != signature:
+        st.session_state[list_key] = signature
+        st.session_state[page_key] = 1
+
+    if st.session_state.get(size_key) not in page_sizes:
+        st.session_state[size_key] = page_sizes[0]
+    page_size = st.session_state[size_key]
+    page_count = max(1, math.ceil(len(items) / page_size))
+    page = min(max(1, st.session_state.get(page_key, 1)), page_count)
+    st.session_state[page_key] = page
+
+    start = (page - 1) * page_size
+    visible = items[start:start + page_size]
+
+    if columns == 1:
+        for item in visible:
+            render(item)
+    else:
+        cols = st.columns(columns)
+        for idx, item in enumerate(visible):
+            with cols[idx % columns]:
+                render(item)
+
+    if len(items) > page_sizes[0]:
+        col_prev, col_info, col_page, col_size, col_next = st.columns([1, 2, 1, 1, 1])
+        with col_prev:
+            st.button("‹ Prev", key=f"{key}_prev", use_container_width=True, disabled=page <= 1,
+                      on_click=_set_page, args=(page_key, page - 1))
+        with col_info:
+            st.caption(f"Showing {start + 1}–{start + len(visible)} of {len(items)}")
+        with col_page:
+            st.number_input("Page", min_value=1, max_value=page_count, step=1, key=page_key,
+                            label_visibility="collapsed", help=f"Page (1–{page_count})")
+        with col_size:
+            st.selectbox("Per page", page_sizes, key=size_key, label_visibility="collapsed",
+                         format_func=lambda size: f"{size} per page",
+                         on_change=_set_page, args=(page_key, 1))
+        with col_next:
+            st.button("Next ›", key=f"{key}_next", use_container_width=True, disabled=page >= page_count,
+                      on_click=_set_page, args=(page_key, page + 1))
+
+    return visible
@@ -39,7 +39,18 @@ import gspread
 from google.oauth2.service_account import Credentials
 import uuid
 import re
-from datetime import datetime, timedelta
+import calendar
+import functools
+import threading
+import time
+from datetime import date, datetime
+from sheets_gateway import RequestGateway, gateway_http_client
+from mirror import SheetMirror
+from search import TokenIndex, FullTextIndex, snippet
+from backends import GoogleSheetsBackend, InMemoryBackend, synthetic_workbook
+from records import (
+    intern_str, CohortKey, Fellow, CheckIn, StatusReport, Alumni, Event, AttendanceRecord, FormResponse,
+)
 
 
 # ============ GOOGLE SHEETS CONFIG ============
@@ -65,6 +76,32 @@ EVENTS_SHEET           = "Events"
 EVENT_ATTENDANCE_SHEET = "Event Attendance"
 FORM_RESPONSES_SHEET   = "Form Responses 1"
 
+# How long a cached tab snapshot is served before the next fetch re-reads it.
+# Writes made through this module invalidate the affected tab immediately;
+# edits made directly in the spreadsheet show up once the TTL expires.
+CACHE_TTL_SECONDS = int(st.secrets["gsheets"].get("cache_ttl_seconds", 300))
+
+# A cached row number is trusted for this long after its snapshot was loaded,
+# patched or confirmed; past that, a write first checks column A (_rows_hold).
+# 0 confirms the row before every write.
+ROW_CHECK_SECONDS = int(st.secrets["gsheets"].get("row_check_seconds", CACHE_TTL_SECONDS))
+
+# Conditional refresh: when a snapshot expires, first ask Drive whether the
+# spreadsheet changed (one metadata call) and keep the snapshot if it didn't.
+CHANGE_DETECTION = bool(st.secrets["gsheets"].get("change_detection", False))
+
+# Storage backend: "sheets" (the live spreadsheet) or "memory" (synthetic
+# in-memory data for load testing; see backends.py).
+BACKEND = st.secrets["gsheets"].get("backend", "sheets")
+
+# Optional SQLite read replica (mirror mode). Off unless mirror_path is set.
+MIRROR_PATH = st.secrets["gsheets"].get("mirror_path", "")
+MIRROR_REFRESH_SECONDS = int(st.secrets["gsheets"].get("mirror_refresh_seconds", 60))
+
+# Optional tab the materialized event compliance table is written to on every
+# attendance save (see get_attendance_index). Off unless compliance_tab is set.
+COMPLIANCE_SHEET = st.secrets["gsheets"].get("compliance_tab", "")
+
 EVENT_TYPES = [
     "Happy Hour", "Site Visit", "Social", "Career Development",
     "Speaker Series", "Check-ins", "Conference", "Recruitment",
@@ -73,11 +110,22 @@ EVENT_TYPES = [
 
 # ============ CONNECTION HELPERS ============
 
+@st.cache_resource
+def _request_gateway() -> RequestGateway:
+    """
+    Process-wide rate limiter / retry policy for every Sheets request.
+    All sessions share the service account's per-minute quota, so they share
+    one gateway. Limits can be tuned in [gsheets] secrets (see sheets_gateway.py).
+    """
+    return RequestGateway.from_config(st.secrets["gsheets"])
+
+
 @st.cache_resource
 def _get_client():
     """
     Authenticate with Google using a service account and return a gspread client.
     Cached as a resource so the connection is reused across Streamlit reruns.
+    Every request it makes goes through _request_gateway() (throttled, retried on 429/5xx).
 
     Airtable equivalent: no explicit auth step — API key was just a header value.
     Here we need OAuth2 credentials from a service account JSON stored in secrets.
@@ -95,12 +143,717 @@ def _get_client():
         dict(st.secrets["gcp_service_account"]),
         scopes=SCOPES
     )
-    return gspread.authorize(creds)
+    return gspread.authorize(creds, http_client=gateway_http_client(_request_gateway()))
+
+
+class _SheetHandles:
+    """
+    The opened Spreadsheet plus a tab name -> Worksheet map, shared by every session.
+
+    open_by_key() and .worksheet() each cost a metadata request, so they are
+    done once and reused by every helper. The map is rebuilt from a single
+    worksheets() listing when a name is not in it (a tab was added or renamed),
+    when a read reports that a tab can't be found, and at most once per cache
+    TTL so a tab that was deleted and re-created is picked up too.
+    """
+
+    def __init__(self, client: gspread.Client, spreadsheet_id: str, ttl: float):
+        self._client = client
+        self._spreadsheet_id = spreadsheet_id
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._spreadsheet = None
+        self._worksheets: dict[str, gspread.Worksheet] = {}
+        self._listed_at = None
+
+    def spreadsheet(self) -> gspread.Spreadsheet:
+        with self._lock:
+            if self._spreadsheet is None:
+                self._spreadsheet = self._client.open_by_key(self._spreadsheet_id)
+            return self._spreadsheet
+
+    def _relist(self) -> None:
+        # Caller holds self._lock
+        if self._spreadsheet is None:
+            self._spreadsheet = self._client.open_by_key(self._spreadsheet_id)
+        self._worksheets = {ws.title: ws for ws in self._spreadsheet.worksheets()}
+        self._listed_at = time.monotonic()
+
+    def worksheet(self, name: str) -> gspread.Worksheet:
+        with self._lock:
+            expired = self._listed_at is None or time.monotonic() - self._listed_at >= self.ttl
+            if expired or name not in self._worksheets:
+                self._relist()
+            ws = self._worksheets.get(name)
+        if ws is None:
+            raise gspread.WorksheetNotFound(name)
+        return ws
+
+    def refresh(self) -> None:
+        """Forget every handle; the next lookup re-opens the spreadsheet and re-lists its tabs."""
+        with self._lock:
+            self._spreadsheet = None
+            self._worksheets = {}
+            self._listed_at = None
+
+
+@st.cache_resource
+def _sheet_handles() -> _SheetHandles:
+    """Process-wide Spreadsheet/Worksheet handles (cache_resource, so every session shares them)."""
+    return _SheetHandles(_get_client(), SPREADSHEET_ID, CACHE_TTL_SECONDS)
+
+
+@st.cache_resource
+def _backend():
+    """
+    The storage backend every helper reads and writes through (shared by all sessions).
+
+    secrets.toml entries (all optional):
+        [gsheets]
+        backend = "memory"          # default "sheets"
+        memory_scale = 10           # roster size multiple for the synthetic data
+        memory_latency_ms = 150     # artificial delay per call
+    """
+    if BACKEND == "memory":
+        config = st.secrets["gsheets"]
+        return InMemoryBackend(
+            synthetic_workbook(scale=int(config.get("memory_scale", 1))),
+            latency=float(config.get("memory_latency_ms", 0)) / 1000,
+        )
+    return GoogleSheetsBackend(_sheet_handles())
+
+
+def backend_stats() -> dict:
+    """Storage calls made by this process so far, by operation (read_tabs, append_rows, ...)."""
+    return _backend().stats()
+
+
+class _SnapshotCache:
+    """
+    One decoded snapshot per tab, shared by every Streamlit session.
+
+    get_many() returns the cached snapshots that are younger than the TTL and
+    loads all the others together with one call to the loader (one batched
+    sheet read). Concurrent sessions that miss on the same tab wait for a single
+    load instead of each reading the sheet. invalidate() drops one tab; a load
+    that was already in flight when the tab was invalidated is not stored, so a
+    write is never masked by the read that raced it.
+
+    With a version probe (change detection), an expired snapshot is first
+    checked against probe() — the spreadsheet's Drive version — and kept for
+    another TTL if the version hasn't moved since it was loaded.
+    """
+
+    def __init__(self, ttl: float, probe=None):
+        self.ttl = ttl
+        self.probe = probe
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple] = {}                  # tab -> (loaded_at, snapshot, version)
+        self._generations: dict[str, int] = {}                # tab -> invalidation count
+        self._load_locks: dict[str, threading.Lock] = {}
+
+    def _fresh(self, tab: str):
+        entry = self._entries.get(tab)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def get_many(self, tabs: list[str], loader) -> dict:
+        """
+        Return {tab: snapshot} for every tab in tabs. loader(missing_tabs) must
+        return {tab: snapshot} for exactly the tabs it is given.
+        """
+        found = {}
+        with self._lock:
+            for tab in tabs:
+                snapshot = self._fresh(tab)
+                if snapshot is not None:
+                    found[tab] = snapshot
+            missing = sorted({tab for tab in tabs if tab not in found})
+            if not missing:
+                return found
+            # Always taken in sorted order, so overlapping batches can't deadlock
+            load_locks = [self._load_locks.setdefault(tab, threading.Lock()) for tab in missing]
+
+        for load_lock in load_locks:
+            load_lock.acquire()
+        try:
+            with self._lock:
+                stale = []
+                for tab in missing:
+                    snapshot = self._fresh(tab)   # another session may have just loaded it
+                    if snapshot is not None:
+                        found[tab] = snapshot
+                    else:
+                        stale.append(tab)
+            # Taken before the load, so a change made during it is seen next time
+            version = self._probe() if stale else None
+            with self._lock:
+                generations = {}
+                now = time.monotonic()
+                for tab in stale:
+                    entry = self._entries.get(tab)
+                    if version is not None and entry and entry[2] == version:
+                        self._entries[tab] = (now, entry[1], version)   # unchanged: keep it
+                        found[tab] = entry[1]
+                    else:
+                        generations[tab] = self._generations.get(tab, 0)
+            if generations:
+                loaded = loader(list(generations))
+                with self._lock:
+                    now = time.monotonic()
+                    for tab, generation in generations.items():
+                        if self._generations.get(tab, 0) == generation:
+                            self._entries[tab] = (now, loaded[tab], version)
+                found.update(loaded)
+        finally:
+            for load_lock in reversed(load_locks):
+                load_lock.release()
+        return found
+
+    def _probe(self):
+        """Current version from the probe, or None (no probe, or it failed: reload)."""
+        if self.probe is None:
+            return None
+        try:
+            return self.probe()
+        except Exception:
+            return None
+
+    def invalidate(self, tab: str) -> None:
+        with self._lock:
+            self._entries.pop(tab, None)
+            self._generations[tab] = self._generations.get(tab, 0) + 1
+
+    def patch(self, tab: str, apply) -> None:
+        """
+        Apply a successful write to the cached snapshot in place (write-through).
+        The snapshot keeps its original expiry. If nothing is cached there is
+        nothing to patch; if the patch itself fails the tab is dropped instead.
+        """
+        with self._lock:
+            self._generations[tab] = self._generations.get(tab, 0) + 1
+            entry = self._entries.get(tab)
+            if entry is None:
+                return
+            try:
+                apply(entry[1])
+            except Exception:
+                self._entries.pop(tab, None)
+
+
+@st.cache_resource
+def _snapshot_cache() -> _SnapshotCache:
+    """Process-wide snapshot cache (cache_resource, so every session shares it)."""
+    return _SnapshotCache(CACHE_TTL_SECONDS, probe=_backend().version if CHANGE_DETECTION else None)
+
+
+@st.cache_resource
+def _mirror():
+    """
+    The process-wide SQLite mirror, or None when mirror mode is off.
+
+    On first use this starts a background thread that re-reads every tab in one
+    batched request each MIRROR_REFRESH_SECONDS, rewrites only the tables whose
+    contents changed, and drops those tabs from the snapshot cache so the next
+    fetch decodes the new rows from SQLite.
+    """
+    if not MIRROR_PATH:
+        return None
+    mirror = SheetMirror(MIRROR_PATH)
+    # Captured here so the refresher thread never calls Streamlit APIs itself
+    backend, cache, tabs = _backend(), _snapshot_cache(), list(_TAB_SPECS)
+    last_version = [None]
+
+    def fetch():
+        # With change detection, skip the read entirely while Drive reports no change
+        version = backend.version() if CHANGE_DETECTION else None
+        if version is not None and version == last_version[0]:
+            return {}
+        grids = backend.read_tabs(tabs)
+        last_version[0] = version
+        return grids
+
+    def on_change(changed):
+        for tab in changed:
+            for key in _cache_keys(tab):
+                cache.invalidate(key)
+
+    mirror.start_refresher(fetch, MIRROR_REFRESH_SECONDS, on_change)
+    return mirror
+
+
+def query_mirror(sql: str, params=()) -> list[dict]:
+    """
+    Run a read-only SQL query against the local mirror (mirror mode only).
+    Each tab is a table named after the tab with its header cells as columns.
+    """
+    mirror = _mirror()
+    if mirror is None:
+        raise RuntimeError("Mirror mode is off; set gsheets.mirror_path in secrets to enable it.")
+    return mirror.query(sql, params)
+
+
+def _invalidate(tab: str) -> None:
+    """Drop the cached snapshots for a tab (and its views) so the next fetch re-reads it."""
+    cache = _snapshot_cache()
+    for key in _cache_keys(tab):
+        cache.invalidate(key)
+
+
+@st.cache_resource
+def _header_indexes() -> dict:
+    """Process-wide {tab: {header name: 1-based column}}, filled on first use of a view."""
+    return {}
+
+
+def _header_index(tab: str, refresh: bool = False) -> dict:
+    """Header name -> sheet column for a tab, read once (one header-row request) and then reused."""
+    indexes = _header_indexes()
+    if refresh or tab not in indexes:
+        index = {}
+        for col, name in enumerate(_backend().read_header(tab), start=1):
+            index.setdefault(str(name), col)
+        indexes[tab] = index
+    return indexes[tab]
+
+
+class _RowDecoder:
+    """
+    Decodes raw sheet rows (lists of cells) into records by column position.
+
+    Each field is (record key, header name, convert, default): the cell under
+    that header, or `default` when the tab has no such column, passed through
+    convert — the same result as convert(row.get(header, default)) on a
+    get_all_records() dict. bind(header) resolves every field's column once per
+    header row, so decoding a row reads its cells by index and builds only the
+    record itself.
+
+    record_type: the records.py class each row becomes (Fellow, Event, ...).
+    derived: {record key: fn(record)} computed from the decoded columns.
+    required: record key that must be non-blank, otherwise the row is skipped.
+    """
+
+    def __init__(self, record_type: type, fields: list[tuple], derived: dict = None, required: str = None):
+        self.record_type = record_type
+        self.fields = fields
+        self.derived = derived or {}
+        self.required = required
+
+    def headers(self) -> list[str]:
+        """The sheet columns this decoder reads, in field order."""
+        return [header for _, header, _, _ in self.fields]
+
+    def only(self, keys: list[str]) -> "_RowDecoder":
+        """A decoder producing just these record keys (for column-projected views)."""
+        return _RowDecoder(
+            self.record_type,
+            [field for field in self.fields if field[0] in keys],
+            {key: fn for key, fn in self.derived.items() if key in keys},
+            self.required if self.required in keys else None,
+        )
+
+    def bind(self, header: list[str]):
+        """Resolve column positions against a header row; returns decode(cells) -> record or None."""
+        position = {str(name): i for i, name in enumerate(header)}   # last duplicate wins, like dict(zip())
+        plan = [(key, position.get(name), convert, default) for key, name, convert, default in self.fields]
+        derived = list(self.derived.items())
+        required = self.required
+        record_type = self.record_type
+
+        def decode(cells: list):
+            width = len(cells)
+            record = record_type.__new__(record_type)
+            for key, i, convert, default in plan:
+                setattr(record, key, convert(cells[i] if i is not None and i < width else default))
+            if required and not getattr(record, required).strip():
+                return None
+            for key, fn in derived:
+                setattr(record, key, fn(record))
+            return record
+
+        return decode
+
+
+def _field(key: str, header: str, convert=str, default=""):
+    """One _RowDecoder field: record key <- convert(cell under header)."""
+    return (key, header, convert, default)
+
+
+class _TabSpec:
+    """
+    How one tab is decoded: a row decoder, the display sort order, an optional
+    grouping field, an optional enrich(record, today) pass for fields that
+    depend on the current date, and the fields its search box matches
+    ({record key: weight}, see search.TokenIndex).
+    """
+
+    def __init__(self, decoder: _RowDecoder, sort_key=None, reverse: bool = False, group_by: str = None,
+                 enrich=None, search_fields: dict = None):
+        self.decoder = decoder
+        self.enrich = enrich
+        self.search_fields = search_fields
+        self.sort_key = sort_key
+        self.reverse = reverse
+        self.group_by = group_by      # record field to group on (e.g. "fellow_id"), or None
+
+
+class _TabSnapshot:
+    """
+    Decoded contents of one tab plus the indexes built from the same read.
+
+      header  — row 1 of the sheet
+      records — decoded records in display order (see _TabSpec)
+      row_of  — record ID -> 1-based sheet row number (replaces ws.find())
+      groups  — spec.group_by value -> that group's records, in display order
+
+    Writers keep a cached snapshot current through apply_update(s) / apply_append /
+    apply_delete, so the next mutation can address its row without a search.
+    The records list and row_of are replaced rather than mutated, so a session
+    that is iterating over them is unaffected by a concurrent patch. The one
+    exception is enrich(): it sets the spec's date-dependent fields (e.g. a
+    fellow's days_since_checkin) on the shared records in place, once a day
+    and after each patch, so a concurrent reader may briefly see a mix of old
+    and new values for those fields.
+
+    A snapshot of a view holds only some of the tab's columns; `columns` gives
+    the sheet column of each cell, so full-row writes can still be applied.
+    """
+
+    def __init__(self, spec: _TabSpec, grid: list[list], columns: list[int] = None):
+        self.spec = spec
+        self.columns = columns   # 1-based sheet column per cell, or None for the whole tab
+        self.header = [str(h) for h in grid[0]] if grid else []
+        self.revision = 0        # bumped on every reindex, so derived caches can tell it changed
+        self._decode = spec.decoder.bind(self.header)   # column positions resolved once per snapshot
+        self._cells: dict[int, list] = {}     # sheet row -> raw cell values, padded to the header
+        self._decoded: dict[int, dict] = {}   # sheet row -> decoded record (skipped rows omitted)
+        for row_num, cells in enumerate(grid[1:], start=2):
+            self._store(row_num, list(cells))
+        self._reindex()
+
+    def _store(self, row_num: int, cells: list) -> None:
+        if len(cells) < len(self.header):
+            cells = cells + [""] * (len(self.header) - len(cells))
+        self._cells[row_num] = cells
+        record = self._decode(cells)
+        if record is None:
+            self._decoded.pop(row_num, None)
+        else:
+            self._decoded[row_num] = record
+
+    def _reindex(self) -> None:
+        row_of = {}
+        for row_num, record in self.items():
+            if record["id"]:
+                row_of.setdefault(record["id"], row_num)   # first match wins, like ws.find()
+        records = [record for _, record in self.items()]
+        if self.spec.sort_key:
+            records.sort(key=self.spec.sort_key, reverse=self.spec.reverse)
+        groups = {}
+        if self.spec.group_by:
+            for record in records:   # already sorted, so every group is too
+                groups.setdefault(record[self.spec.group_by], []).append(record)
+        self.row_of = row_of
+        self.records = records
+        self.groups = groups
+        self._search_index = None   # rebuilt from the new records on the next search
+        self.revision += 1
+        self._enriched_on = None   # records changed: date-dependent fields need a refresh
+        self.checked_at = time.monotonic()   # row numbers just read or written (see _rows_hold)
+
+    def enrich(self, today: date) -> None:
+        """
+        Fill in the spec's date-dependent fields for `today`. Runs once per
+        snapshot per day (and again after a write-through patch), so pages read
+        plain fields instead of recomputing them on every rerun.
+        """
+        if self.spec.enrich is None or self._enriched_on == today:
+            return
+        for record in self.records:
+            self.spec.enrich(record, today)
+        self._enriched_on = today
+
+    def search(self, query: str) -> list:
+        """
+        Records matching `query` by word or word prefix in the spec's
+        search_fields, best match first. The index is built on the first
+        search after a load or patch and then reused by every session.
+        """
+        index = self._search_index
+        if index is None:
+            index = TokenIndex(self.records, self.spec.search_fields or {})
+            self._search_index = index
+        records = self.records
+        return [records[pos] for pos in index.search(query)]
+
+    def items(self) -> list[tuple[int, dict]]:
+        """(sheet row, record) pairs in sheet order."""
+        return sorted(self._decoded.items(), key=lambda item: item[0])
+
+    def record(self, record_id: str):
+        """The record with this ID, or None."""
+        return self._decoded.get(self.row_of.get(record_id))
+
+    def apply_update(self, row_num: int, first_col: int, values: list) -> None:
+        self.apply_updates([(row_num, first_col, values)])
+
+    def apply_updates(self, updates: list[tuple[int, int, list]]) -> None:
+        """Apply several (row, first column, values) cell updates, then reindex once."""
+        for row_num, first_col, values in updates:
+            cells = list(self._cells.get(row_num, []))
+            if self.columns is None:
+                end = first_col - 1 + len(values)
+                if len(cells) < end:
+                    cells += [""] * (end - len(cells))
+                cells[first_col - 1:end] = values
+            else:
+                cells += [""] * (len(self.columns) - len(cells))
+                for i, col in enumerate(self.columns):
+                    if first_col <= col < first_col + len(values):
+                        cells[i] = values[col - first_col]
+            self._store(row_num, cells)
+        self._reindex()
+
+    def apply_append(self, first_row: int, rows: list[list]) -> None:
+        for offset, cells in enumerate(rows):
+            if self.columns is not None:
+                cells = [cells[c - 1] if c - 1 < len(cells) else "" for c in self.columns]
+            self._store(first_row + offset, list(cells))
+        self._reindex()
+
+    def apply_delete(self, row_num: int) -> None:
+        # Rows below the deleted one move up by one, exactly as in the sheet
+        self._cells = {(r - 1 if r > row_num else r): c for r, c in self._cells.items() if r != row_num}
+        self._decoded = {(r - 1 if r > row_num else r): d for r, d in self._decoded.items() if r != row_num}
+        self._reindex()
+
+
+def _project_view(view, grid: list[list], sheet_columns: list[int]):
+    """
+    Cut a view's columns (matched by header name) out of a grid read from its
+    tab, whose cells sit in sheet_columns. Returns (grid, sheet column of each
+    kept cell).
+    """
+    position = {}
+    for i, name in enumerate(grid[0] if grid else []):
+        position.setdefault(str(name), i)
+    keep = [position[name] for name in view.columns if name in position]
+    projected = [[row[i] if i < len(row) else "" for i in keep] for row in grid]
+    return projected, [sheet_columns[i] for i in keep]
+
+
+def _read_grids(keys: list[str]) -> dict[str, tuple]:
+    """
+    Read tabs and views from the backend in one batched request. Whole tabs
+    are read in full; a view only asks for its own columns (unless its whole
+    tab is in the same batch). Returns {key: (grid, sheet columns or None)}.
+
+    Column positions come from the cached header index. If the header row that
+    comes back doesn't match it (columns moved in the sheet), the index is
+    re-read and the batch retried once.
+    """
+    views = {key: _VIEWS[key] for key in keys if key in _VIEWS}
+    tabs = {key for key in keys if key not in views}
+    for attempt in range(2):
+        full, columns, names = set(tabs), {}, {}
+        for view in views.values():
+            if view.tab in full:
+                continue
+            index = _header_index(view.tab, refresh=attempt > 0)
+            cols = {index[name] for name in view.columns if name in index}
+            if not cols:
+                full.add(view.tab)   # header not readable: fall back to the whole tab
+                columns.pop(view.tab, None)
+                continue
+            columns.setdefault(view.tab, set()).update(cols)
+            names[view.tab] = {col: name for name, col in index.items()}
+        columns = {tab: sorted(cols) for tab, cols in columns.items()}
+        grids = _backend().read_tabs(sorted(full | set(columns)), columns)
+        moved = [
+            tab for tab, cols in columns.items()
+            if [str(h) for h in (grids[tab][0] if grids[tab] else [])] != [names[tab][c] for c in cols]
+        ]
+        if not moved:
+            break
+    result = {tab: (grids[tab], None) for tab in tabs}
+    for key, view in views.items():
+        grid = grids[view.tab]
+        sheet_columns = columns.get(view.tab) or list(range(1, len(grid[0]) + 1 if grid else 1))
+        result[key] = _project_view(view, grid, sheet_columns)
+    return result
+
+
+def _load_tabs(keys: list[str]) -> dict[str, _TabSnapshot]:
+    """
+    Load and decode several tabs or views: from the SQLite mirror when mirror
+    mode is on (tabs not mirrored yet are fetched from the sheet and stored),
+    otherwise straight from the backend in one batched request.
+
+    Airtable equivalent: one GET per table (plus offset pages).
+    Here: one round-trip (values:batchGet) however many tabs are asked for.
+    """
+    mirror = _mirror()
+    if mirror is None:
+        loaded = _read_grids(keys)
+    else:
+        # The mirror holds whole tabs, so views are cut out of them locally
+        tabs = sorted({_VIEWS[key].tab if key in _VIEWS else key for key in keys})
+        grids = mirror.read_grids(tabs)
+        missing = [tab for tab in tabs if tab not in grids]
+        if missing:
+            fetched = _backend().read_tabs(missing)
+            mirror.sync(fetched)
+            grids.update(fetched)
+        loaded = {}
+        for key in keys:
+            if key in _VIEWS:
+                grid = grids[_VIEWS[key].tab]
+                loaded[key] = _project_view(_VIEWS[key], grid, list(range(1, len(grid[0]) + 1 if grid else 1)))
+            else:
+                loaded[key] = (grids[key], None)
+    snapshots = {key: _TabSnapshot(_spec(key), grid, columns) for key, (grid, columns) in loaded.items()}
+    if mirror is not None:
+        for snapshot in snapshots.values():
+            snapshot.checked_at = float("-inf")   # the replica may lag the sheet: confirm rows before writing
+    return snapshots
+
+
+def _snapshots(tabs: list[str], today: date = None) -> dict[str, _TabSnapshot]:
+    """
+    Return the shared snapshots for several tabs, reading all expired ones in
+    one request. Date-dependent derived fields are brought up to `today`
+    (default: the current date).
+    """
+    snapshots = _snapshot_cache().get_many(tabs, _load_tabs)
+    today = today or date.today()
+    for snapshot in snapshots.values():
+        snapshot.enrich(today)
+    return snapshots
+
+
+def _snapshot(tab: str) -> _TabSnapshot:
+    """Return the shared snapshot for a tab, reading the sheet if it has expired."""
+    return _snapshots([tab])[tab]
+
+
+def fetch_tabs(*tabs: str) -> dict[str, list[dict]]:
+    """
+    Fetch several tabs at once, e.g. fetch_tabs(FELLOWS_SHEET, EVENTS_SHEET, EVENT_ATTENDANCE_SHEET).
+
+    Returns {tab name: records}, each list in the same shape and order as the
+    matching fetch_* helper (fetch_fellows, fetch_events, ...). Tabs that are
+    not cached are read together in one batched request, so a page that needs
+    three tabs pays one round-trip instead of three; the fetch_* helpers called
+    afterwards are served from the cache.
+    Views (FELLOW_CARDS, ALUMNI_CARDS) can be mixed in; they are read with
+    only their own columns.
+    """
+    snapshots = _snapshots(list(tabs))
+    return {tab: list(snapshots[tab].records) for tab in tabs}
+
+
+def search_tab(tab: str, query: str) -> dict[str, int]:
+    """
+    Search a tab or view (FELLOW_CARDS, ALUMNI_CARDS, EVENTS_SHEET) for `query`.
+    Returns {record ID: rank} for the matching records (0 = best match), so
+    a page can keep its other filters and order by rank when it wants to.
+
+    Airtable equivalent: filterByFormula=SEARCH(...) per request.
+    Here: a word/prefix index built once per cached snapshot.
+    """
+    ranks = {}
+    for rank, record in enumerate(_snapshot(tab).search(query)):
+        ranks.setdefault(record["id"], rank)
+    return ranks
+
+
+def _reload(tab: str) -> None:
+    """Re-read a tab from the sheet (not the mirror) on the next fetch."""
+    mirror = _mirror()
+    if mirror is not None:
+        mirror.sync(_backend().read_tabs([tab]))
+    _invalidate(tab)
+
+
+def _rows_hold(tab: str, snapshot: _TabSnapshot, expected: dict[int, str]) -> bool:
+    """
+    True if column A of each sheet row in `expected` ({row: record ID}) still
+    holds that ID, so a cached row number that went stale (e.g. a row deleted
+    or moved by hand in the sheet) is never written to.
+
+    Costs one small read, skipped when the snapshot was loaded, patched or
+    confirmed within ROW_CHECK_SECONDS, so most writes pay only the write.
+    """
+    if not expected or time.monotonic() - snapshot.checked_at < ROW_CHECK_SECONDS:
+        return True
+    rows = list(expected)
+    if _backend().read_ids(tab, rows) != [expected[row_num] for row_num in rows]:
+        return False
+    snapshot.checked_at = time.monotonic()
+    return True
 
 
-def _worksheet(name: str) -> gspread.Worksheet:
-    """Return a worksheet by tab name. Opens the spreadsheet each call (gspread caches internally)."""
-    return _get_client().open_by_key(SPREADSHEET_ID).worksheet(name)
+def _row_number(tab: str, record_id: str):
+    """
+    Return the sheet row holding record_id, or None.
+
+    Looked up in the snapshot's ID index instead of ws.find(), then confirmed
+    against column A (_rows_hold) before the caller writes or deletes. If the
+    ID is missing from the index (e.g. a row pasted into the sheet by hand) or
+    its row now holds something else (rows deleted or moved in the sheet),
+    the tab is re-read and the row looked up again.
+    """
+    snapshot = _snapshot(tab)
+    row_num = snapshot.row_of.get(record_id)
+    if row_num is not None and _rows_hold(tab, snapshot, {row_num: record_id}):
+        return row_num
+    _reload(tab)
+    return _snapshot(tab).row_of.get(record_id)
+
+
+def _patch_update(tab: str, row_num: int, first_col: int, values: list) -> None:
+    """Write-through for an in-place cell update (first_col is 1-based)."""
+    _patch_updates(tab, [(row_num, first_col, values)])
+
+
+def _patch_updates(tab: str, updates: list[tuple[int, int, list]]) -> None:
+    """
+    Write-through for several (row, first column, values) cell updates from one
+    batch_update: one patch and one reindex per cached snapshot, one mirror transaction.
+    """
+    for key in _cache_keys(tab):
+        _snapshot_cache().patch(key, lambda snap: snap.apply_updates(updates))
+    mirror = _mirror()
+    if mirror is not None:
+        mirror.apply_updates(tab, updates)
+
+
+def _patch_append(tab: str, first_row, rows: list[list]) -> None:
+    """
+    Write-through for an append. first_row is the sheet row of the first new
+    row as reported by the backend, or None if it could not tell.
+    """
+    mirror = _mirror()
+    if first_row is None:
+        _invalidate(tab)
+        if mirror is not None:
+            # Row numbers unknown: drop the mirrored copy so it is re-fetched
+            mirror.sync(_backend().read_tabs([tab]))
+        return
+    for key in _cache_keys(tab):
+        _snapshot_cache().patch(key, lambda snap: snap.apply_append(first_row, rows))
+    if mirror is not None:
+        mirror.apply_append(tab, first_row, rows)
+
+
+def _patch_delete(tab: str, row_num: int) -> None:
+    """Write-through for a single-row delete."""
+    for key in _cache_keys(tab):
+        _snapshot_cache().patch(key, lambda snap: snap.apply_delete(row_num))
+    mirror = _mirror()
+    if mirror is not None:
+        mirror.apply_delete(tab, row_num)
 
 
 def _to_bool(val) -> bool:
@@ -117,42 +870,112 @@ def _new_id() -> str:
 
 # ============ FELLOWS CRUD ============
 
-def fetch_fellows() -> list[dict]:
+def fetch_fellows(view: str = None) -> list[dict]:
     """
     Fetch all fellows from the Fellows sheet.
 
     Airtable equivalent: GET https://api.airtable.com/v0/{base}/{table}
-    Here: ws.get_all_records() returns a list of dicts keyed by header row values.
+    Here: served from the shared snapshot cache; the sheet is only read when
+    the cached snapshot has expired or was invalidated.
+
+    view="card" returns the card-grid projection (FELLOW_CARDS): only the
+    columns the cards, stats and filters use are read, and the long text
+    fields (notes, education, prior role, contact details) are left out —
+    use fetch_fellow(id) for the full record.
+
+    The returned list is a fresh list, but the dicts inside are shared across
+    sessions — copy one (dict(fellow)) before modifying it.
     """
-    ws = _worksheet(FELLOWS_SHEET)
-    rows = ws.get_all_records()
-    fellows = []
-    for row in rows:
-        fellows.append({
-            "id":                      str(row.get("ID", "")),
-            "name":                    str(row.get("Name", "")),
-            "email":                   str(row.get("Email", "")),
-            "congressional_email":     str(row.get("Congressional Email", "")),
-            "phone":                   str(row.get("Phone Number", "")),
-            "fellow_type":             str(row.get("Fellow Type", "")),
-            "party":                   str(row.get("Party", "")),
-            "office":                  str(row.get("Office", "")),
-            "chamber":                 str(row.get("Chamber", "")),
-            "linkedin":                str(row.get("LinkedIn", "")),
-            "start_date":              str(row.get("Start Date", "")),
-            "end_date":                str(row.get("End Date", "")),
-            "cohort":                  str(row.get("Cohort", "")),
-            "status":                  str(row.get("Status", "Active")),
-            "last_check_in":           str(row.get("Last Check-in", "")),
-            "prior_role":              str(row.get("Prior Role", "")),
-            "education":               str(row.get("Education", "")),
-            "notes":                   str(row.get("Notes", "")),
-            "requires_monthly_reports": _to_bool(row.get("Requires Monthly Reports", False)),
-            "report_start_date":       str(row.get("Report Start Date", "")),
-            "report_end_month":        str(row.get("Report End Month", "")),
-            "supervisor_email":        str(row.get("Supervisor's Email", "")),
-        })
-    return fellows
+    return list(_snapshot(_view_key(FELLOWS_SHEET, view)).records)
+
+
+def fetch_fellow(fellow_id: str):
+    """
+    Fetch one fellow with every field (for the detail modal and edit form), or None.
+
+    Airtable equivalent: GET https://api.airtable.com/v0/{base}/{table}/{record_id}
+    Here: looked up in the full Fellows snapshot, which is read on first use.
+    """
+    return _snapshot(FELLOWS_SHEET).record(fellow_id)
+
+
+# Fellows row decoder (see _RowDecoder)
+_FELLOW_DECODER = _RowDecoder(
+    Fellow,
+    [
+        _field("id",                       "ID"),
+        _field("name",                     "Name"),
+        _field("email",                    "Email"),
+        _field("congressional_email",      "Congressional Email"),
+        _field("phone",                    "Phone Number"),
+        _field("fellow_type",              "Fellow Type", intern_str),
+        _field("party",                    "Party", intern_str),
+        _field("office",                   "Office"),
+        _field("chamber",                  "Chamber", intern_str),
+        _field("linkedin",                 "LinkedIn"),
+        _field("start_date",               "Start Date"),
+        _field("end_date",                 "End Date"),
+        _field("cohort",                   "Cohort", intern_str),
+        _field("status",                   "Status", intern_str, "Active"),
+        _field("last_check_in",            "Last Check-in"),
+        _field("prior_role",               "Prior Role"),
+        _field("education",                "Education"),
+        _field("notes",                    "Notes"),
+        _field("requires_monthly_reports", "Requires Monthly Reports", _to_bool, False),
+        _field("report_start_date",        "Report Start Date"),
+        _field("report_end_month",         "Report End Month", intern_str),
+        _field("supervisor_email",         "Supervisor's Email"),
+    ],
+    derived={
+        "start_date_dt":        lambda r: _parse_date(r["start_date"]),
+        "end_date_dt":          lambda r: _parse_date(r["end_date"]),
+        "last_check_in_dt":     lambda r: _parse_date(r["last_check_in"]),
+        "report_start_date_dt": lambda r: _parse_date(r["report_start_date"]),
+        "cohort_key":           lambda r: parse_cohort(r["cohort"]),
+        "is_aisf":              lambda r: "AI Security" in r["fellow_type"],
+        "type_label":           lambda r: _fellow_type_label(r["fellow_type"]),
+        # Must attend quarterly events: CIF/SCIF (not AISF) in a tracked cohort
+        "attendance_tracked":   lambda r: not r["is_aisf"] and _is_tracked_key(r["cohort_key"]),
+    },
+)
+
+# A fellow is due a check-in after this many days without one (~7 months)
+CHECKIN_OVERDUE_DAYS = 210
+
+
+def _fellow_type_label(fellow_type: str) -> str:
+    """Short badge/chart label for a Fellow Type: "Senior CIF", "AISF", "CIF", or "" if blank."""
+    if not fellow_type:
+        return ""
+    if "Senior" in fellow_type:
+        return "Senior CIF"
+    if "AI Security" in fellow_type:
+        return "AISF"
+    return "CIF"
+
+
+def _enrich_fellow(fellow: Fellow, today: date) -> None:
+    """
+    Attach the date-dependent fields every page shows for a fellow, as of `today`:
+
+      days_since_checkin — days since Last Check-in (999 if never)
+      needs_checkin      — active, not AISF, and no check-in for CHECKIN_OVERDUE_DAYS
+      days_until_end     — days until End Date (negative once past), or None
+
+    Fields the record wasn't decoded with (column-projected views) are left unset.
+    """
+    if "last_check_in_dt" in fellow:
+        last = fellow.last_check_in_dt
+        fellow.days_since_checkin = (today - last.date()).days if last else 999
+        if "status" in fellow and "is_aisf" in fellow:
+            fellow.needs_checkin = (
+                fellow.days_since_checkin > CHECKIN_OVERDUE_DAYS
+                and fellow.status in ("on-track", "Active")
+                and not fellow.is_aisf
+            )
+    if "end_date_dt" in fellow:
+        end = fellow.end_date_dt
+        fellow.days_until_end = (end.date() - today).days if end else None
 
 
 def _fellow_row_values(fellow_id: str, data: dict) -> list:
@@ -191,12 +1014,12 @@ def create_fellow(fellow_data: dict) -> bool:
     Append a new fellow row to the Fellows sheet.
 
     Airtable equivalent: POST https://api.airtable.com/v0/{base}/{table}
-    Here: ws.append_row() — we generate the ID ourselves.
+    Here: append one row through the backend — we generate the ID ourselves.
     """
     try:
-        ws = _worksheet(FELLOWS_SHEET)
-        fellow_id = _new_id()
-        ws.append_row(_fellow_row_values(fellow_id, fellow_data), value_input_option="USER_ENTERED")
+        values = _fellow_row_values(_new_id(), fellow_data)
+        first_row = _backend().append_rows(FELLOWS_SHEET, [values])
+        _patch_append(FELLOWS_SHEET, first_row, [values])
         return True
     except Exception as e:
         st.error(f"Failed to create fellow: {e}")
@@ -208,20 +1031,20 @@ def update_fellow(record_id: str, fellow_data: dict) -> bool:
     Update an existing fellow row by ID.
 
     Airtable equivalent: PATCH https://api.airtable.com/v0/{base}/{table}/{record_id}
-    Here: find the row by searching column A (ID), then overwrite the entire row.
-
-    Note: gspread.find() does a full sheet scan — fine for small datasets.
-    For large datasets, consider caching row indices locally.
+    Here: look the row up in the cached ID index, then overwrite the entire row
+    in a single write request.
     """
     try:
-        ws = _worksheet(FELLOWS_SHEET)
-        cell = ws.find(record_id, in_column=1)
-        if not cell:
+        row_num = _row_number(FELLOWS_SHEET, record_id)
+        if not row_num:
             st.error(f"Fellow {record_id} not found.")
             return False
-        row_num = cell.row
-        # Build the range string, e.g. "A5:T5" for 20 columns
-        ws.update(f"A{row_num}:V{row_num}", [_fellow_row_values(record_id, fellow_data)], value_input_option="USER_ENTERED")
+        values = _fellow_row_values(record_id, fellow_data)
+        mark = _notes_mark(FELLOWS_SHEET)
+        # Build the range string, e.g. "A5:V5" for 22 columns
+        _backend().batch_update(FELLOWS_SHEET, [{"range": f"A{row_num}:V{row_num}", "values": [values]}])
+        _patch_update(FELLOWS_SHEET, row_num, 1, values)
+        _apply_notes(FELLOWS_SHEET, mark, record_id)
         return True
     except Exception as e:
         st.error(f"Failed to update fellow: {e}")
@@ -233,15 +1056,15 @@ def update_fellow_checkin(record_id: str, checkin_date: str) -> bool:
     Update only the 'Last Check-in' field for a fellow.
 
     Airtable equivalent: PATCH with just {"Last Check-in": date}
-    Here: find the row, then update just column O (index 15, 1-based = column O).
+    Here: look up the row in the ID index, then update just column P.
     """
     try:
-        ws = _worksheet(FELLOWS_SHEET)
-        cell = ws.find(record_id, in_column=1)
-        if not cell:
+        row_num = _row_number(FELLOWS_SHEET, record_id)
+        if not row_num:
             return False
         # "Last Check-in" is column P (16) after Congressional Email was added at D
-        ws.update_cell(cell.row, 16, checkin_date)
+        _backend().batch_update(FELLOWS_SHEET, [{"range": f"P{row_num}", "values": [[checkin_date]]}])
+        _patch_update(FELLOWS_SHEET, row_num, 16, [checkin_date])
         return True
     except Exception as e:
         st.error(f"Failed to update Last Check-in: {e}")
@@ -257,26 +1080,30 @@ def fetch_checkins(fellow_id: str) -> list[dict]:
     Airtable equivalent: GET check-ins table filtered by linked Fellow record ID.
     Here: get all rows, filter by Fellow ID column (plain UUID string match).
 
-    Note: We fetch ALL check-ins and filter client-side. For large datasets,
-    Airtable's server-side filtering would be more efficient. With Google Sheets,
-    consider a separate sheet per fellow or a database if scale becomes an issue.
+    Note: The whole tab is read at most once per cache TTL (shared by every
+    fellow and session) and grouped by Fellow ID, so this is a dict lookup.
+    add_checkin / delete_checkin keep the groups current without a reload.
     """
-    ws = _worksheet(CHECKINS_SHEET)
-    rows = ws.get_all_records()
-    checkins = []
-    for row in rows:
-        if str(row.get("Fellow ID", "")) == fellow_id:
-            checkins.append({
-                "id":             str(row.get("ID", "")),
-                "fellow":         [fellow_id],   # match Airtable structure: list of IDs
-                "date":           str(row.get("Date", "")),
-                "check_in_type":  str(row.get("Check-in Type", "")),
-                "notes":          str(row.get("Notes", "")),
-                "staff_member":   str(row.get("Staff Member", "")),
-            })
-    # Sort by date descending (most recent first)
-    checkins.sort(key=lambda x: x["date"], reverse=True)
-    return checkins
+    # Each group is already sorted by date descending (most recent first)
+    return list(_snapshot(CHECKINS_SHEET).groups.get(fellow_id, ()))
+
+
+# Check-ins row decoder; "fellow" matches the Airtable structure (list of linked IDs)
+_CHECKIN_DECODER = _RowDecoder(
+    CheckIn,
+    [
+        _field("id",            "ID"),
+        _field("fellow_id",     "Fellow ID"),
+        _field("date",          "Date"),
+        _field("check_in_type", "Check-in Type", intern_str),
+        _field("notes",         "Notes"),
+        _field("staff_member",  "Staff Member", intern_str),
+    ],
+    derived={
+        "fellow":  lambda r: [r["fellow_id"]],
+        "date_dt": lambda r: _parse_date(r["date"]),
+    },
+)
 
 
 def add_checkin(checkin_data: dict) -> bool:
@@ -284,19 +1111,22 @@ def add_checkin(checkin_data: dict) -> bool:
     Append a new check-in row.
 
     Airtable equivalent: POST to Check-ins table with Fellow linked record.
-    Here: append_row with Fellow ID stored as a plain UUID string.
+    Here: append a row with Fellow ID stored as a plain UUID string.
     """
     try:
-        ws = _worksheet(CHECKINS_SHEET)
         checkin_id = _new_id()
-        ws.append_row([
+        values = [
             checkin_id,
             checkin_data.get("fellow_id", ""),
             checkin_data.get("date", ""),
             checkin_data.get("check_in_type", ""),
             checkin_data.get("notes", ""),
             checkin_data.get("staff_member", ""),
-        ], value_input_option="USER_ENTERED")
+        ]
+        mark = _notes_mark(CHECKINS_SHEET)
+        first_row = _backend().append_rows(CHECKINS_SHEET, [values])
+        _patch_append(CHECKINS_SHEET, first_row, [values])
+        _apply_notes(CHECKINS_SHEET, mark, checkin_id)
         return True
     except Exception as e:
         st.error(f"Failed to add check-in: {e}")
@@ -308,17 +1138,16 @@ def delete_checkin(record_id: str) -> bool:
     Delete a check-in row by ID.
 
     Airtable equivalent: DELETE https://api.airtable.com/v0/{base}/Check-ins/{id}
-    Here: find the row by ID, delete it with ws.delete_rows().
-
-    Note: Airtable deletion is by record ID in the URL. Here we scan column A.
+    Here: look the row up in the ID index, then delete that row.
+    The cached snapshot shifts the rows below it up, matching the sheet.
     """
     try:
-        ws = _worksheet(CHECKINS_SHEET)
-        cell = ws.find(record_id, in_column=1)
-        if not cell:
+        row_num = _row_number(CHECKINS_SHEET, record_id)
+        if not row_num:
             st.error("Check-in not found.")
             return False
-        ws.delete_rows(cell.row)
+        _backend().delete_row(CHECKINS_SHEET, row_num)
+        _patch_delete(CHECKINS_SHEET, row_num)
         return True
     except Exception as e:
         st.error(f"Failed to delete check-in: {e}")
@@ -332,30 +1161,35 @@ def fetch_status_reports(fellow_id: str) -> list[dict]:
     Fetch all status reports for a specific fellow, sorted by month ascending.
 
     Airtable equivalent: GET Status Reports filtered by linked Fellow.
-    Here: get all rows, filter client-side by Fellow ID column.
+    Here: a lookup in the cached Status Reports snapshot, grouped by Fellow ID.
     """
-    ws = _worksheet(REPORTS_SHEET)
-    rows = ws.get_all_records()
-    reports = []
-    for row in rows:
-        if str(row.get("Fellow ID", "")) == fellow_id:
-            reports.append({
-                "id":             str(row.get("ID", "")),
-                "fellow":         [fellow_id],   # match Airtable structure
-                "month":          str(row.get("Month", "")),
-                "submitted":      _to_bool(row.get("Submitted", False)),
-                "date_submitted": str(row.get("Date Submitted", "")),
-                "notes":          str(row.get("Notes", "")),
-                "late":           _to_bool(row.get("Late", False)),
-            })
-    # Sort by month ascending
-    def _month_sort_key(r):
-        try:
-            return datetime.strptime(r["month"], "%b %Y")
-        except Exception:
-            return datetime.min
-    reports.sort(key=_month_sort_key)
-    return reports
+    # Each group is already sorted by month ascending
+    return list(_snapshot(REPORTS_SHEET).groups.get(fellow_id, ()))
+
+
+# Status Reports row decoder; "fellow" matches the Airtable structure
+_STATUS_REPORT_DECODER = _RowDecoder(
+    StatusReport,
+    [
+        _field("id",             "ID"),
+        _field("fellow_id",      "Fellow ID"),
+        _field("month",          "Month", intern_str),
+        _field("submitted",      "Submitted", _to_bool, False),
+        _field("date_submitted", "Date Submitted"),
+        _field("notes",          "Notes"),
+        _field("late",           "Late", _to_bool, False),
+    ],
+    derived={
+        "fellow":            lambda r: [r["fellow_id"]],
+        "date_submitted_dt": lambda r: _parse_date(r["date_submitted"]),
+    },
+)
+
+
+def _report_month_key(report: dict) -> int:
+    """Sort key for status reports: the "Mon YYYY" month label as a month ordinal (unparseable first)."""
+    ordinal = parse_month_label(report["month"])
+    return -1 if ordinal is None else ordinal
 
 
 def add_status_report(report_data: dict) -> bool:
@@ -365,9 +1199,8 @@ def add_status_report(report_data: dict) -> bool:
     Airtable equivalent: POST to Status Reports table with Fellow linked record.
     """
     try:
-        ws = _worksheet(REPORTS_SHEET)
         report_id = _new_id()
-        ws.append_row([
+        values = [
             report_id,                                                    # A
             report_data.get("fellow_id", ""),                             # B
             report_data.get("fellow_name", ""),                           # C
@@ -376,7 +1209,9 @@ def add_status_report(report_data: dict) -> bool:
             report_data.get("date_submitted", ""),                        # F
             report_data.get("notes", ""),                                 # G
             "TRUE" if report_data.get("late", False) else "FALSE",        # H
-        ], value_input_option="USER_ENTERED")
+        ]
+        first_row = _backend().append_rows(REPORTS_SHEET, [values])
+        _patch_append(REPORTS_SHEET, first_row, [values])
         return True
     except Exception as e:
         st.error(f"Failed to add status report: {e}")
@@ -389,18 +1224,26 @@ def update_status_report(record_id: str, submitted: bool, date_submitted: str =
 
     Sheet columns: A=ID, B=Fellow ID, C=Fellow Name, D=Month,
                    E=Submitted, F=Date Submitted, G=Notes, H=Late
+
+    All changed cells are sent in one batch_update request.
     """
     try:
-        ws = _worksheet(REPORTS_SHEET)
-        cell = ws.find(record_id, in_column=1)
-        if not cell:
+        row_num = _row_number(REPORTS_SHEET, record_id)
+        if not row_num:
             st.error("Status report not found.")
             return False
-        ws.update_cell(cell.row, 5, "TRUE" if submitted else "FALSE")   # E: Submitted
+        cells = {5: "TRUE" if submitted else "FALSE"}                   # E: Submitted
         if date_submitted:
-            ws.update_cell(cell.row, 6, date_submitted)                  # F: Date Submitted
+            cells[6] = date_submitted                                    # F: Date Submitted
         if late is not None:
-            ws.update_cell(cell.row, 8, "TRUE" if late else "FALSE")     # H: Late
+            cells[8] = "TRUE" if late else "FALSE"                       # H: Late
+        _backend().batch_update(
+            REPORTS_SHEET,
+            [{"range": gspread.utils.rowcol_to_a1(row_num, col), "values": [[value]]}
+             for col, value in cells.items()],
+        )
+        for col, value in cells.items():
+            _patch_update(REPORTS_SHEET, row_num, col, [value])
         return True
     except Exception as e:
         st.error(f"Failed to update status report: {e}")
@@ -409,46 +1252,80 @@ def update_status_report(record_id: str, submitted: bool, date_submitted: str =
 
 # ============ ALUMNI CRUD ============
 
-def fetch_alumni() -> list[dict]:
+def fetch_alumni(view: str = None) -> list[dict]:
     """
     Fetch all alumni from the Alumni sheet.
 
     Airtable equivalent: GET Alumni table with pagination (offset loop).
-    Here: ws.get_all_records() returns everything in one call — no pagination needed.
+    Here: served from the shared snapshot cache (see fetch_fellows); the whole
+    tab comes back in one read — no pagination needed. view="card" returns the
+    ALUMNI_CARDS projection without the long text fields.
+    """
+    return list(_snapshot(_view_key(ALUMNI_SHEET, view)).records)
+
 
+def fetch_alumnus(alumni_id: str):
+    """Fetch one alumni record with every field, or None (see fetch_fellow)."""
+    return _snapshot(ALUMNI_SHEET).record(alumni_id)
+
+
+def alumni_type_label(fellow_type: str) -> str:
+    """
+    Short chart label for one of an alum's Fellow Types. Alumni span programs
+    current fellows don't (see _fellow_type_label): "Senior CIF", "AISF",
+    "CIS" (Congressional Innovation Scholar), "CDSF" (Congressional Digital
+    Service Fellow), else "CIF".
+    """
+    if "Senior" in fellow_type:
+        return "Senior CIF"
+    if "AI Security" in fellow_type:
+        return "AISF"
+    if "Scholar" in fellow_type:
+        return "CIS"
+    if "Digital Service" in fellow_type:
+        return "CDSF"
+    return "CIF"
+
+
+def _split_list(val) -> list[str]:
+    """
     Multi-select Fellow Type is stored as a comma-separated string in Sheets
     ("CIF,Senior CIF") vs. Airtable's native array (["CIF", "Senior CIF"]).
-    We parse it back into a list here so the rest of the app is unaffected.
+    We parse it back into a list so the rest of the app is unaffected.
     """
-    ws = _worksheet(ALUMNI_SHEET)
-    rows = ws.get_all_records()
-    alumni = []
-    for row in rows:
-        raw_fellow_types = str(row.get("Fellow Type", ""))
-        fellow_types = [t.strip() for t in raw_fellow_types.split(",") if t.strip()] if raw_fellow_types else []
-        alumni.append({
-            "id":               str(row.get("ID", "")),
-            "name":             str(row.get("Name", "")),
-            "email":            str(row.get("Email", "")),
-            "phone":            str(row.get("Phone Number", "")),
-            "cohort":           str(row.get("Cohort", "")),
-            "fellow_types":     fellow_types,   # list, parsed from comma-separated string
-            "office_served":    str(row.get("Office Served", "")),
-            "chamber":          str(row.get("Chamber", "")),
-            "party":            str(row.get("Party", "")),
-            "current_role":     str(row.get("Current Role", "")),
-            "sector":           str(row.get("Sector", "")),
-            "location":         str(row.get("Location", "")),
-            "contact":          _to_bool(row.get("Contact?", True)),
-            "linkedin":         str(row.get("LinkedIn", "")),
-            "last_engaged":     str(row.get("Last Engaged", "")),
-            "engagement_notes": str(row.get("Engagement Notes", "")),
-            "notes":            str(row.get("Notes", "")),
-            "prior_role":       str(row.get("Prior Role", "")),
-            "education":        str(row.get("Education", "")),
-            "currently_on_hill": _to_bool(row.get("Currently on the Hill?", False)),
-        })
-    return alumni
+    return [intern_str(t.strip()) for t in str(val).split(",") if t.strip()]
+
+
+# Alumni row decoder (see _RowDecoder)
+_ALUMNI_DECODER = _RowDecoder(
+    Alumni,
+    [
+        _field("id",                "ID"),
+        _field("name",              "Name"),
+        _field("email",             "Email"),
+        _field("phone",             "Phone Number"),
+        _field("cohort",            "Cohort", intern_str),
+        _field("fellow_types",      "Fellow Type", _split_list),   # list, parsed from comma-separated string
+        _field("office_served",     "Office Served"),
+        _field("chamber",           "Chamber", intern_str),
+        _field("party",             "Party", intern_str),
+        _field("current_role",      "Current Role"),
+        _field("sector",            "Sector", intern_str),
+        _field("location",          "Location", intern_str),
+        _field("contact",           "Contact?", _to_bool, True),
+        _field("linkedin",          "LinkedIn"),
+        _field("last_engaged",      "Last Engaged"),
+        _field("engagement_notes",  "Engagement Notes"),
+        _field("notes",             "Notes"),
+        _field("prior_role",        "Prior Role"),
+        _field("education",         "Education"),
+        _field("currently_on_hill", "Currently on the Hill?", _to_bool, False),
+    ],
+    derived={
+        "last_engaged_dt": lambda r: _parse_date(r["last_engaged"]),
+        "cohort_key":      lambda r: parse_cohort(r["cohort"]),
+    },
+)
 
 
 def _alumni_row_values(alumni_id: str, data: dict) -> list:
@@ -491,9 +1368,9 @@ def create_alumni(alumni_data: dict) -> bool:
     Airtable equivalent: POST to Alumni table.
     """
     try:
-        ws = _worksheet(ALUMNI_SHEET)
-        alumni_id = _new_id()
-        ws.append_row(_alumni_row_values(alumni_id, alumni_data), value_input_option="USER_ENTERED")
+        values = _alumni_row_values(_new_id(), alumni_data)
+        first_row = _backend().append_rows(ALUMNI_SHEET, [values])
+        _patch_append(ALUMNI_SHEET, first_row, [values])
         return True
     except Exception as e:
         st.error(f"Failed to create alumni record: {e}")
@@ -505,15 +1382,18 @@ def update_alumni(record_id: str, alumni_data: dict) -> bool:
     Update an existing alumni row by ID.
 
     Airtable equivalent: PATCH to Alumni table.
-    Here: find the row by ID, overwrite the entire row (20 columns = A:T).
+    Here: look the row up in the ID index, overwrite the entire row (20 columns = A:T).
     """
     try:
-        ws = _worksheet(ALUMNI_SHEET)
-        cell = ws.find(record_id, in_column=1)
-        if not cell:
+        row_num = _row_number(ALUMNI_SHEET, record_id)
+        if not row_num:
             st.error(f"Alumni {record_id} not found.")
             return False
-        ws.update(f"A{cell.row}:T{cell.row}", [_alumni_row_values(record_id, alumni_data)], value_input_option="USER_ENTERED")
+        values = _alumni_row_values(record_id, alumni_data)
+        mark = _notes_mark(ALUMNI_SHEET)
+        _backend().batch_update(ALUMNI_SHEET, [{"range": f"A{row_num}:T{row_num}", "values": [values]}])
+        _patch_update(ALUMNI_SHEET, row_num, 1, values)
+        _apply_notes(ALUMNI_SHEET, mark, record_id)
         return True
     except Exception as e:
         st.error(f"Failed to update alumni record: {e}")
@@ -524,14 +1404,28 @@ def update_alumni(record_id: str, alumni_data: dict) -> bool:
 # These functions are pure Python and identical to the Airtable version —
 # they operate on data already fetched from the backend.
 
+# Bounded memo for string -> datetime parsing. Records already carry parsed
+# "<field>_dt" values; this covers everything else (form defaults, quarter
+# labels, ad-hoc strings), where the same few hundred dates recur on every rerun.
+DATE_PARSE_CACHE_SIZE = 4096
+
+
 def _parse_date(date_str: str):
     """
     Try multiple date formats that Google Sheets may return.
     Airtable always returned YYYY-MM-DD; Google Sheets formatting
     depends on the cell's locale/format setting.
+
+    Results are memoized (see DATE_PARSE_CACHE_SIZE); datetimes are immutable,
+    so sharing them is safe.
     """
     if not date_str:
         return None
+    return _parse_date_cached(str(date_str).strip())
+
+
+@functools.lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def _parse_date_cached(date_str: str):
     for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%-m/%-d/%Y", "%m/%d/%y", "%-m/%-d/%y"):
         try:
             return datetime.strptime(date_str, fmt)
@@ -539,45 +1433,118 @@ def _parse_date(date_str: str):
             continue
     return None
 
+
+def parse_date_value(date_str):
+    """
+    Parse a date string from Google Sheets into a Python date object (for
+    st.date_input defaults and date comparisons in the pages).
+    Returns None if the string is empty or unparseable.
+    """
+    parsed = _parse_date(date_str)
+    return parsed.date() if parsed else None
+
+
+def calculate_days_since(date_str) -> int:
+    """
+    Return the number of days since a given date. Handles multiple date formats,
+    or takes an already-parsed datetime (e.g. fellow["last_check_in_dt"]).
+    """
+    date = date_str if isinstance(date_str, datetime) else _parse_date(date_str)
+    if not date:
+        return 999
+    return (datetime.now() - date).days
+
+
+def calculate_days_until(date_str) -> int:
+    """Return the number of days until a given date (string or parsed datetime)."""
+    date = date_str if isinstance(date_str, datetime) else _parse_date(date_str)
+    if not date:
+        return 999
+    return (date - datetime.now()).days
+
+
+# ============ REPORTING CALENDAR ============
+# Months are integer ordinals (year * 12 + month - 1), so month ranges and
+# "has this month ended" checks are integer arithmetic. Label <-> ordinal
+# conversions and month sequences are memoized, and any start/end range works
+# (multi-year programs, future cohorts).
+
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Last report month when a fellow has no Report End Month set
+DEFAULT_REPORT_END_MONTH        = "Sep 2026"
+DEFAULT_SENIOR_REPORT_END_MONTH = "Nov 2026"
+
+
+def month_ordinal(year: int, month: int) -> int:
+    """(2026, 2) -> ordinal; consecutive months differ by 1."""
+    return year * 12 + month - 1
+
+
+def month_label(ordinal: int) -> str:
+    """Ordinal -> "Feb 2026" (the label format used in the Status Reports tab)."""
+    return f"{_MONTH_ABBRS[ordinal % 12]} {ordinal // 12}"
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_month_label(label: str):
+    """"Feb 2026" or "February 2026" -> ordinal, or None if it isn't a month label."""
+    for fmt in ("%b %Y", "%B %Y"):
+        try:
+            parsed = datetime.strptime(str(label).strip(), fmt)
+        except ValueError:
+            continue
+        return month_ordinal(parsed.year, parsed.month)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def month_sequence(start: int, end: int) -> tuple[str, ...]:
+    """Labels of every month from start to end ordinal, inclusive (empty if end < start)."""
+    return tuple(month_label(o) for o in range(start, end + 1))
+
+
+def month_last_day(ordinal: int) -> datetime:
+    """Midnight at the start of the month's last day (when a report for it falls due)."""
+    year, month = divmod(ordinal, 12)
+    return datetime(year, month + 1, calendar.monthrange(year, month + 1)[1])
+
+
+def closed_month_cutoff(today) -> int:
+    """
+    Ordinal of the first month that hasn't ended as of `today`: months below it
+    are past. A month counts as past once its last day has begun, matching
+    the "last_day < today" check used for overdue reports.
+    """
+    if not isinstance(today, datetime):
+        today = datetime(today.year, today.month, today.day)
+    current = month_ordinal(today.year, today.month)
+    return current + 1 if month_last_day(current) < today else current
+
+
 def get_required_report_months(fellow: dict) -> list[str]:
     """Calculate which months a fellow needs to submit reports for."""
     if not fellow.get("requires_monthly_reports") or not fellow.get("report_start_date"):
         return []
-    start_date = _parse_date(fellow["report_start_date"])
+    start_date = fellow.get("report_start_date_dt") or _parse_date(fellow["report_start_date"])
     if not start_date:
         return []
 
     if fellow.get("report_end_month"):
         end_month_str = fellow["report_end_month"]
+    elif "Senior" in (fellow.get("fellow_type") or ""):
+        end_month_str = DEFAULT_SENIOR_REPORT_END_MONTH
     else:
-        if "Senior" in (fellow.get("fellow_type") or ""):
-            end_month_str = "Nov 2026"
-        else:
-            end_month_str = "Sep 2026"
+        end_month_str = DEFAULT_REPORT_END_MONTH
 
-    month_map = {
-        "Feb 2026": (2026, 2), "Mar 2026": (2026, 3), "Apr 2026": (2026, 4),
-        "May 2026": (2026, 5), "Jun 2026": (2026, 6), "Jul 2026": (2026, 7),
-        "Aug 2026": (2026, 8), "Sep 2026": (2026, 9), "Oct 2026": (2026, 10),
-        "Nov 2026": (2026, 11), "Dec 2026": (2026, 12),
-    }
-    if end_month_str not in month_map:
+    end = parse_month_label(end_month_str)
+    if end is None:
         return []
-
-    end_year, end_month = month_map[end_month_str]
-    required_months = []
-    cur_year, cur_month = start_date.year, start_date.month
-    while (cur_year < end_year) or (cur_year == end_year and cur_month <= end_month):
-        required_months.append(datetime(cur_year, cur_month, 1).strftime("%b %Y"))
-        cur_month += 1
-        if cur_month > 12:
-            cur_month = 1
-            cur_year += 1
-    return required_months
+    return list(month_sequence(month_ordinal(start_date.year, start_date.month), end))
 
 
-def calculate_report_streak(reports: list[dict], required_months: list[str]) -> dict:
-    """Calculate current submission streak and incentive status."""
+def calculate_report_streak(reports: list[dict], required_months: list[str], today: datetime = None) -> dict:
+    """Calculate current submission streak and incentive status (as of today, default now)."""
     if not required_months:
         return {
             "streak": 0,
@@ -589,20 +1556,13 @@ def calculate_report_streak(reports: list[dict], required_months: list[str]) ->
 
     # Only on-time submissions count toward streaks; late ones are excluded
     submitted_months = {r["month"] for r in reports if r.get("submitted") and not r.get("late")}
-    today = datetime.now()
+    cutoff = closed_month_cutoff(today or datetime.now())
 
     past_months = []
     for month in required_months:
-        try:
-            month_date = datetime.strptime(month, "%b %Y")
-            if month_date.month == 12:
-                last_day = datetime(month_date.year + 1, 1, 1) - timedelta(days=1)
-            else:
-                last_day = datetime(month_date.year, month_date.month + 1, 1) - timedelta(days=1)
-            if last_day < today:
-                past_months.append(month)
-        except Exception:
-            continue
+        ordinal = parse_month_label(month)
+        if ordinal is not None and ordinal < cutoff:
+            past_months.append(month)
 
     streak = 0
     for month in reversed(past_months):
@@ -627,20 +1587,89 @@ def calculate_report_streak(reports: list[dict], required_months: list[str]) ->
     }
 
 
-def calculate_days_since(date_str: str) -> int:
-    """Return the number of days since a given date. Handles multiple date formats."""
-    date = _parse_date(date_str)
-    if not date:
-        return 999
-    return (datetime.now() - date).days
+def get_report_health(fellows: list[dict]) -> dict:
+    """
+    Compute report streak / incentive status for a whole roster in one pass.
 
+    Returns {fellow_id: calculate_report_streak(...) result} for every fellow
+    that requires monthly reports. Status Reports are taken from the cached
+    snapshot (already grouped by Fellow ID), so this costs at most one read
+    however many fellows are passed in.
+    """
+    reports_by_fellow = _snapshot(REPORTS_SHEET).groups
+    today = datetime.now()
+    health = {}
+    for fellow in fellows:
+        required_months = get_required_report_months(fellow)
+        if not required_months:
+            continue
+        health[fellow["id"]] = calculate_report_streak(
+            reports_by_fellow.get(fellow["id"], []), required_months, today=today
+        )
+    return health
 
-def calculate_days_until(date_str: str) -> int:
-    """Return the number of days until a given date. Handles multiple date formats."""
-    date = _parse_date(date_str)
-    if not date:
-        return 999
-    return (date - datetime.now()).days
+
+# ============ COHORTS ============
+# Cohort labels are free text ("Jan 2026 CIF/SCIF", "January 2025", "2020").
+# Each distinct label is parsed once into a CohortKey (records.py); fellows and
+# alumni carry theirs as record["cohort_key"], so sorting, filtering and the
+# events-tracking check compare tuples instead of re-parsing strings.
+
+# Fellows in cohorts from this (year, month) on must attend quarterly events
+TRACKED_COHORT_START = (2026, 1)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_cohort(cohort_str: str) -> CohortKey:
+    """
+    "Jan 2026 CIF/SCIF" -> CohortKey(2026, 1, "CIF/SCIF"). Takes the first
+    "Month Year" in the label, else the first 4-digit year; whatever text is
+    left over is the program suffix.
+    """
+    text = str(cohort_str or "").strip()
+    match = re.search(r'([A-Za-z]+ \d{4})', text)
+    ordinal = parse_month_label(match.group(1)) if match else None
+    if ordinal is not None:
+        year, month = divmod(ordinal, 12)
+        month += 1
+    else:
+        match = re.search(r'\b(\d{4})\b', text)
+        if not match:
+            return CohortKey(0, 0, text)
+        year, month = int(match.group(1)), 0
+    program = " ".join((text[:match.start()] + " " + text[match.end():]).split())
+    return CohortKey(year, month, intern_str(program))
+
+
+def _is_tracked_key(key: CohortKey) -> bool:
+    """
+    True if a cohort is January 2026 or later. Fellows in earlier cohorts
+    (pre-Jan 2026) are not required to attend events.
+    """
+    return key.year > 0 and (key.year, key.month or 1) >= TRACKED_COHORT_START
+
+
+def cohort_options(records: list) -> list[str]:
+    """Distinct cohort labels among fellow or alumni records, newest first (for filter dropdowns)."""
+    keys = {r["cohort"]: r["cohort_key"] for r in records if r["cohort"]}
+    return sorted(keys, key=keys.get, reverse=True)
+
+
+# ============ FILTERS ============
+
+def filter_selection(key: str, options: list, has_all: bool = True):
+    """
+    The option the filter selectbox keyed `key` currently holds, read from
+    session state before the widget is drawn, so the pages can count matches
+    (facets.facet) and label the options with them. Returns None for the
+    "All …" option (options[0]) when has_all. A stored value that is no longer
+    an option resets to options[0].
+    """
+    value = st.session_state.get(key, options[0])
+    if value not in options:
+        value = options[0]
+        st.session_state[key] = value
+    return None if has_all and value == options[0] else value
 
 
 # ============ EVENTS CRUD ============
@@ -654,57 +1683,30 @@ def _date_to_quarter(date_str: str) -> str:
     return f"Q{q} {d.year}"
 
 
-def _is_tracked_cohort(cohort_str: str) -> bool:
-    """
-    Return True if a cohort is January 2026 or later.
-
-    Fellows in earlier cohorts (pre-Jan 2026) are not required to attend events.
-    Handles formats like 'Jan 2026 CIF/SCIF', 'January 2026', 'Jan 2026'.
-    """
-    if not cohort_str:
-        return False
-    cutoff = datetime(2026, 1, 1)
-    # Try to extract a "Month Year" pattern (e.g. "Jan 2026" from "Jan 2026 CIF/SCIF")
-    match = re.search(r'([A-Za-z]+ \d{4})', str(cohort_str))
-    if match:
-        for fmt in ("%b %Y", "%B %Y"):
-            try:
-                return datetime.strptime(match.group(1), fmt) >= cutoff
-            except ValueError:
-                continue
-    # Fallback: year-only pattern (e.g. "2026")
-    match = re.search(r'\b(\d{4})\b', str(cohort_str))
-    if match:
-        try:
-            return datetime(int(match.group(1)), 1, 1) >= cutoff
-        except (ValueError, OverflowError):
-            pass
-    return False
-
-
 def fetch_events() -> list[dict]:
-    """Fetch all events from the Events sheet, sorted by date ascending."""
-    ws = _worksheet(EVENTS_SHEET)
-    rows = ws.get_all_records()
-    events = []
-    for row in rows:
-        if not str(row.get("Event ID", "")).strip():
-            continue  # skip blank rows
-        events.append({
-            "id":          str(row.get("Event ID", "")),
-            "name":        str(row.get("Event Name", "")),
-            "date":        str(row.get("Date", "")),
-            "type":        str(row.get("Type", "")),
-            "location":    str(row.get("Location", "")),
-            "venue":       str(row.get("Venue", "")),
-            "cohort":      str(row.get("Cohort", "")),
-            "quarter":     str(row.get("Quarter", "")),
-            "description": str(row.get("Description", "")),
-            "required":    _to_bool(row.get("Required for Fellows?", True)),
-            "staffed_by":  str(row.get("Staffed By", "")),
-        })
-    events.sort(key=lambda e: _parse_date(e["date"]) or datetime.min)
-    return events
+    """Fetch all events from the Events sheet, sorted by date ascending (cached snapshot)."""
+    return list(_snapshot(EVENTS_SHEET).records)
+
+
+# Events row decoder; blank rows (no Event ID) are skipped
+_EVENT_DECODER = _RowDecoder(
+    Event,
+    [
+        _field("id",          "Event ID"),
+        _field("name",        "Event Name"),
+        _field("date",        "Date"),
+        _field("type",        "Type", intern_str),
+        _field("location",    "Location", intern_str),
+        _field("venue",       "Venue"),
+        _field("cohort",      "Cohort", intern_str),
+        _field("quarter",     "Quarter", intern_str),
+        _field("description", "Description"),
+        _field("required",    "Required for Fellows?", _to_bool, True),
+        _field("staffed_by",  "Staffed By"),
+    ],
+    derived={"date_dt": lambda r: _parse_date(r["date"])},
+    required="id",
+)
 
 
 def _event_row_values(event_id: str, data: dict) -> list:
@@ -727,9 +1729,9 @@ def _event_row_values(event_id: str, data: dict) -> list:
 def add_event(event_data: dict) -> bool:
     """Append a new event row to the Events sheet."""
     try:
-        ws = _worksheet(EVENTS_SHEET)
-        event_id = _new_id()
-        ws.append_row(_event_row_values(event_id, event_data), value_input_option="USER_ENTERED")
+        values = _event_row_values(_new_id(), event_data)
+        first_row = _backend().append_rows(EVENTS_SHEET, [values])
+        _patch_append(EVENTS_SHEET, first_row, [values])
         return True
     except Exception as e:
         st.error(f"Failed to add event: {e}")
@@ -737,14 +1739,15 @@ def add_event(event_data: dict) -> bool:
 
 
 def update_event(event_id: str, event_data: dict) -> bool:
-    """Update an existing event row by Event ID."""
+    """Update an existing event row by Event ID (row located via the ID index)."""
     try:
-        ws = _worksheet(EVENTS_SHEET)
-        cell = ws.find(event_id, in_column=1)
-        if not cell:
+        row_num = _row_number(EVENTS_SHEET, event_id)
+        if not row_num:
             st.error(f"Event {event_id} not found.")
             return False
-        ws.update(f"A{cell.row}:K{cell.row}", [_event_row_values(event_id, event_data)], value_input_option="USER_ENTERED")
+        values = _event_row_values(event_id, event_data)
+        _backend().batch_update(EVENTS_SHEET, [{"range": f"A{row_num}:K{row_num}", "values": [values]}])
+        _patch_update(EVENTS_SHEET, row_num, 1, values)
         return True
     except Exception as e:
         st.error(f"Failed to update event: {e}")
@@ -752,47 +1755,76 @@ def update_event(event_id: str, event_data: dict) -> bool:
 
 
 def fetch_all_event_attendance() -> list[dict]:
-    """Fetch all rows from the Event Attendance sheet."""
-    ws = _worksheet(EVENT_ATTENDANCE_SHEET)
-    rows = ws.get_all_records()
-    records = []
-    for row in rows:
-        records.append({
-            "id":          str(row.get("Record ID", "")),
-            "event_id":    str(row.get("Event ID", "")),
-            "fellow_id":   str(row.get("Fellow ID", "")),
-            "fellow_name": str(row.get("Fellow Name", "")),
-            "attended":    _to_bool(row.get("Attended?", False)),
-            "notes":       str(row.get("Notes", "")),
-        })
-    return records
+    """Fetch all rows from the Event Attendance sheet (cached snapshot)."""
+    return list(_snapshot(EVENT_ATTENDANCE_SHEET).records)
+
+
+# Event Attendance row decoder (see _RowDecoder)
+_ATTENDANCE_DECODER = _RowDecoder(
+    AttendanceRecord,
+    [
+        _field("id",          "Record ID"),
+        _field("event_id",    "Event ID"),
+        _field("fellow_id",   "Fellow ID"),
+        _field("fellow_name", "Fellow Name"),
+        _field("attended",    "Attended?", _to_bool, False),
+        _field("notes",       "Notes"),
+    ],
+)
+
+
+def _attendance_rows(event_id: str, fellow_ids) -> tuple:
+    """
+    (snapshot, revision, {fellow_id: sheet row}) for the existing attendance
+    rows of `event_id` and `fellow_ids`. The rows are confirmed against column
+    A in one read; if any has moved, the tab is re-read and looked up again.
+    """
+    def lookup(snapshot):
+        rows, expected = {}, {}
+        for row_num, rec in snapshot.items():
+            if rec["event_id"] == event_id and rec["fellow_id"] in fellow_ids and rec["fellow_id"] not in rows:
+                rows[rec["fellow_id"]] = row_num   # first match wins, like ws.find()
+                expected[row_num] = rec["id"]
+        return rows, expected
+
+    snapshot = _snapshot(EVENT_ATTENDANCE_SHEET)
+    rows, expected = lookup(snapshot)
+    if not _rows_hold(EVENT_ATTENDANCE_SHEET, snapshot, expected):
+        _reload(EVENT_ATTENDANCE_SHEET)
+        snapshot = _snapshot(EVENT_ATTENDANCE_SHEET)
+        rows, _ = lookup(snapshot)
+    return snapshot, snapshot.revision, rows
 
 
 def save_event_attendance(event_id: str, fellow_id: str, fellow_name: str,
                           attended: bool, notes: str = "") -> bool:
     """
     Upsert an attendance record for one fellow at one event.
-    Updates column E (Attended?) if a record already exists; appends a new row otherwise.
+    Updates columns E:F (Attended?, Notes) if a record already exists; appends a new row otherwise.
     """
     try:
-        ws = _worksheet(EVENT_ATTENDANCE_SHEET)
-        rows = ws.get_all_records()
-        for i, row in enumerate(rows, start=2):  # row 1 is the header
-            if (str(row.get("Event ID", "")) == event_id and
-                    str(row.get("Fellow ID", "")) == fellow_id):
-                ws.update_cell(i, 5, "TRUE" if attended else "FALSE")
-                ws.update_cell(i, 6, notes)
-                return True
+        attended_str = "TRUE" if attended else "FALSE"
+        snapshot, revision, rows = _attendance_rows(event_id, {fellow_id})
+        row_num = rows.get(fellow_id)
+        if row_num is not None:
+            _backend().batch_update(
+                EVENT_ATTENDANCE_SHEET, [{"range": f"E{row_num}:F{row_num}", "values": [[attended_str, notes]]}]
+            )
+            _patch_update(EVENT_ATTENDANCE_SHEET, row_num, 5, [attended_str, notes])
+            _apply_attendance(snapshot, revision, 1, event_id, {fellow_id: attended})
+            return True
         # No existing record — append a new row
-        record_id = _new_id()
-        ws.append_row([
-            record_id,                          # A: Record ID
+        values = [
+            _new_id(),                          # A: Record ID
             event_id,                           # B: Event ID
             fellow_id,                          # C: Fellow ID
             fellow_name,                        # D: Fellow Name
-            "TRUE" if attended else "FALSE",    # E: Attended?
+            attended_str,                       # E: Attended?
             notes,                              # F: Notes
-        ], value_input_option="USER_ENTERED")
+        ]
+        first_row = _backend().append_rows(EVENT_ATTENDANCE_SHEET, [values])
+        _patch_append(EVENT_ATTENDANCE_SHEET, first_row, [values])
+        _apply_attendance(snapshot, revision, 1, event_id, {fellow_id: attended})
         return True
     except Exception as e:
         st.error(f"Failed to save attendance: {e}")
@@ -806,36 +1838,26 @@ def save_event_attendance_batch(event_id: str, attendance_map: dict) -> bool:
     attendance_map: {fellow_id: (fellow_name, attended, notes)}
 
     Strategy:
-      1. Read the attendance sheet ONCE.
-      2. Build a lookup of existing (event_id, fellow_id) → row number.
+      1. Take the cached attendance snapshot (read at most once per cache TTL).
+      2. Look up the existing rows for these fellows, confirmed against column A in one read.
       3. Collect updates (existing rows) and new rows (inserts) in memory.
       4. Write all updates via one batch_update call and all inserts via one append_rows call.
+      5. Update the affected quarter of the shared compliance table for these fellows.
 
     This replaces the old per-fellow loop that called get_all_records() N times,
     which caused 429 quota errors when saving attendance for large cohorts.
     """
     try:
-        ws = _worksheet(EVENT_ATTENDANCE_SHEET)
-        rows = ws.get_all_records()  # single read
+        # Lookup: fellow_id → sheet row number (1-indexed, row 1 = header)
+        snapshot, revision, existing = _attendance_rows(event_id, attendance_map.keys())
 
-        # Build lookup: (event_id, fellow_id) → sheet row number (1-indexed, row 1 = header)
-        existing: dict[tuple, int] = {}
-        for i, row in enumerate(rows, start=2):
-            key = (str(row.get("Event ID", "")), str(row.get("Fellow ID", "")))
-            existing[key] = i
-
-        batch_updates = []  # for ws.batch_update()
-        new_rows = []       # for ws.append_rows()
+        updates = []    # (row_num, first_col, values) for one batch_update call
+        new_rows = []   # for one append_rows call
 
         for fellow_id, (fellow_name, attended, notes) in attendance_map.items():
-            key = (event_id, fellow_id)
             attended_str = "TRUE" if attended else "FALSE"
-            if key in existing:
-                row_num = existing[key]
-                batch_updates.append({
-                    "range": f"E{row_num}:F{row_num}",
-                    "values": [[attended_str, notes]],
-                })
+            if fellow_id in existing:
+                updates.append((existing[fellow_id], 5, [attended_str, notes]))   # E:F
             else:
                 new_rows.append([
                     _new_id(),    # A: Record ID
@@ -846,19 +1868,118 @@ def save_event_attendance_batch(event_id: str, attendance_map: dict) -> bool:
                     notes,        # F: Notes
                 ])
 
-        if batch_updates:
-            ws.batch_update(batch_updates, value_input_option="USER_ENTERED")
+        if updates:
+            _backend().batch_update(EVENT_ATTENDANCE_SHEET, [
+                {"range": f"E{row_num}:F{row_num}", "values": [values]} for row_num, _, values in updates
+            ])
+            _patch_updates(EVENT_ATTENDANCE_SHEET, updates)
         if new_rows:
-            ws.append_rows(new_rows, value_input_option="USER_ENTERED")
-
+            first_row = _backend().append_rows(EVENT_ATTENDANCE_SHEET, new_rows)
+            _patch_append(EVENT_ATTENDANCE_SHEET, first_row, new_rows)
+
+        # 5. Fold the saved values into the shared compliance table
+        _apply_attendance(
+            snapshot, revision, (1 if updates else 0) + (1 if new_rows else 0), event_id,
+            {fellow_id: attended for fellow_id, (_, attended, _) in attendance_map.items()},
+        )
         return True
     except Exception as e:
         st.error(f"Failed to save attendance: {e}")
         return False
 
 
+# ============ TAB REGISTRY ============
+# How each cached tab is decoded and ordered. The sort order is applied once per
+# snapshot (and after each write-through patch), not on every fetch.
+
+_TAB_SPECS = {
+    FELLOWS_SHEET:          _TabSpec(_FELLOW_DECODER, enrich=_enrich_fellow,
+                                     search_fields={"name": 3, "office": 2, "cohort": 1}),
+    CHECKINS_SHEET:         _TabSpec(_CHECKIN_DECODER, sort_key=lambda c: c["date"], reverse=True, group_by="fellow_id"),
+    REPORTS_SHEET:          _TabSpec(_STATUS_REPORT_DECODER, sort_key=_report_month_key, group_by="fellow_id"),
+    ALUMNI_SHEET:           _TabSpec(_ALUMNI_DECODER,
+                                     search_fields={"name": 3, "current_role": 2, "office_served": 2, "cohort": 1}),
+    EVENTS_SHEET:           _TabSpec(_EVENT_DECODER, sort_key=lambda e: e["date_dt"] or datetime.min,
+                                     search_fields={"name": 3, "venue": 1, "location": 1, "description": 1}),
+    EVENT_ATTENDANCE_SHEET: _TabSpec(_ATTENDANCE_DECODER),
+}
+
+
+class _TabView:
+    """
+    A column projection of a tab for card and list views.
+
+    Records keep only `fields`, and only the sheet columns those fields are
+    decoded from (taken from the tab's _RowDecoder) are read, so code that
+    reaches for a field the view didn't load fails with a KeyError instead of
+    quietly seeing a blank value.
+    """
+
+    def __init__(self, tab: str, fields: list[str]):
+        self.tab = tab
+        self.fields = fields
+
+    def spec(self) -> _TabSpec:
+        base = _TAB_SPECS[self.tab]
+        search_fields = {k: w for k, w in (base.search_fields or {}).items() if k in self.fields}
+        return _TabSpec(base.decoder.only(self.fields), sort_key=base.sort_key, reverse=base.reverse,
+                        group_by=base.group_by, enrich=base.enrich, search_fields=search_fields)
+
+    @property
+    def columns(self) -> list[str]:
+        """Header names of the columns the view reads."""
+        return _TAB_SPECS[self.tab].decoder.only(self.fields).headers()
+
+
+# Cached like tabs, under "<tab>#<view>" keys
+FELLOW_CARDS = f"{FELLOWS_SHEET}#card"
+ALUMNI_CARDS = f"{ALUMNI_SHEET}#card"
+
+_VIEWS = {
+    FELLOW_CARDS: _TabView(
+        FELLOWS_SHEET,
+        ["id", "name", "cohort", "status", "fellow_type", "party", "office", "chamber",
+         "start_date", "end_date", "last_check_in",
+         "requires_monthly_reports", "report_start_date", "report_end_month",
+         "start_date_dt", "end_date_dt", "last_check_in_dt", "report_start_date_dt",
+         "cohort_key", "attendance_tracked", "is_aisf", "type_label"],
+    ),
+    ALUMNI_CARDS: _TabView(
+        ALUMNI_SHEET,
+        ["id", "name", "cohort", "fellow_types", "party", "chamber", "sector", "current_role",
+         "office_served", "location", "linkedin", "contact", "last_engaged", "currently_on_hill",
+         "last_engaged_dt", "cohort_key"],
+    ),
+}
+
+
+def _view_key(tab: str, view: str = None) -> str:
+    """Cache key for a tab or one of its views ("card" -> "Fellows#card")."""
+    return f"{tab}#{view}" if view else tab
+
+
+def _spec(key: str) -> _TabSpec:
+    return _VIEWS[key].spec() if key in _VIEWS else _TAB_SPECS[key]
+
+
+def _cache_keys(tab: str) -> list[str]:
+    """The tab itself plus every view of it — everything a write to the tab must reach."""
+    return [tab] + [key for key, view in _VIEWS.items() if view.tab == tab]
+
+
 # ============ STATUS REPORT SYNC FROM FORM ============
 
+# Only the columns the sync uses; the form's question columns are never decoded
+_FORM_RESPONSE_DECODER = _RowDecoder(
+    FormResponse,
+    [
+        _field("timestamp",  "Timestamp"),
+        _field("email",      "Email Address"),
+        _field("first_name", "First Name"),
+        _field("last_name",  "Last Name"),
+    ],
+)
+
 def sync_status_reports_from_form(year: int, month: int) -> dict:
     """
     Read Google Form responses for the given year/month, match each submission
@@ -904,8 +2025,9 @@ def sync_status_reports_from_form(year: int, month: int) -> dict:
 
     # ── 1. Read form responses ────────────────────────────────────────────────
     try:
-        ws = _worksheet(FORM_RESPONSES_SHEET)
-        rows = ws.get_all_records()
+        grid = _backend().read_tabs([FORM_RESPONSES_SHEET])[FORM_RESPONSES_SHEET]
+        decode = _FORM_RESPONSE_DECODER.bind(grid[0] if grid else [])
+        rows = [decode(cells) for cells in grid[1:]]
     except Exception as e:
         result["errors"].append(f"Failed to read form responses: {e}")
         return result
@@ -922,12 +2044,12 @@ def sync_status_reports_from_form(year: int, month: int) -> dict:
 
     month_responses = []
     for row in rows:
-        ts = _parse_form_ts(str(row.get("Timestamp", "")))
+        ts = _parse_form_ts(row["timestamp"])
         if ts and ts.year == year and ts.month == month:
             month_responses.append({
-                "email":      str(row.get("Email Address", "")).strip().lower(),
-                "first_name": str(row.get("First Name", "")).strip(),
-                "last_name":  str(row.get("Last Name", "")).strip(),
+                "email":      row["email"].strip().lower(),
+                "first_name": row["first_name"].strip(),
+                "last_name":  row["last_name"].strip(),
                 "timestamp":  ts,
                 "on_time":    ts <= deadline,
             })
@@ -967,16 +2089,13 @@ def sync_status_reports_from_form(year: int, month: int) -> dict:
 
     # ── 5. Load existing Status Report records for this month ─────────────────
     try:
-        all_reports = _worksheet(REPORTS_SHEET).get_all_records()
+        all_reports = _snapshot(REPORTS_SHEET).records
     except Exception as e:
         result["errors"].append(f"Failed to fetch status reports: {e}")
         return result
 
     # (fellow_id, month_label) → existing report ID
-    existing_reports = {
-        (str(r.get("Fellow ID", "")), str(r.get("Month", ""))): str(r.get("ID", ""))
-        for r in all_reports
-    }
+    existing_reports = {(r["fellow_id"], r["month"]): r["id"] for r in all_reports}
 
     # ── 6. Match each submission and upsert a Status Report record ────────────
     for email, response in deduped.items():
@@ -1025,6 +2144,351 @@ def sync_status_reports_from_form(year: int, month: int) -> dict:
     return result
 
 
+# ============ EVENT COMPLIANCE ============
+
+COMPLIANCE_HEADER = ["Fellow ID", "Quarter", "Met?", "Attended", "Required", "Updated"]
+
+
+class AttendanceIndex:
+    """
+    Event attendance as integer bitmaps, built in one pass over the Events and
+    Event Attendance records.
+
+    Every past event (dated before `today`) gets one bit, in date order. Then:
+
+      quarter_masks — quarter label -> bits of that quarter's past required events
+      attended      — fellow ID -> bits of the past events they attended
+      recorded      — fellow ID -> bits of the past events they have any record for
+
+    so "did this fellow meet this quarter" is one AND, and attendance counts
+    are popcounts, instead of scanning events x attendance per fellow.
+    When a fellow has several records for one event, the last one wins.
+
+    The compliance table is materialized from those bitmaps:
+
+      table — fellow ID -> {quarter: {"met", "attended", "required"}}
+
+    (fellows with no records share one all-zero row set). apply() folds a
+    saved attendance batch into the bitmaps and rewrites only the affected
+    quarter for the fellows in the batch. Rows are replaced, never mutated,
+    so a session reading the table is unaffected by a concurrent apply().
+    """
+
+    def __init__(self, events: list, attendance: list, today: date = None):
+        self.today = today or date.today()
+        self.past_events = [e for e in events if e["date_dt"] and e["date_dt"].date() < self.today]
+        self._bit: dict[str, int] = {}
+        for i, event in enumerate(self.past_events):
+            self._bit.setdefault(event["id"], 1 << i)
+
+        self.quarter_masks: dict[str, int] = {}
+        self._quarter_of: dict[str, str] = {}   # past required event ID -> quarter
+        for event in self.past_events:
+            if not event["required"]:
+                continue
+            quarter = event["quarter"] or _date_to_quarter(event["date"])
+            if quarter:
+                self.quarter_masks[quarter] = self.quarter_masks.get(quarter, 0) | self._bit[event["id"]]
+                self._quarter_of.setdefault(event["id"], quarter)
+
+        self.attended: dict[str, int] = {}
+        self.recorded: dict[str, int] = {}
+        for rec in attendance:
+            bit = self._bit.get(rec["event_id"])
+            if bit is not None:
+                self._set(rec["fellow_id"], bit, rec["attended"])
+
+        self._no_records = self._quarter_rows("")
+        self.table: dict[str, dict] = {fid: self._quarter_rows(fid) for fid in self.recorded}
+        self._histories: dict[str, tuple] = {}   # fellow ID -> history(), built on first request
+
+    def _set(self, fellow_id: str, bit: int, attended: bool) -> None:
+        self.recorded[fellow_id] = self.recorded.get(fellow_id, 0) | bit
+        if attended:
+            self.attended[fellow_id] = self.attended.get(fellow_id, 0) | bit
+        else:
+            self.attended[fellow_id] = self.attended.get(fellow_id, 0) & ~bit
+
+    def _quarter_row(self, fellow_id: str, mask: int) -> dict:
+        hits = (self.attended.get(fellow_id, 0) & mask).bit_count()
+        return {"met": hits > 0, "attended": hits, "required": mask.bit_count()}
+
+    def _quarter_rows(self, fellow_id: str) -> dict:
+        return {q: self._quarter_row(fellow_id, mask) for q, mask in self.quarter_masks.items()}
+
+    def apply(self, event_id: str, changes: dict) -> list[str]:
+        """
+        Fold {fellow_id: attended} for one event into the index. Returns the
+        fellow IDs whose compliance rows changed (none unless the event is a
+        past required event).
+        """
+        bit = self._bit.get(event_id)
+        if bit is None:
+            return []   # upcoming or undated event: nothing derived from it yet
+        quarter = self._quarter_of.get(event_id)
+        touched = []
+        for fellow_id, attended in changes.items():
+            self._set(fellow_id, bit, attended)
+            self._histories.pop(fellow_id, None)
+            if fellow_id not in self.table:
+                self.table[fellow_id] = self._quarter_rows(fellow_id)
+            elif quarter:
+                rows = dict(self.table[fellow_id])
+                rows[quarter] = self._quarter_row(fellow_id, self.quarter_masks[quarter])
+                self.table[fellow_id] = rows
+            if quarter:
+                touched.append(fellow_id)
+        return touched
+
+    def affects(self, event_id: str) -> bool:
+        """True if attendance at this event feeds the compliance table (a past event with a quarter)."""
+        return event_id in self._bit and bool(self._quarter_of.get(event_id))
+
+    def quarter_rows(self, fellow_id: str) -> dict:
+        """{quarter: {"met", "attended", "required"}} for one fellow (read-only)."""
+        return self.table.get(fellow_id, self._no_records)
+
+    def quarter_status(self, fellow_id: str) -> dict:
+        """{quarter_label: "met" | "not_met"} for every quarter with a past required event."""
+        return {q: "met" if row["met"] else "not_met" for q, row in self.quarter_rows(fellow_id).items()}
+
+    def summary(self, fellow_id: str) -> dict:
+        """
+        Quarter status plus attendance counts for one fellow:
+          {"quarters", "at_risk", "attended", "recorded", "pct"}
+        recorded counts past events with a record for the fellow; pct is
+        attended / recorded as a whole percentage (0 when nothing is recorded).
+        """
+        quarters = self.quarter_status(fellow_id)
+        attended = self.attended.get(fellow_id, 0).bit_count()
+        recorded = self.recorded.get(fellow_id, 0).bit_count()
+        return {
+            "quarters": quarters,
+            "at_risk":  "not_met" in quarters.values(),
+            "attended": attended,
+            "recorded": recorded,
+            "pct":      int(round(attended / recorded * 100)) if recorded else 0,
+        }
+
+    def history(self, fellow_id: str) -> tuple:
+        """
+        (event, attended) for every past event in date order; attended is None
+        when the fellow has no record for the event. Built once per fellow and
+        kept until apply() changes their attendance (the fellow modal's Events
+        tab and the events page both read it).
+        """
+        history = self._histories.get(fellow_id)
+        if history is None:
+            attended = self.attended.get(fellow_id, 0)
+            recorded = self.recorded.get(fellow_id, 0)
+            history = tuple(
+                (event, bool(attended & bit) if recorded & bit else None)
+                for event, bit in ((e, self._bit[e["id"]]) for e in self.past_events)
+            )
+            self._histories[fellow_id] = history
+        return history
+
+    def compliance(self, fellows: list) -> dict:
+        """{fellow_id: quarter_status} for every non-AISF fellow in `fellows`."""
+        return {f["id"]: self.quarter_status(f["id"]) for f in fellows if not f["is_aisf"]}
+
+    def rows(self, fellow_ids, updated: str = "") -> list[list]:
+        """Compliance tab rows (see COMPLIANCE_HEADER) for these fellows, one per quarter."""
+        return [
+            [fid, quarter, "TRUE" if row["met"] else "FALSE", row["attended"], row["required"], updated]
+            for fid in fellow_ids
+            for quarter, row in self.quarter_rows(fid).items()
+        ]
+
+
+@st.cache_resource
+def _attendance_index_slot() -> dict:
+    """Process-wide holder for the current AttendanceIndex (see get_attendance_index)."""
+    # compliance_lock serializes Compliance tab writes without holding up readers of the index
+    return {"lock": threading.Lock(), "current": None,
+            "compliance_lock": threading.Lock(), "compliance_rows": None}
+
+
+def get_attendance_index(today: date = None) -> AttendanceIndex:
+    """
+    Return the shared AttendanceIndex for the cached Events and Event Attendance
+    snapshots. It is built once per pair of snapshots per day; attendance saved
+    through save_event_attendance(_batch) is folded into it in place, and any
+    other change to either snapshot (reload, event edit) rebuilds it.
+
+    Airtable equivalent: a rollup field per fellow per quarter.
+    Here: a materialized table in the shared cache, O(1) per fellow to read.
+    """
+    today = today or date.today()
+    snapshots = _snapshots([EVENTS_SHEET, EVENT_ATTENDANCE_SHEET], today)
+    events, attendance = snapshots[EVENTS_SHEET], snapshots[EVENT_ATTENDANCE_SHEET]
+    slot = _attendance_index_slot()
+    with slot["lock"]:
+        current = slot["current"]
+        if not (current and current["events"] is events and current["attendance"] is attendance
+                and current["revisions"] == (events.revision, attendance.revision)
+                and current["today"] == today):
+            current = {
+                "events": events, "attendance": attendance, "today": today,
+                "revisions": (events.revision, attendance.revision),
+                "index": AttendanceIndex(events.records, attendance.records, today),
+            }
+            slot["current"] = current
+        return current["index"]
+
+
+def _apply_attendance(snapshot: _TabSnapshot, revision: int, patches: int, event_id: str, changes: dict) -> None:
+    """
+    Fold a saved attendance write into the shared AttendanceIndex instead of
+    letting the next reader rebuild it. `snapshot` is the Event Attendance
+    snapshot the write was planned against, at `revision`, and `patches` the
+    number of write-through patches applied to it. If anything else changed
+    the snapshot in between, the index is left alone and rebuilt on next read.
+
+    Then mirrors the touched fellows' rows to the Compliance tab, if one is
+    configured. When the index could not be updated in place, it is rebuilt
+    first (get_attendance_index), so the tab never misses a save.
+    """
+    updated = datetime.now().strftime("%Y-%m-%d %H:%M")
+    rows = None
+    slot = _attendance_index_slot()
+    with slot["lock"]:
+        current = slot["current"]
+        if (current and current["attendance"] is snapshot
+                and current["revisions"][1] == revision
+                and snapshot.revision == revision + patches):
+            index = current["index"]
+            touched = index.apply(event_id, changes)
+            current["revisions"] = (current["revisions"][0], snapshot.revision)
+            rows = index.rows(touched, updated)   # copied out under the lock
+    if not COMPLIANCE_SHEET:
+        return
+    try:
+        if rows is None:
+            index = get_attendance_index()
+            with slot["lock"]:
+                rows = index.rows(list(changes) if index.affects(event_id) else [], updated)
+        if rows:
+            _persist_compliance(rows)
+    except Exception as e:
+        st.warning(f"Attendance saved, but the {COMPLIANCE_SHEET} tab was not updated: {e}")
+
+
+def _persist_compliance(rows: list[list]) -> None:
+    """
+    Upsert rows into the Compliance tab, keyed by (Fellow ID, Quarter). The
+    tab's row positions are read once per process and then kept current, so
+    each save costs one batch_update and/or one append_rows. Runs under the
+    slot's compliance_lock, not the index lock, so page renders never wait on it.
+    """
+    slot = _attendance_index_slot()
+    with slot["compliance_lock"]:
+        positions = slot["compliance_rows"]
+        if positions is None:
+            grid = _backend().read_tabs([COMPLIANCE_SHEET])[COMPLIANCE_SHEET]
+            if not grid:
+                _backend().append_rows(COMPLIANCE_SHEET, [COMPLIANCE_HEADER])
+            positions = {(row[0], row[1]): row_num
+                         for row_num, row in enumerate(grid[1:], start=2) if len(row) >= 2}
+            slot["compliance_rows"] = positions
+        updates, new_rows = [], []
+        for row in rows:
+            row_num = positions.get((row[0], row[1]))
+            if row_num is None:
+                new_rows.append(row)
+            else:
+                updates.append({"range": f"A{row_num}:F{row_num}", "values": [row]})
+        if updates:
+            _backend().batch_update(COMPLIANCE_SHEET, updates)
+        if new_rows:
+            first_row = _backend().append_rows(COMPLIANCE_SHEET, new_rows)
+            if first_row is None:
+                slot["compliance_rows"] = None   # positions unknown: re-read next time
+            else:
+                for offset, row in enumerate(new_rows):
+                    positions[(row[0], row[1])] = first_row + offset
+
+
+class EventsAnalytics:
+    """
+    Everything the Events & Attendance page derives from the Fellows, Events
+    and Event Attendance tabs, computed once per set of snapshots and shared
+    by its Overview, Events and Fellows tabs:
+
+      events           — every event, in date order
+      eligible         — fellows whose attendance is tracked (fellow["attendance_tracked"])
+      past_events      — events dated before today
+      upcoming_events  — events dated today or later
+      event_attendance — event ID -> {fellow ID: attended} (last record wins)
+      event_stats      — event ID -> {"attended", "recorded", "pct"}
+      avg_pct          — mean attendance % over past events with any record
+      index            — the AttendanceIndex (per-fellow history, counts)
+      summaries        — eligible fellow ID -> index.summary()
+      compliance       — eligible fellow ID -> {quarter: "met" | "not_met"}
+      quarters         — quarter labels with a past required event, sorted
+      at_risk          — eligible fellows missing at least one quarter
+    """
+
+    def __init__(self, fellows: list, events: list, attendance: list, index: AttendanceIndex):
+        self.events = events
+        self.eligible = [f for f in fellows if f["attendance_tracked"]]
+        self.index = index
+        self.past_events = index.past_events
+        self.upcoming_events = [e for e in events if e["date_dt"] and e["date_dt"].date() >= index.today]
+
+        self.event_attendance: dict[str, dict] = {}
+        for rec in attendance:
+            self.event_attendance.setdefault(rec["event_id"], {})[rec["fellow_id"]] = rec["attended"]
+        self.event_stats: dict[str, dict] = {}
+        for event_id, marks in self.event_attendance.items():
+            attended = sum(marks.values())
+            self.event_stats[event_id] = {
+                "attended": attended,
+                "recorded": len(marks),
+                "pct":      int(round(attended / len(marks) * 100)),
+            }
+        pcts = [self.event_stats[e["id"]]["pct"] for e in self.past_events if e["id"] in self.event_stats]
+        self.avg_pct = int(round(sum(pcts) / len(pcts))) if pcts else 0
+
+        self.summaries = {f["id"]: index.summary(f["id"]) for f in self.eligible}
+        self.compliance = {fid: summary["quarters"] for fid, summary in self.summaries.items()}
+        self.quarters = sorted(index.quarter_masks)
+        self.at_risk = sum(1 for summary in self.summaries.values() if summary["at_risk"])
+
+    def stats(self, event_id: str) -> dict:
+        """{"attended", "recorded", "pct"} for one event (zeros if nothing is recorded)."""
+        return self.event_stats.get(event_id, {"attended": 0, "recorded": 0, "pct": 0})
+
+
+@st.cache_resource
+def _events_analytics_slot() -> dict:
+    """Process-wide holder for the current EventsAnalytics (see get_events_analytics)."""
+    return {"lock": threading.Lock(), "current": None}
+
+
+def get_events_analytics(today: date = None) -> EventsAnalytics:
+    """
+    Return the shared EventsAnalytics for the cached Fellows, Events and Event
+    Attendance snapshots (loaded together in one batched read if expired).
+    Rebuilt only when one of them changes or the day rolls over, so each
+    rerun of the Events page reads precomputed lookups.
+    """
+    today = today or date.today()
+    tabs = [FELLOWS_SHEET, EVENTS_SHEET, EVENT_ATTENDANCE_SHEET]
+    snapshots = _snapshots(tabs, today)
+    index = get_attendance_index(today)
+    key = [(snapshots[tab], snapshots[tab].revision) for tab in tabs]
+    slot = _events_analytics_slot()
+    with slot["lock"]:
+        current = slot["current"]
+        if not (current and current["index"] is index and current["today"] == today
+                and all(a is b and ra == rb for (a, ra), (b, rb) in zip(current["key"], key))):
+            analytics = EventsAnalytics(*(snapshots[tab].records for tab in tabs), index)
+            current = {"key": key, "index": index, "today": today, "analytics": analytics}
+            slot["current"] = current
+        return current["analytics"]
+
+
 def get_quarter_compliance(fellows: list, events: list, attendance: list) -> dict:
     """
     Compute quarterly attendance compliance for each CIF/SCIF fellow.
@@ -1033,35 +2497,126 @@ def get_quarter_compliance(fellows: list, events: list, attendance: list) -> dic
 
     A quarter appears in a fellow's result only if at least one past required
     event falls in that quarter. AISF fellows are excluded entirely.
+    Pages reading the cached tabs should use get_attendance_index() instead,
+    which builds the bitmaps once per snapshot rather than on every call.
     """
-    today = datetime.now().date()
+    return AttendanceIndex(events, attendance).compliance(fellows)
 
-    # Build lookup: {event_id: {fellow_id: attended_bool}}
-    att_lookup: dict = {}
-    for rec in attendance:
-        att_lookup.setdefault(rec["event_id"], {})[rec["fellow_id"]] = rec["attended"]
 
-    # Past required events grouped by quarter
-    quarter_events: dict = {}
-    for event in events:
-        if not event.get("required"):
-            continue
-        d = _parse_date(event["date"])
-        if not d or d.date() >= today:
-            continue
-        q = event.get("quarter") or _date_to_quarter(event["date"])
-        if q:
-            quarter_events.setdefault(q, []).append(event["id"])
+# ============ FULL-TEXT SEARCH ============
+# Free-text columns indexed for the Search page: (tab, record field, label).
 
-    result: dict = {}
-    for fellow in fellows:
-        if fellow.get("fellow_type") == "AISF":
+NOTE_SOURCES = [
+    (FELLOWS_SHEET,  "notes",            "Fellow Notes"),
+    (ALUMNI_SHEET,   "engagement_notes", "Engagement Notes"),
+    (ALUMNI_SHEET,   "notes",            "Alumni Notes"),
+    (CHECKINS_SHEET, "notes",            "Check-in Notes"),
+]
+_NOTE_TABS = sorted({tab for tab, _, _ in NOTE_SOURCES})
+
+
+@st.cache_resource
+def _notes_index_slot() -> dict:
+    """Process-wide holder for the notes FullTextIndex (see _notes_index)."""
+    return {"lock": threading.Lock(), "current": None}
+
+
+def _index_notes(index: FullTextIndex, tab: str, record) -> None:
+    for source_tab, field, _ in NOTE_SOURCES:
+        if source_tab == tab:
+            index.add((tab, field, record["id"]), record.get(field, ""))
+
+
+def _notes_index() -> tuple[dict, dict]:
+    """
+    Return (slot entry, snapshots): the shared FullTextIndex over NOTE_SOURCES,
+    built once per set of snapshots. Callers hold slot["lock"] while they read it.
+    """
+    snapshots = _snapshots(_NOTE_TABS)
+    slot = _notes_index_slot()
+    with slot["lock"]:
+        current = slot["current"]
+        revisions = {tab: snapshots[tab].revision for tab in _NOTE_TABS}
+        if not (current and all(current["snapshots"][tab] is snapshots[tab] for tab in _NOTE_TABS)
+                and current["revisions"] == revisions):
+            index = FullTextIndex()
+            for tab in _NOTE_TABS:
+                for record in snapshots[tab].records:
+                    _index_notes(index, tab, record)
+            current = {"snapshots": dict(snapshots), "revisions": revisions, "index": index}
+            slot["current"] = current
+    return current, snapshots
+
+
+def _notes_mark(tab: str):
+    """
+    (snapshot, revision) of `tab` as the notes index last saw it, or None if
+    there is no index yet. Taken before a write; costs no read.
+    """
+    slot = _notes_index_slot()
+    with slot["lock"]:
+        current = slot["current"]
+        if current is None:
+            return None
+        return current["snapshots"][tab], current["revisions"][tab]
+
+
+def _apply_notes(tab: str, mark, record_id: str) -> None:
+    """
+    Re-index one record's notes after a write (add_checkin, update_fellow,
+    update_alumni) instead of rebuilding the whole index. `mark` comes from
+    _notes_mark() before the write; unless the write's own patch is the only
+    change to that snapshot since, the index is left alone and rebuilt on the
+    next search.
+    """
+    if mark is None:
+        return
+    snapshot, revision = mark
+    slot = _notes_index_slot()
+    with slot["lock"]:
+        current = slot["current"]
+        if not (current and current["snapshots"][tab] is snapshot
+                and current["revisions"][tab] == revision
+                and snapshot.revision == revision + 1):
+            return
+        record = snapshot.record(record_id)
+        if record is not None:
+            _index_notes(current["index"], tab, record)
+        current["revisions"] = {**current["revisions"], tab: snapshot.revision}
+
+
+def search_notes(query: str, limit: int = 50, label: str = None) -> list[dict]:
+    """
+    Ranked full-text search over fellow notes, alumni engagement and general
+    notes, and check-in notes (BM25, see search.FullTextIndex).
+
+    Returns up to `limit` hits, best first:
+      {"tab", "field", "label", "record", "name", "date", "score", "snippet"}
+    where name is the fellow or alum the text belongs to and date is set for
+    check-ins. `label` (a NOTE_SOURCES label, e.g. "Check-in Notes") limits the
+    search to that source before the top `limit` are taken.
+    """
+    if not query.strip():
+        return []
+    current, snapshots = _notes_index()
+    slot = _notes_index_slot()
+    labels = {(tab, field): source for tab, field, source in NOTE_SOURCES}
+    keep = (lambda key: labels[key[:2]] == label) if label else None
+    with slot["lock"]:
+        index = current["index"]
+        found = [(key, score, index.text(key)) for key, score in index.search(query, limit, keep)]
+    hits = []
+    for (tab, field, record_id), score, text in found:
+        record = snapshots[tab].record(record_id)
+        if record is None:
             continue
-        fid = fellow["id"]
-        result[fid] = {}
-        for quarter, event_ids in quarter_events.items():
-            attended_any = any(
-                att_lookup.get(eid, {}).get(fid, False) for eid in event_ids
-            )
-            result[fid][quarter] = "met" if attended_any else "not_met"
-    return result
+        if tab == CHECKINS_SHEET:
+            fellow = snapshots[FELLOWS_SHEET].record(record["fellow_id"])
+            name, when = (fellow["name"] if fellow else ""), record["date"]
+        else:
+            name, when = record["name"], ""
+        hits.append({
+            "tab": tab, "field": field, "label": labels[(tab, field)], "record": record,
+            "name": name, "date": when, "score": score, "snippet": snippet(text, query),
+        })
+    return hits
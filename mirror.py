@@ -0,0 +1,268 @@
+"""
+mirror.py — Local SQLite read replica of the dashboard spreadsheet
+
+When mirror mode is enabled (see helpers.py / README), the app keeps a copy of
+every tab in a local SQLite file:
+
+  - a background refresher pulls all tabs in one batched read, hashes each
+    tab, and rewrites only the tables whose contents changed
+  - the fetch_* helpers load their snapshots from SQLite instead of the API
+  - writes go to Google Sheets first and are then applied to the mirror
+
+Each tab becomes one table named after the tab, with one TEXT column per header
+cell plus "_row" (the 1-based sheet row number), so the data can be queried
+directly, e.g.
+
+    SELECT f."Name", COUNT(*) FROM "Check-ins" c
+    JOIN "Fellows" f ON f."ID" = c."Fellow ID"
+    GROUP BY f."Name"
+
+Bookkeeping lives in "_mirror_tabs" (original header, content digest and last
+refresh time per tab). This module does NOT depend on Streamlit or gspread.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier (tab and header names contain spaces and dashes)."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _digest(grid: list[list]) -> str:
+    return hashlib.sha256(json.dumps(grid, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _column_names(header: list[str]) -> list[str]:
+    """Unique, non-empty SQL column names for a header row (blank cells become col_<n>)."""
+    names, seen = [], set()
+    for i, cell in enumerate(header, start=1):
+        name = str(cell).strip() or f"col_{i}"
+        base, n = name, 2
+        while name in seen or name == "_row":
+            name, n = f"{base}_{n}", n + 1
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+class SheetMirror:
+    """
+    SQLite copy of a set of tabs, safe to share between threads.
+
+    Writers record a per-tab write mark; a refresh that started before a write
+    leaves that tab alone, so a fetch that raced a write can't roll it back.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS _mirror_tabs ("
+            " tab TEXT PRIMARY KEY, header TEXT NOT NULL, digest TEXT NOT NULL, refreshed_at REAL NOT NULL)"
+        )
+        self._headers: dict[str, list[str]] = {
+            tab: json.loads(header)
+            for tab, header in self._conn.execute("SELECT tab, header FROM _mirror_tabs")
+        }
+        self._write_marks: dict[str, int] = {}
+        self._refresher = None
+        # query() gets its own read-only connection, so ad-hoc SQL can't change the mirror
+        self._read_lock = threading.Lock()
+        self._reader = sqlite3.connect(
+            Path(path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False
+        )
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+
+    def tabs(self) -> list[str]:
+        with self._lock:
+            return list(self._headers)
+
+    def read_grids(self, tabs: list[str]) -> dict[str, list[list]]:
+        """
+        Return {tab: [header, row2, row3, ...]} for the requested tabs that are
+        mirrored. Grid index i is always sheet row i + 1: gaps in _row (e.g. an
+        append beyond the last mirrored row) are filled with blank rows.
+        """
+        grids = {}
+        with self._lock:
+            for tab in tabs:
+                header = self._headers.get(tab)
+                if header is None:
+                    continue
+                columns = _column_names(header)
+                blank = [""] * len(columns)
+                select = ", ".join(_quote(c) for c in ["_row"] + columns)
+                grid = [list(header)]
+                for row_num, *cells in self._conn.execute(f"SELECT {select} FROM {_quote(tab)} ORDER BY _row"):
+                    grid.extend(list(blank) for _ in range(row_num - 1 - len(grid)))
+                    grid.append(cells)
+                grids[tab] = grid
+        return grids
+
+    def query(self, sql: str, params=()) -> list[dict]:
+        """Run a read-only SQL query against the mirror and return rows as dicts."""
+        with self._read_lock:
+            cursor = self._reader.execute(sql, params)
+            names = [d[0] for d in cursor.description or ()]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    # ── Refresh ──────────────────────────────────────────────────────────────
+
+    def write_marks(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._write_marks)
+
+    def sync(self, grids: dict[str, list[list]], marks: dict[str, int] = None) -> list[str]:
+        """
+        Store freshly fetched grids, rewriting only tabs whose digest changed.
+        If `marks` (from write_marks() taken before the fetch) is given, tabs
+        written since then are skipped. Returns the tabs that were rewritten.
+        """
+        changed = []
+        with self._lock:
+            for tab, grid in grids.items():
+                if marks is not None and self._write_marks.get(tab, 0) != marks.get(tab, 0):
+                    continue
+                digest = _digest(grid)
+                row = self._conn.execute("SELECT digest FROM _mirror_tabs WHERE tab = ?", (tab,)).fetchone()
+                if row and row[0] == digest:
+                    self._conn.execute("UPDATE _mirror_tabs SET refreshed_at = ? WHERE tab = ?", (time.time(), tab))
+                    continue
+                self._rewrite(tab, grid, digest)
+                changed.append(tab)
+        return changed
+
+    def _rewrite(self, tab: str, grid: list[list], digest: str) -> None:
+        # Caller holds self._lock
+        header = [str(h) for h in grid[0]] if grid else []
+        columns = _column_names(header)
+        width = len(columns)
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute(f"DROP TABLE IF EXISTS {_quote(tab)}")
+            column_defs = "".join(f", {_quote(c)} TEXT" for c in columns)
+            self._conn.execute(f"CREATE TABLE {_quote(tab)} (_row INTEGER PRIMARY KEY{column_defs})")
+            placeholders = ", ".join("?" * (width + 1))
+            self._conn.executemany(
+                f"INSERT INTO {_quote(tab)} VALUES ({placeholders})",
+                ([row_num] + self._fit(cells, width) for row_num, cells in enumerate(grid[1:], start=2)),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO _mirror_tabs (tab, header, digest, refreshed_at) VALUES (?, ?, ?, ?)",
+                (tab, json.dumps(header), digest, time.time()),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._headers[tab] = header
+
+    @staticmethod
+    def _fit(cells: list, width: int) -> list:
+        cells = ["" if c is None else str(c) for c in cells[:width]]
+        return cells + [""] * (width - len(cells))
+
+    def start_refresher(self, fetch, interval: float, on_change=None) -> None:
+        """
+        Start a daemon thread that every `interval` seconds calls fetch() ->
+        {tab: grid}, syncs the result and passes the rewritten tabs to
+        on_change(tabs). Errors are logged and retried on the next tick.
+        """
+        if self._refresher is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(interval)
+                try:
+                    marks = self.write_marks()
+                    changed = self.sync(fetch(), marks)
+                    if changed and on_change:
+                        on_change(changed)
+                except Exception:
+                    log.exception("Mirror refresh failed")
+
+        self._refresher = threading.Thread(target=run, name="sheet-mirror-refresh", daemon=True)
+        self._refresher.start()
+
+    # ── Write-through ────────────────────────────────────────────────────────
+    # Same semantics as the sheet operations: 1-based rows and columns, row 1
+    # is the header, deleting a row moves the rows below it up by one.
+
+    def _mark(self, tab: str) -> None:
+        # Caller holds self._lock. The stored digest no longer describes the
+        # table, so the next refresh rewrites it from the sheet.
+        self._write_marks[tab] = self._write_marks.get(tab, 0) + 1
+        self._conn.execute("UPDATE _mirror_tabs SET digest = '' WHERE tab = ?", (tab,))
+
+    def apply_update(self, tab: str, row_num: int, first_col: int, values: list) -> None:
+        self.apply_updates(tab, [(row_num, first_col, values)])
+
+    def apply_updates(self, tab: str, updates: list[tuple[int, int, list]]) -> None:
+        """Apply several (row, first column, values) cell updates in one transaction."""
+        with self._lock:
+            self._mark(tab)
+            header = self._headers.get(tab)
+            if header is None:
+                return
+            columns = _column_names(header)
+            self._conn.execute("BEGIN")
+            try:
+                for row_num, first_col, values in updates:
+                    pairs = [
+                        (columns[first_col - 1 + i], "" if v is None else str(v))
+                        for i, v in enumerate(values) if first_col - 1 + i < len(columns)
+                    ]
+                    if not pairs:
+                        continue
+                    assignments = ", ".join(f"{_quote(c)} = ?" for c, _ in pairs)
+                    self._conn.execute(
+                        f"UPDATE {_quote(tab)} SET {assignments} WHERE _row = ?",
+                        [v for _, v in pairs] + [row_num],
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def apply_append(self, tab: str, first_row: int, rows: list[list]) -> None:
+        with self._lock:
+            self._mark(tab)
+            header = self._headers.get(tab)
+            if header is None:
+                return
+            width = len(header)
+            placeholders = ", ".join("?" * (width + 1))
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {_quote(tab)} VALUES ({placeholders})",
+                ([first_row + offset] + self._fit(list(cells), width) for offset, cells in enumerate(rows)),
+            )
+
+    def apply_delete(self, tab: str, row_num: int) -> None:
+        with self._lock:
+            self._mark(tab)
+            if tab not in self._headers:
+                return
+            table = _quote(tab)
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(f"DELETE FROM {table} WHERE _row = ?", (row_num,))
+                # Shift in two steps so the primary key never collides mid-update
+                self._conn.execute(f"UPDATE {table} SET _row = -(_row - 1) WHERE _row > ?", (row_num,))
+                self._conn.execute(f"UPDATE {table} SET _row = -_row WHERE _row < 0")
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
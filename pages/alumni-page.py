@@ -1,24 +1,14 @@
 import streamlit as st
 import plotly.graph_objects as go
-from datetime import datetime
 from helpers import (
-    fetch_alumni, create_alumni, update_alumni,
-    calculate_days_since
+    fetch_alumni, fetch_alumnus, create_alumni, update_alumni,
+    calculate_days_since, parse_date_value, cohort_options, filter_selection, search_tab, ALUMNI_CARDS,
+    alumni_type_label,
 )
+from facets import Facet, facet, count_label
+from grid import card_grid
 from styles import get_css
 
-def _cohort_sort_key(cohort_str: str) -> datetime:
-    """Parse a cohort string into a datetime for correct chronological sorting.
-    Handles 'January 2025' (month-year) and '2025' (year-only) formats."""
-    if not cohort_str:
-        return datetime.min
-    for fmt in ("%B %Y", "%b %Y", "%Y"):
-        try:
-            return datetime.strptime(cohort_str.strip(), fmt)
-        except ValueError:
-            continue
-    return datetime.min
-
 # ============ AUTH GUARD ============
 if not st.session_state.get("authenticated"):
     st.warning("Please log in first.")
@@ -117,11 +107,12 @@ def main():
 
     # Fetch data
     with st.spinner("Loading alumni..."):
-        alumni_list = fetch_alumni()
+        alumni_list = fetch_alumni(view="card")
 
     # Show modal if an alumni is selected AND trigger is True
     if st.session_state.alumni_modal_id and st.session_state.alumni_trigger_modal:
-        selected_alumni = next((a for a in alumni_list if a["id"] == st.session_state.alumni_modal_id), None)
+        # Cards only carry the card columns; the modal needs the full record
+        selected_alumni = fetch_alumnus(st.session_state.alumni_modal_id)
         if selected_alumni:
             show_alumni_modal(selected_alumni)
         st.session_state.alumni_trigger_modal = False
@@ -143,12 +134,45 @@ def main():
 
 def show_all_alumni_tab(alumni_list):
     """Render the main alumni list with stats, charts, filters, and cards."""
+    # Filter selections come from session state so the dropdowns below can
+    # show live counts; one facet() pass filters, counts and tallies.
+    fellow_type_options = ["All Types", "Congressional Innovation Fellow", "Senior Congressional Innovation Fellow", "Congressional Innovation Scholar", "Congressional Digital Service Fellow", "AI Security Fellow"]
+    sector_options = ["All Sectors", "Government", "Nonprofit/Think Tank", "Academia", "Private", "Policy/Think Tank"]
+    party_options = ["All Parties", "Democrat", "Republican", "Independent", "Institutional Office"]
+    chamber_options = ["All Chambers", "Senate", "House", "Executive Branch"]
+    cohort_filter_options = ["All Cohorts"] + cohort_options(alumni_list)
+
+    search = st.session_state.get("alumni_search", "")
+    search_rank = search_tab(ALUMNI_CARDS, search) if search else None   # name, role, office, cohort words and prefixes
+    facets = facet(
+        alumni_list,
+        {
+            "type":    Facet(lambda a: a.get("fellow_types") or (), multi=True),
+            "sector":  Facet(lambda a: a.get("sector")),
+            "party":   Facet(lambda a: a.get("party")),
+            "chamber": Facet(lambda a: a.get("chamber")),
+            "cohort":  Facet(lambda a: a.get("cohort")),
+            # chart tallies only
+            "chart_party": Facet(lambda a: [p.strip() for p in (a.get("party") or "").split(",") if p.strip()], multi=True),
+            "chart_type":  Facet(lambda a: [alumni_type_label(ft.strip()) for ft in (a.get("fellow_types") or [])], multi=True),
+        },
+        {
+            "type":    filter_selection("alumni_type", fellow_type_options),
+            "sector":  filter_selection("alumni_sector", sector_options),
+            "party":   filter_selection("alumni_party", party_options),
+            "chamber": filter_selection("alumni_chamber", chamber_options),
+            "cohort":  filter_selection("alumni_cohort", cohort_filter_options),
+        },
+        where=(lambda a: a["id"] in search_rank) if search else None,
+    )
+
     # Calculate stats
-    total = len(alumni_list)
-    govt = len([a for a in alumni_list if a.get("sector") == "Government"])
-    private = len([a for a in alumni_list if a.get("sector") == "Private"])
-    nonprofit = len([a for a in alumni_list if a.get("sector") == "Nonprofit/Think Tank"])
-    academia = len([a for a in alumni_list if a.get("sector") == "Academia"])
+    sector_totals = facets.totals["sector"]
+    total = facets.scope_count
+    govt = sector_totals["Government"]
+    private = sector_totals["Private"]
+    nonprofit = sector_totals["Nonprofit/Think Tank"]
+    academia = sector_totals["Academia"]
 
     # Stats row
     st.markdown("---")
@@ -206,32 +230,12 @@ def show_all_alumni_tab(alumni_list):
             )
         return fig
 
-    # Build data from live alumni list
-    party_counts = {}
-    type_counts = {}
+    # Build data from the alumni tallies
+    party_counts = facets.totals["chart_party"]
+    type_counts = facets.totals["chart_type"]
     sector_counts = {}
-
-    for a in alumni_list:
-        raw_party = a.get("party") or ""
-        for p in [x.strip() for x in raw_party.split(",") if x.strip()]:
-            party_counts[p] = party_counts.get(p, 0) + 1
-
-        for ft in (a.get("fellow_types") or []):
-            ft = ft.strip()
-            if "Senior" in ft:
-                label = "Senior CIF"
-            elif "AI Security" in ft:
-                label = "AISF"
-            elif "Scholar" in ft:
-                label = "CIS"
-            elif "Digital Service" in ft:
-                label = "CDSF"
-            else:
-                label = "CIF"
-            type_counts[label] = type_counts.get(label, 0) + 1
-
-        s = a.get("sector") or "Unknown"
-        sector_counts[s] = sector_counts.get(s, 0) + 1
+    for s, n in sector_totals.items():
+        sector_counts[s or "Unknown"] = sector_counts.get(s or "Unknown", 0) + n
 
     PARTY_COLORS = {
         "Democrat": "#3b82f6", "Republican": "#ef4444",
@@ -277,61 +281,42 @@ def show_all_alumni_tab(alumni_list):
     with st.expander("Filters", expanded=True):
         col1, col2, col3, col4, col5 = st.columns(5)
 
+        counts, pool = facets.counts, facets.pool
         with col1:
-            search = st.text_input("Search", placeholder="Name, org, or office...")
+            st.text_input("Search", placeholder="Name, org, or office...", key="alumni_search")
         with col2:
-            fellow_type_options = ["All Types", "Congressional Innovation Fellow", "Senior Congressional Innovation Fellow", "Congressional Innovation Scholar", "Congressional Digital Service Fellow", "AI Security Fellow"]
-            fellow_type_filter = st.selectbox("Fellow Type", fellow_type_options)
+            st.selectbox("Fellow Type", fellow_type_options, key="alumni_type",
+                         format_func=count_label(counts["type"], "All Types", pool["type"]))
         with col3:
-            sector_options = ["All Sectors", "Government", "Nonprofit/Think Tank", "Academia", "Private", "Policy/Think Tank"]
-            sector_filter = st.selectbox("Sector", sector_options)
+            st.selectbox("Sector", sector_options, key="alumni_sector",
+                         format_func=count_label(counts["sector"], "All Sectors", pool["sector"]))
         with col4:
-            party_options = ["All Parties", "Democrat", "Republican", "Independent", "Institutional Office"]
-            party_filter = st.selectbox("Party", party_options)
+            st.selectbox("Party", party_options, key="alumni_party",
+                         format_func=count_label(counts["party"], "All Parties", pool["party"]))
         with col5:
-            chamber_options = ["All Chambers", "Senate", "House", "Executive Branch"]
-            chamber_filter = st.selectbox("Chamber", chamber_options)
+            st.selectbox("Chamber", chamber_options, key="alumni_chamber",
+                         format_func=count_label(counts["chamber"], "All Chambers", pool["chamber"]))
 
         # Cohort filter + Sort
         col1, col2 = st.columns(2)
         with col1:
-            cohorts = sorted(set([a["cohort"] for a in alumni_list if a.get("cohort")]), key=_cohort_sort_key, reverse=True)
-            cohort_options = ["All Cohorts"] + cohorts
-            cohort_filter = st.selectbox("Cohort", cohort_options)
+            st.selectbox("Cohort", cohort_filter_options, key="alumni_cohort",
+                         format_func=count_label(counts["cohort"], "All Cohorts", pool["cohort"]))
         with col2:
             sort_options = ["Cohort (newest first)", "Cohort (oldest first)", "Name (A-Z)", "Name (Z-A)", "Last Engaged (oldest first)", "Last Engaged (newest first)", "Current Role (A-Z)", "Sector"]
+            if search:
+                sort_options = ["Best match"] + sort_options
             sort_by = st.selectbox("Sort by", sort_options, index=0)
 
-    # Apply filters
-    filtered = alumni_list.copy()
-
-    if search:
-        search_lower = search.lower()
-        filtered = [a for a in filtered if
-            search_lower in a["name"].lower() or
-            search_lower in (a.get("office_served") or "").lower() or
-            search_lower in (a.get("current_role") or "").lower()]
-
-    if fellow_type_filter != "All Types":
-        filtered = [a for a in filtered if fellow_type_filter in (a.get("fellow_types") or [])]
-
-    if sector_filter != "All Sectors":
-        filtered = [a for a in filtered if a.get("sector") == sector_filter]
-
-    if party_filter != "All Parties":
-        filtered = [a for a in filtered if a.get("party") == party_filter]
-
-    if chamber_filter != "All Chambers":
-        filtered = [a for a in filtered if a.get("chamber") == chamber_filter]
-
-    if cohort_filter != "All Cohorts":
-        filtered = [a for a in filtered if a.get("cohort") == cohort_filter]
+    filtered = facets.records
 
     # Sort
-    if sort_by == "Cohort (newest first)":
-        filtered.sort(key=lambda a: _cohort_sort_key(a.get("cohort") or ""), reverse=True)
+    if sort_by == "Best match":
+        filtered.sort(key=lambda a: search_rank[a["id"]])
+    elif sort_by == "Cohort (newest first)":
+        filtered.sort(key=lambda a: a["cohort_key"], reverse=True)
     elif sort_by == "Cohort (oldest first)":
-        filtered.sort(key=lambda a: _cohort_sort_key(a.get("cohort") or ""))
+        filtered.sort(key=lambda a: a["cohort_key"])
     elif sort_by == "Name (A-Z)":
         filtered.sort(key=lambda a: a["name"].lower())
     elif sort_by == "Name (Z-A)":
@@ -352,11 +337,8 @@ def show_all_alumni_tab(alumni_list):
     if st.session_state.alumni_show_add_form or st.session_state.alumni_editing:
         show_alumni_form()
 
-    # Display alumni in cards
-    cols = st.columns(3)
-    for idx, alumni in enumerate(filtered):
-        with cols[idx % 3]:
-            show_alumni_card(alumni)
+    # Display alumni in cards, one page at a time
+    card_grid(filtered, show_alumni_card, key="alumni_grid")
 
 
 def show_on_the_hill_tab(alumni_list):
@@ -396,13 +378,14 @@ def show_on_the_hill_tab(alumni_list):
     with col_party:
         hill_party = st.selectbox("Party", ["All Parties", "Democrat", "Republican", "Independent", "Institutional Office"], key="hill_party")
     with col_cohort:
-        cohorts = sorted(set(a["cohort"] for a in on_hill if a.get("cohort")), key=_cohort_sort_key, reverse=True)
-        hill_cohort = st.selectbox("Cohort", ["All Cohorts"] + cohorts, key="hill_cohort")
+        hill_cohort = st.selectbox("Cohort", ["All Cohorts"] + cohort_options(on_hill), key="hill_cohort")
+
+    hill_rank = search_tab(ALUMNI_CARDS, hill_search) if hill_search else {}
 
     def _apply_hill_filters(group):
         if hill_search:
-            sl = hill_search.lower()
-            group = [a for a in group if sl in a["name"].lower() or sl in (a.get("current_role") or "").lower()]
+            group = [a for a in group if a["id"] in hill_rank]
+            group.sort(key=lambda a: hill_rank[a["id"]])
         if hill_party != "All Parties":
             group = [a for a in group if a.get("party") == hill_party]
         if hill_cohort != "All Cohorts":
@@ -511,7 +494,7 @@ def show_alumni_card(alumni, key_prefix=""):
             st.rerun()
     with col2:
         if st.button("Edit", key=f"{key_prefix}alumni_edit_{alumni['id']}", use_container_width=True):
-            st.session_state.alumni_editing = alumni
+            st.session_state.alumni_editing = fetch_alumnus(alumni["id"])
             st.session_state.alumni_show_add_form = False
             st.rerun()
 
@@ -623,7 +606,7 @@ def show_alumni_modal(alumni):
 
     with tab_engagement:
         if alumni.get("last_engaged"):
-            days_ago = calculate_days_since(alumni["last_engaged"])
+            days_ago = calculate_days_since(alumni["last_engaged_dt"])
             st.markdown(f"**Last Engaged:** {alumni['last_engaged']} _{days_ago} days ago_")
         else:
             st.caption("No engagement date recorded.")
@@ -724,7 +707,7 @@ def show_alumni_form():
         # Engagement
         last_engaged = st.date_input(
             "Last Engaged",
-            value=datetime.strptime(alumni["last_engaged"], "%Y-%m-%d") if alumni.get("last_engaged") else None,
+            value=parse_date_value(alumni.get("last_engaged")),
             format="YYYY-MM-DD"
         )
         engagement_notes = st.text_area("Engagement Notes", value=alumni.get("engagement_notes", ""))
@@ -1,16 +1,20 @@
 import streamlit as st
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime
 from styles import get_css
+from facets import Facet, facet, count_label
+from grid import card_grid
 from helpers import (
-    fetch_fellows, create_fellow, update_fellow, update_fellow_checkin,
+    fetch_fellow, create_fellow, update_fellow, update_fellow_checkin,
     fetch_checkins, add_checkin, delete_checkin,
     fetch_status_reports, add_status_report, update_status_report,
-    get_required_report_months, calculate_report_streak,
-    calculate_days_since, calculate_days_until, GOOGLE_SHEET_URL,
+    get_required_report_months, calculate_report_streak, get_report_health,
+    parse_month_label, month_last_day,
+    parse_date_value, GOOGLE_SHEET_URL,
     FORM_RESPONSES_URL,
-    fetch_events, fetch_all_event_attendance, get_quarter_compliance,
-    _date_to_quarter, _is_tracked_cohort,
+    get_attendance_index, search_tab,
+    _date_to_quarter, cohort_options, filter_selection,
+    fetch_tabs, FELLOW_CARDS, CHECKINS_SHEET, REPORTS_SHEET, EVENTS_SHEET, EVENT_ATTENDANCE_SHEET,
     create_alumni,
 )
 
@@ -25,30 +29,12 @@ EVENT_TYPE_COLORS = {
     "Recruitment":       {"bg": "#f3f4f6", "text": "#374151", "dot": "#6b7280"},
 }
 
-def _cohort_sort_key(cohort_str: str) -> datetime:
-    """Parse a cohort string into a datetime for correct chronological sorting.
-    Handles 'January 2025' (month-year) and '2025' (year-only) formats."""
-    if not cohort_str:
-        return datetime.min
-    for fmt in ("%B %Y", "%b %Y", "%Y"):
-        try:
-            return datetime.strptime(cohort_str.strip(), fmt)
-        except ValueError:
-            continue
-    return datetime.min
-
-
-def _parse_date_value(date_str):
-    """Parse a date string from Google Sheets into a Python date object.
-    Returns None if the string is empty or unparseable."""
-    if not date_str:
-        return None
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%-m/%-d/%Y", "%m/%d/%y", "%-m/%-d/%y"):
-        try:
-            return datetime.strptime(str(date_str).strip(), fmt).date()
-        except ValueError:
-            continue
-    return None
+# Fellow type badge colours (background, text), keyed by fellow["type_label"]
+TYPE_BADGE_COLORS = {
+    "Senior CIF": ("#6366f1", "#ffffff"),
+    "AISF":       ("#0891b2", "#ffffff"),
+    "CIF":        ("#93c5fd", "#1e40af"),
+}
 
 # ============ AUTH GUARD ============
 if not st.session_state.get("authenticated"):
@@ -97,13 +83,15 @@ def main():
             st.session_state.editing_fellow = None
             st.rerun()
 
-    # Fetch data
+    # Fetch data (fellow card columns and status reports in one batched read)
     with st.spinner("Loading fellows..."):
-        fellows = fetch_fellows()
+        fellows = fetch_tabs(FELLOW_CARDS, REPORTS_SHEET)[FELLOW_CARDS]
+        report_health = get_report_health(fellows)
 
     # Show modal if a fellow is selected AND trigger_modal is True
     if st.session_state.modal_fellow_id and st.session_state.trigger_modal:
-        selected_fellow = next((f for f in fellows if f["id"] == st.session_state.modal_fellow_id), None)
+        # Cards only carry the card columns; the modal needs the full record
+        selected_fellow = fetch_fellow(st.session_state.modal_fellow_id)
         if selected_fellow:
             show_fellow_modal(selected_fellow)
         # Reset trigger after showing modal
@@ -123,14 +111,58 @@ def main():
 
     # Exclude withdrawn/alumni fellows from stats and default view
     INACTIVE_STATUSES = ["Withdrew", "Alumni"]
-    active_fellows = [f for f in fellows if f["status"] not in INACTIVE_STATUSES]
+
+    # Filter selections come from session state so the dropdowns below can
+    # show live counts; one facet() pass filters, counts and tallies.
+    status_options = ["All Active", "Active", "Flagged", "Ending Soon", "Withdrew"]
+    fellow_type_options = ["All Types", "Senior Congressional Innovation Fellow", "Congressional Innovation Fellow", "AI Security Fellow"]
+    party_options = ["All Parties", "Democrat", "Republican", "Independent", "Institutional Office"]
+    chamber_options = ["All Chambers", "Senate", "House"]
+    cohort_filter_options = ["All Cohorts"] + cohort_options(fellows)
+    report_options = ["All Reports", "Gift Card Earned", "At Risk", "Reimbursements Paused"]
+    report_flags = {
+        "Gift Card Earned": "gift_card_eligible",
+        "At Risk": "at_risk",
+        "Reimbursements Paused": "reimbursements_paused",
+    }
+
+    search = st.session_state.get("fellows_search", "")
+    search_rank = search_tab(FELLOW_CARDS, search) if search else None   # name, office, cohort words and prefixes
+    facets = facet(
+        fellows,
+        {
+            # "All Active" is a status value of its own, so it gets a count too
+            "status":  Facet(lambda f: (f["status"],) if f["status"] in INACTIVE_STATUSES else (f["status"], "All Active"), multi=True),
+            "type":    Facet(lambda f: f["fellow_type"]),
+            "party":   Facet(lambda f: f["party"]),
+            "chamber": Facet(lambda f: f["chamber"]),
+            "cohort":  Facet(lambda f: f["cohort"]),
+            "report":  Facet(lambda f: [label for label, flag in report_flags.items()
+                                        if report_health.get(f["id"], {}).get(flag)], multi=True),
+            # chart and metric tallies only
+            "chart_chamber": Facet(lambda f: "Executive Branch" if f["is_aisf"] else (f.get("chamber") or "Unknown")),
+            "chart_type":    Facet(lambda f: f["type_label"] or "Unknown"),
+            "needs_checkin": Facet(lambda f: f["needs_checkin"]),
+        },
+        {
+            "status":  filter_selection("fellows_status", status_options, has_all=False),
+            "type":    filter_selection("fellows_type", fellow_type_options),
+            "party":   filter_selection("fellows_party", party_options),
+            "chamber": filter_selection("fellows_chamber", chamber_options),
+            "cohort":  filter_selection("fellows_cohort", cohort_filter_options),
+            "report":  filter_selection("fellows_report", report_options),
+        },
+        where=(lambda f: f["id"] in search_rank) if search else None,
+        scope=lambda f: f["status"] not in INACTIVE_STATUSES,
+    )
 
     # Calculate stats (active fellows only)
-    total = len(active_fellows)
-    on_track = len([f for f in active_fellows if f["status"] in ["on-track", "Active"]])
-    flagged = len([f for f in active_fellows if f["status"] in ["flagged", "Flagged"]])
-    ending_soon = len([f for f in active_fellows if f["status"] in ["ending-soon", "Ending Soon"]])
-    needs_checkin = len([f for f in active_fellows if calculate_days_since(f["last_check_in"]) > 210 and f["status"] in ["on-track", "Active"] and "AI Security" not in (f.get("fellow_type") or "")])
+    status_totals = facets.totals["status"]
+    total = facets.scope_count
+    on_track = status_totals["on-track"] + status_totals["Active"]
+    flagged = status_totals["flagged"] + status_totals["Flagged"]
+    ending_soon = status_totals["ending-soon"] + status_totals["Ending Soon"]
+    needs_checkin = facets.totals["needs_checkin"][True]
 
     # Stats row
     st.markdown("---")
@@ -178,28 +210,10 @@ def main():
         )
         return fig
 
-    # Build data from live fellows list
-    party_counts = {}
-    chamber_counts = {}
-    type_counts = {}
-
-    for f in active_fellows:
-        p = f.get("party")
-        if p:  # skip fellows with no party (e.g. AISF)
-            party_counts[p] = party_counts.get(p, 0) + 1
-
-        is_aisf_fellow = "AI Security" in (f.get("fellow_type") or "")
-        c = "Executive Branch" if is_aisf_fellow else (f.get("chamber") or "Unknown")
-        chamber_counts[c] = chamber_counts.get(c, 0) + 1
-
-        ft = f.get("fellow_type") or "Unknown"
-        if "Senior" in ft:
-            ft = "Senior CIF"
-        elif "AI Security" in ft:
-            ft = "AISF"
-        elif ft != "Unknown":
-            ft = "CIF"
-        type_counts[ft] = type_counts.get(ft, 0) + 1
+    # Build data from the active fellows' tallies
+    party_counts = {p: n for p, n in facets.totals["party"].items() if p}   # skip fellows with no party (e.g. AISF)
+    chamber_counts = facets.totals["chart_chamber"]
+    type_counts = facets.totals["chart_type"]
 
     PARTY_COLORS = {
         "Democrat": "#3b82f6",
@@ -240,63 +254,45 @@ def main():
     with st.expander("Filters", expanded=True):
         col1, col2, col3, col4, col5 = st.columns(5)
 
+        counts, pool = facets.counts, facets.pool
         with col1:
-            search = st.text_input("Search", placeholder="Name or office...")
+            st.text_input("Search", placeholder="Name or office...", key="fellows_search")
         with col2:
-            status_options = ["All Active", "Active", "Flagged", "Ending Soon", "Withdrew"]
-            status_filter = st.selectbox("Status", status_options)
+            status_filter = st.selectbox("Status", status_options, key="fellows_status",
+                                         format_func=count_label(counts["status"]))
         with col3:
-            fellow_type_options = ["All Types", "Senior Congressional Innovation Fellow", "Congressional Innovation Fellow", "AI Security Fellow"]
-            fellow_type_filter = st.selectbox("Fellow Type", fellow_type_options)
+            st.selectbox("Fellow Type", fellow_type_options, key="fellows_type",
+                         format_func=count_label(counts["type"], "All Types", pool["type"]))
         with col4:
-            party_options = ["All Parties", "Democrat", "Republican", "Independent", "Institutional Office"]
-            party_filter = st.selectbox("Party", party_options)
+            st.selectbox("Party", party_options, key="fellows_party",
+                         format_func=count_label(counts["party"], "All Parties", pool["party"]))
         with col5:
-            chamber_options = ["All Chambers", "Senate", "House"]
-            chamber_filter = st.selectbox("Chamber", chamber_options)
+            st.selectbox("Chamber", chamber_options, key="fellows_chamber",
+                         format_func=count_label(counts["chamber"], "All Chambers", pool["chamber"]))
 
-        # Cohort filter
-        col1, col2 = st.columns(2)
+        # Cohort / report filters
+        col1, col2, col3 = st.columns(3)
         with col1:
-            cohorts = sorted(set([f["cohort"] for f in fellows if f["cohort"]]), key=_cohort_sort_key, reverse=True)
-            cohort_options = ["All Cohorts"] + cohorts
-            cohort_filter = st.selectbox("Cohort", cohort_options)
+            st.selectbox("Cohort", cohort_filter_options, key="fellows_cohort",
+                         format_func=count_label(counts["cohort"], "All Cohorts", pool["cohort"]))
         with col2:
+            st.selectbox("Status Reports", report_options, key="fellows_report",
+                         format_func=count_label(counts["report"], "All Reports", pool["report"]))
+        with col3:
             sort_options = ["Priority (Flagged first)", "Name (A-Z)", "Name (Z-A)", "Last Check-in (oldest first)", "Last Check-in (newest first)", "End Date (soonest first)", "End Date (latest first)", "Cohort (newest first)", "Cohort (oldest first)"]
-            sort_by = st.selectbox("Sort by", sort_options, index=sort_options.index("Cohort (newest first)"))
-
-    # Apply filters — base list depends on status filter
-    if status_filter == "All Active":
-        filtered_fellows = active_fellows.copy()
-    elif status_filter == "Withdrew":
-        filtered_fellows = [f for f in fellows if f["status"] == "Withdrew"]
-    else:
-        filtered_fellows = [f for f in active_fellows if f["status"] == status_filter]
-
-    if search:
-        search_lower = search.lower()
-        filtered_fellows = [f for f in filtered_fellows if
-            search_lower in f["name"].lower() or
-            search_lower in f["office"].lower()]
-
-    if fellow_type_filter != "All Types":
-        filtered_fellows = [f for f in filtered_fellows if f["fellow_type"] == fellow_type_filter]
+            if search:
+                sort_options = ["Best match"] + sort_options
+            sort_by = st.selectbox("Sort by", sort_options, index=0 if search else sort_options.index("Cohort (newest first)"))
 
-    if party_filter != "All Parties":
-        filtered_fellows = [f for f in filtered_fellows if f["party"] == party_filter]
-
-    if chamber_filter != "All Chambers":
-        filtered_fellows = [f for f in filtered_fellows if f["chamber"] == chamber_filter]
-
-    if cohort_filter != "All Cohorts":
-        filtered_fellows = [f for f in filtered_fellows if f["cohort"] == cohort_filter]
+    filtered_fellows = facets.records
 
     # Sort based on selected option
-    if sort_by == "Priority (Flagged first)":
+    if sort_by == "Best match":
+        filtered_fellows.sort(key=lambda f: search_rank[f["id"]])
+    elif sort_by == "Priority (Flagged first)":
         def sort_key(f):
             status_priority = {"flagged": 0, "Flagged": 0, "ending-soon": 1, "Ending Soon": 1, "on-track": 2, "Active": 2, "Withdrew": 4}.get(f["status"], 3)
-            days_since = calculate_days_since(f["last_check_in"])
-            return (status_priority, -days_since)
+            return (status_priority, -f["days_since_checkin"])
         filtered_fellows.sort(key=sort_key)
     elif sort_by == "Name (A-Z)":
         filtered_fellows.sort(key=lambda f: f["name"].lower())
@@ -307,13 +303,13 @@ def main():
     elif sort_by == "Last Check-in (newest first)":
         filtered_fellows.sort(key=lambda f: f["last_check_in"] or "0000-00-00", reverse=True)
     elif sort_by == "End Date (soonest first)":
-        filtered_fellows.sort(key=lambda f: f["end_date"] or "9999-99-99")
+        filtered_fellows.sort(key=lambda f: f["days_until_end"] if f["days_until_end"] is not None else float("inf"))
     elif sort_by == "End Date (latest first)":
-        filtered_fellows.sort(key=lambda f: f["end_date"] or "0000-00-00", reverse=True)
+        filtered_fellows.sort(key=lambda f: f["days_until_end"] if f["days_until_end"] is not None else float("-inf"), reverse=True)
     elif sort_by == "Cohort (newest first)":
-        filtered_fellows.sort(key=lambda f: _cohort_sort_key(f.get("cohort") or ""), reverse=True)
+        filtered_fellows.sort(key=lambda f: f["cohort_key"], reverse=True)
     elif sort_by == "Cohort (oldest first)":
-        filtered_fellows.sort(key=lambda f: _cohort_sort_key(f.get("cohort") or ""))
+        filtered_fellows.sort(key=lambda f: f["cohort_key"])
 
     # Show count
     if status_filter == "Withdrew":
@@ -325,18 +321,16 @@ def main():
     if st.session_state.show_add_form or st.session_state.editing_fellow:
         show_fellow_form()
 
-    # Display fellows in cards
-    cols = st.columns(3)
-    for idx, fellow in enumerate(filtered_fellows):
-        with cols[idx % 3]:
-            show_fellow_card(fellow)
+    # Display fellows in cards, one page at a time
+    card_grid(filtered_fellows, lambda fellow: show_fellow_card(fellow, report_health.get(fellow["id"])),
+              key="fellows_grid")
 
 
-def show_fellow_card(fellow):
-    """Display a fellow card (collapsed view only - modal handles expanded view)"""
-    days_since_checkin = calculate_days_since(fellow["last_check_in"])
-    is_aisf = "AI Security" in (fellow.get("fellow_type") or "")
-    needs_checkin = days_since_checkin > 210 and fellow["status"] in ["on-track", "Active"] and not is_aisf
+def show_fellow_card(fellow, report_info=None):
+    """Display a fellow card (collapsed view only - modal handles expanded view).
+    report_info is the fellow's entry from get_report_health(), if they file reports."""
+    is_aisf = fellow["is_aisf"]
+    needs_checkin = fellow["needs_checkin"]
 
     # Status badge colors
     status_colors = {
@@ -352,28 +346,23 @@ def show_fellow_card(fellow):
     bg_color, text_color = status_colors.get(fellow["status"], ("#4ade80", "#166534"))
 
     # Fellow type badge
-    type_label = ""
-    type_bg = ""
-    type_text = "#ffffff"
-    if fellow["fellow_type"]:
-        if "Senior" in fellow["fellow_type"]:
-            type_label = "Senior CIF"
-            type_bg = "#6366f1"
-            type_text = "#ffffff"
-        elif "AI Security" in fellow["fellow_type"]:
-            type_label = "AISF"
-            type_bg = "#0891b2"
-            type_text = "#ffffff"
-        else:
-            type_label = "CIF"
-            type_bg = "#93c5fd"
-            type_text = "#1e40af"
+    type_label = fellow["type_label"]
+    type_bg, type_text = TYPE_BADGE_COLORS.get(type_label, ("", "#ffffff"))
 
     # Build badge HTML
     checkin_badge = ""
     if needs_checkin:
         checkin_badge = '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#eab308;color:#ffffff;margin-left:0.25rem;">Needs Check-in</span>'
 
+    report_badge = ""
+    if report_info:
+        if report_info["reimbursements_paused"]:
+            report_badge = '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#ef4444;color:#ffffff;margin-left:0.25rem;">🚫 Reimbursements Paused</span>'
+        elif report_info["at_risk"]:
+            report_badge = '<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#eab308;color:#ffffff;margin-left:0.25rem;">⚠️ Report At Risk</span>'
+        elif report_info["streak"] > 0:
+            report_badge = f'<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:#f97316;color:#ffffff;margin-left:0.25rem;">🔥 Streak: {report_info["streak"]}</span>'
+
     type_html = ""
     if type_label:
         type_html = f'<span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:{type_bg};color:{type_text};margin-right:0.25rem;">{type_label}</span>'
@@ -404,7 +393,7 @@ def show_fellow_card(fellow):
     if fellow["last_check_in"]:
         checkin_html = f'<div style="color:var(--tc-text2);font-size:0.8rem;">Last check-in: {fellow["last_check_in"]}</div>'
 
-    card_html = f'<div style="background:var(--tc-surface);padding:1.25rem;border-radius:0.75rem;border:1px solid var(--tc-border);margin-bottom:1rem;box-shadow:0 1px 3px var(--tc-shadow);display:flex;flex-direction:column;min-height:240px;"><div style="font-weight:600;font-size:1.1rem;margin-bottom:0.25rem;color:var(--tc-text);">{fellow["name"]}</div><div style="color:var(--tc-text2);font-size:0.875rem;margin-bottom:0.75rem;">Cohort: {fellow["cohort"]}</div><div style="margin-bottom:0.5rem;"><span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:{bg_color};color:{text_color};">{status_label}</span>{checkin_badge}</div><div style="margin-bottom:0.5rem;">{type_html}{party_html}</div><div style="margin-top:auto;">{office_html}{term_html}{checkin_html}</div></div>'
+    card_html = f'<div style="background:var(--tc-surface);padding:1.25rem;border-radius:0.75rem;border:1px solid var(--tc-border);margin-bottom:1rem;box-shadow:0 1px 3px var(--tc-shadow);display:flex;flex-direction:column;min-height:240px;"><div style="font-weight:600;font-size:1.1rem;margin-bottom:0.25rem;color:var(--tc-text);">{fellow["name"]}</div><div style="color:var(--tc-text2);font-size:0.875rem;margin-bottom:0.75rem;">Cohort: {fellow["cohort"]}</div><div style="margin-bottom:0.5rem;"><span style="display:inline-block;padding:0.25rem 0.75rem;border-radius:9999px;font-size:0.75rem;font-weight:500;background-color:{bg_color};color:{text_color};">{status_label}</span>{checkin_badge}{report_badge}</div><div style="margin-bottom:0.5rem;">{type_html}{party_html}</div><div style="margin-top:auto;">{office_html}{term_html}{checkin_html}</div></div>'
 
     st.markdown(card_html, unsafe_allow_html=True)
 
@@ -417,7 +406,7 @@ def show_fellow_card(fellow):
             st.rerun()
     with col2:
         if st.button("Edit", key=f"edit_{fellow['id']}", use_container_width=True):
-            st.session_state.editing_fellow = fellow
+            st.session_state.editing_fellow = fetch_fellow(fellow["id"])
             st.session_state.show_add_form = False
             st.rerun()
 
@@ -425,9 +414,9 @@ def show_fellow_card(fellow):
 @st.dialog("Fellow Details", width="large")
 def show_fellow_modal(fellow):
     """Display fellow details in a modal dialog with tab navigation"""
-    days_since_checkin = calculate_days_since(fellow["last_check_in"])
-    is_aisf = "AI Security" in (fellow.get("fellow_type") or "")
-    needs_checkin = days_since_checkin > 210 and fellow["status"] in ["on-track", "Active"] and not is_aisf
+    days_since_checkin = fellow["days_since_checkin"]
+    is_aisf = fellow["is_aisf"]
+    needs_checkin = fellow["needs_checkin"]
 
     # Status badge colors
     status_colors = {
@@ -443,22 +432,8 @@ def show_fellow_modal(fellow):
     bg_color, text_color = status_colors.get(fellow["status"], ("#4ade80", "#166534"))
 
     # Fellow type badge
-    type_label = ""
-    type_bg = ""
-    type_text = "#ffffff"
-    if fellow["fellow_type"]:
-        if "Senior" in fellow["fellow_type"]:
-            type_label = "Senior CIF"
-            type_bg = "#6366f1"
-            type_text = "#ffffff"
-        elif "AI Security" in fellow["fellow_type"]:
-            type_label = "AISF"
-            type_bg = "#0891b2"
-            type_text = "#ffffff"
-        else:
-            type_label = "CIF"
-            type_bg = "#93c5fd"
-            type_text = "#1e40af"
+    type_label = fellow["type_label"]
+    type_bg, type_text = TYPE_BADGE_COLORS.get(type_label, ("", "#ffffff"))
 
     # Build badge HTML
     checkin_badge = ""
@@ -490,6 +465,9 @@ def show_fellow_modal(fellow):
     st.markdown(f'<div style="margin-bottom:1rem;">{badges_html}</div>', unsafe_allow_html=True)
 
     # ── Tab navigation ──────────────────────────────────────────────────────────
+    # Load every tab the modal reads in one batched request; the fetch_* calls
+    # below are then served from the cache.
+    fetch_tabs(CHECKINS_SHEET, REPORTS_SHEET, EVENTS_SHEET, EVENT_ATTENDANCE_SHEET)
     checkins = fetch_checkins(fellow["id"])
     checkin_count = len(checkins)
 
@@ -534,7 +512,14 @@ def show_fellow_modal(fellow):
             if fellow["start_date"]:
                 st.markdown(f"**Start Date:** {fellow['start_date']}")
             if fellow["end_date"]:
-                st.markdown(f"**End Date:** {fellow['end_date']}")
+                days_until_end = fellow["days_until_end"]
+                if days_until_end is None:
+                    countdown = ""
+                elif days_until_end >= 0:
+                    countdown = f" ({days_until_end} days left)"
+                else:
+                    countdown = f" (ended {-days_until_end} days ago)"
+                st.markdown(f"**End Date:** {fellow['end_date']}{countdown}")
             if fellow["last_check_in"]:
                 st.markdown(f"**Last Check-in:** {fellow['last_check_in']} ({days_since_checkin} days ago)")
 
@@ -591,14 +576,10 @@ def show_fellow_modal(fellow):
             submitted_months = {r["month"]: r for r in status_reports if r.get("submitted")}
             today = datetime.now()
             for month in required_months:
-                try:
-                    month_date = datetime.strptime(month, "%b %Y")
-                    if month_date.month == 12:
-                        last_day = datetime(month_date.year + 1, 1, 1) - timedelta(days=1)
-                    else:
-                        last_day = datetime(month_date.year, month_date.month + 1, 1) - timedelta(days=1)
-                except:
+                ordinal = parse_month_label(month)
+                if ordinal is None:
                     continue
+                last_day = month_last_day(ordinal)
 
                 is_submitted = month in submitted_months
                 is_overdue = not is_submitted and last_day < today
@@ -713,15 +694,11 @@ def show_fellow_modal(fellow):
 
     # ── Events tab ───────────────────────────────────────────────────────────
     with tab_events:
-        if fellow.get("fellow_type") == "AISF" or not _is_tracked_cohort(fellow.get("cohort", "")):
+        if not fellow["attendance_tracked"]:
             st.caption("Events attendance tracking applies to Jan 2026 CIF/SCIF fellows and future cohorts only.")
         else:
-            all_events = fetch_events()
-            all_attendance = fetch_all_event_attendance()
-            all_fellows = fetch_fellows()
-
-            compliance = get_quarter_compliance([fellow], all_events, all_attendance)
-            qc = compliance.get(fellow["id"], {})
+            index = get_attendance_index()
+            qc = index.quarter_status(fellow["id"])
             quarters = sorted(qc.keys())
 
             # Quarterly compliance pills
@@ -749,20 +726,13 @@ def show_fellow_modal(fellow):
             st.markdown("<div style='margin:0.75rem 0;'></div>", unsafe_allow_html=True)
 
             # Event history
-            fellow_att = {r["event_id"]: r["attended"] for r in all_attendance
-                          if r["fellow_id"] == fellow["id"]}
-            past_events = sorted(
-                [e for e in all_events
-                 if _parse_date_value(e["date"]) and _parse_date_value(e["date"]) < datetime.now().date()],
-                key=lambda e: (_parse_date_value(e["date"]) or datetime.min.date()),
-            )
+            history = index.history(fellow["id"])
 
-            if not past_events:
+            if not history:
                 st.caption("No past events yet.")
             else:
                 st.markdown("**Event History**")
-                for e in past_events:
-                    attended = fellow_att.get(e["id"])
+                for e, attended in history:
                     if attended is None:
                         badge_bg, badge_color, badge_text = "#f3f4f6", "#6b7280", "— No record"
                     elif attended:
@@ -958,19 +928,19 @@ def show_fellow_form():
         with col1:
             start_date = st.date_input(
                 "Start Date",
-                value=_parse_date_value(fellow.get("start_date")),
+                value=parse_date_value(fellow.get("start_date")),
                 format="YYYY-MM-DD"
             )
         with col2:
             end_date = st.date_input(
                 "End Date",
-                value=_parse_date_value(fellow.get("end_date")),
+                value=parse_date_value(fellow.get("end_date")),
                 format="YYYY-MM-DD"
             )
         with col3:
             last_check_in = st.date_input(
                 "Last Check-in",
-                value=_parse_date_value(fellow.get("last_check_in")),
+                value=parse_date_value(fellow.get("last_check_in")),
                 format="YYYY-MM-DD"
             )
 
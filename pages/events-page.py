@@ -1,11 +1,11 @@
 import streamlit as st
-from datetime import datetime, date
+from datetime import date
 from styles import get_css
+from grid import card_grid
 from helpers import (
-    fetch_fellows, fetch_events, add_event, update_event,
-    fetch_all_event_attendance, save_event_attendance_batch,
-    get_quarter_compliance, _date_to_quarter, _is_tracked_cohort,
-    EVENT_TYPES, calculate_days_since,
+    get_events_analytics, search_tab, EVENTS_SHEET, add_event, update_event, save_event_attendance_batch,
+    _date_to_quarter,
+    EVENT_TYPES, parse_date_value,
 )
 
 # ============ AUTH GUARD ============
@@ -41,43 +41,22 @@ TYPE_COLORS = {
 
 # ============ HELPERS ============
 
-def _parse_date_value(date_str):
-    if not date_str:
-        return None
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%-m/%-d/%Y", "%m/%d/%y", "%-m/%-d/%y"):
-        try:
-            return datetime.strptime(str(date_str).strip(), fmt).date()
-        except ValueError:
-            continue
-    return None
-
-
-def _is_past(date_str: str) -> bool:
-    d = _parse_date_value(date_str)
-    return d is not None and d < date.today()
-
-
-def _is_upcoming(date_str: str) -> bool:
-    d = _parse_date_value(date_str)
-    return d is not None and d >= date.today()
-
-
 def _fmt_date(date_str: str) -> str:
-    d = _parse_date_value(date_str)
+    d = parse_date_value(date_str)
     if not d:
         return date_str
     return d.strftime("%b %-d, %Y")
 
 
 def _fmt_date_long(date_str: str) -> str:
-    d = _parse_date_value(date_str)
+    d = parse_date_value(date_str)
     if not d:
         return date_str
     return d.strftime("%a, %B %-d, %Y")
 
 
 def _event_status(date_str: str) -> str:
-    d = _parse_date_value(date_str)
+    d = parse_date_value(date_str)
     if d is None:
         return "Upcoming"
     if d == date.today():
@@ -130,7 +109,7 @@ def show_event_form(event: dict | None = None):
 
         col1, col2 = st.columns(2)
         with col1:
-            existing_date = _parse_date_value(event.get("date", "")) if is_editing else None
+            existing_date = parse_date_value(event.get("date", "")) if is_editing else None
             event_date = st.date_input("Date", value=existing_date, format="YYYY-MM-DD")
         with col2:
             type_opts = EVENT_TYPES
@@ -222,15 +201,13 @@ def show_event_form(event: dict | None = None):
 # ============ RECORD ATTENDANCE DIALOG ============
 
 @st.dialog("Record Attendance", width="large")
-def show_attendance_form(event: dict, fellows: list, attendance: list):
+def show_attendance_form(event: dict, analytics):
     st.subheader(f"{event['name']}")
     st.caption(f"{_fmt_date_long(event['date'])} · {event.get('venue') or event.get('location', '')}")
     st.divider()
 
-    # Build existing attendance lookup for this event
-    existing = {r["fellow_id"]: r["attended"] for r in attendance if r["event_id"] == event["id"]}
-
-    eligible = [f for f in fellows if f.get("fellow_type") != "AISF" and _is_tracked_cohort(f.get("cohort", ""))]
+    existing = analytics.event_attendance.get(event["id"], {})
+    eligible = analytics.eligible
 
     with st.form("attendance_form"):
         st.markdown("**Mark attendance for each fellow:**")
@@ -270,25 +247,10 @@ def show_attendance_form(event: dict, fellows: list, attendance: list):
 
 # ============ OVERVIEW TAB ============
 
-def show_overview(fellows, events, attendance):
-    past_events = [e for e in events if _is_past(e["date"])]
-
-    # Compute avg attendance across past events
-    att_by_event = {}
-    for rec in attendance:
-        att_by_event.setdefault(rec["event_id"], []).append(rec["attended"])
-
-    pcts = []
-    for e in past_events:
-        vals = att_by_event.get(e["id"], [])
-        if vals:
-            pcts.append(int(round(sum(vals) / len(vals) * 100)))
-    avg_pct = int(round(sum(pcts) / len(pcts))) if pcts else 0
-
-    # Quarter compliance
-    eligible = [f for f in fellows if f.get("fellow_type") != "AISF" and _is_tracked_cohort(f.get("cohort", ""))]
-    compliance = get_quarter_compliance(eligible, events, attendance)
-    at_risk = sum(1 for qc in compliance.values() if "not_met" in qc.values())
+def show_overview(analytics):
+    events = analytics.events
+    past_events = analytics.past_events
+    compliance = analytics.compliance
 
     # ── Metrics ──────────────────────────────────────────────────────────────
     c1, c2, c3, c4 = st.columns(4)
@@ -299,10 +261,10 @@ def show_overview(fellows, events, attendance):
         st.metric("Events Completed", len(past_events))
         st.caption("Attendance recorded")
     with c3:
-        st.metric("Avg. Attendance", f"{avg_pct}%")
+        st.metric("Avg. Attendance", f"{analytics.avg_pct}%")
         st.caption("Across past events")
     with c4:
-        st.metric("At-Risk Fellows", at_risk)
+        st.metric("At-Risk Fellows", analytics.at_risk)
         st.caption("Missing ≥1 quarterly event")
 
     st.markdown("---")
@@ -317,10 +279,8 @@ def show_overview(fellows, events, attendance):
         else:
             rows_html = ""
             for e in past_events:
-                vals = att_by_event.get(e["id"], [])
-                attended = sum(vals)
-                total = len(vals)
-                pct = int(round(attended / total * 100)) if total else 0
+                stats = analytics.stats(e["id"])
+                attended, total, pct = stats["attended"], stats["recorded"], stats["pct"]
                 dot = TYPE_COLORS.get(e["type"], {}).get("dot", "#6366f1")
                 bar = _att_bar(pct)
                 rows_html += (
@@ -344,13 +304,13 @@ def show_overview(fellows, events, attendance):
     # ── Right column ──────────────────────────────────────────────────────────
     with col_right:
         # Quarterly compliance grid
-        quarters = sorted({q for qc in compliance.values() for q in qc.keys()})
+        quarters = analytics.quarters
         st.markdown("**Quarterly Compliance**")
         if not compliance:
             st.caption("No data yet.")
         else:
             rows_html = ""
-            for fellow in eligible:
+            for fellow in analytics.eligible:
                 fid = fellow["id"]
                 qc = compliance.get(fid, {})
                 pills = "".join(_quarter_pill(qc[q], q) for q in quarters if q in qc)
@@ -377,7 +337,7 @@ def show_overview(fellows, events, attendance):
         st.markdown("<div style='margin-top:1rem;'></div>", unsafe_allow_html=True)
 
         # Upcoming events
-        upcoming = [e for e in events if _is_upcoming(e["date"])][:5]
+        upcoming = analytics.upcoming_events[:5]
         st.markdown("**Upcoming Events**")
         if not upcoming:
             st.caption("No upcoming events scheduled.")
@@ -404,7 +364,98 @@ def show_overview(fellows, events, attendance):
 
 # ============ EVENTS TAB ============
 
-def show_events_tab(fellows, events, attendance):
+def show_event_card(event, analytics, idx):
+    """One event card with its Edit / Attendance buttons and attendance roster.
+    idx is the event's position in the filtered list; it keeps the button keys
+    unique even if two events share an ID (or have none)."""
+    status = _event_status(event["date"])
+    ev_att = analytics.event_attendance.get(event["id"], {})
+    stats = analytics.stats(event["id"])
+    total, attended_count, pct = stats["recorded"], stats["attended"], stats["pct"]
+
+    required_label = ""
+    if not event.get("required"):
+        required_label = '<span class="tc-badge tc-badge-gray">Not Required</span> '
+
+    staffed_html = ""
+    if event.get("staffed_by"):
+        staffed_html = (f'<span style="font-size:0.78rem;color:var(--tc-text2);">👤 {event["staffed_by"]}</span>')
+
+    location_parts = [p for p in [event.get("venue"), event.get("location")] if p]
+    location_str = " · ".join(location_parts) if location_parts else ""
+
+    location_span = f'<span>📍 {location_str}</span>' if location_str else ''
+    quarter_span  = f'<span>🗓 {event.get("quarter","")}</span>' if event.get("quarter") else ''
+    card_left = (
+        f'<div style="flex:1;min-width:0;">'
+        f'<div style="display:flex;align-items:center;gap:0.4rem;flex-wrap:wrap;margin-bottom:0.3rem;">'
+        f'<span style="font-weight:600;font-size:0.95rem;color:var(--tc-text);">{event["name"]}</span>'
+        f'{_type_badge(event["type"])}{_status_badge(status)}{required_label}'
+        f'</div>'
+        f'<p style="font-size:0.82rem;color:var(--tc-text2);margin:0 0 0.4rem 0;">{event.get("description","")}</p>'
+        f'<div style="display:flex;flex-wrap:wrap;gap:1rem;font-size:0.78rem;color:var(--tc-text3);">'
+        f'<span>📅 {_fmt_date_long(event["date"])}</span>'
+        f'{location_span}{quarter_span}{staffed_html}'
+        f'</div></div>'
+    )
+
+    if status == "Past" and total > 0:
+        card_right = (f'<div style="text-align:right;flex-shrink:0;margin-left:1rem;">'
+                      f'<p style="font-size:1.5rem;font-weight:700;color:var(--tc-text);margin:0;">{pct}%</p>'
+                      f'<p style="font-size:0.75rem;color:var(--tc-text3);margin:0 0 0.25rem 0;">'
+                      f'{attended_count}/{total} attended</p>'
+                      f'<div style="width:7rem;">{_att_bar(pct)}</div></div>')
+    else:
+        card_right = ""
+
+    st.markdown(
+        f'<div class="event-card">'
+        f'<div style="display:flex;align-items:flex-start;">'
+        f'{card_left}{card_right}</div></div>',
+        unsafe_allow_html=True,
+    )
+
+    # Action buttons beneath each card
+    btn_cols = st.columns([1, 1, 4])
+    with btn_cols[0]:
+        if st.button("✏️ Edit", key=f"edit_{idx}_{event['id']}", use_container_width=True):
+            st.session_state.events_editing = event["id"]
+            st.session_state.events_show_form = False
+            st.rerun()
+    with btn_cols[1]:
+        if status == "Past":
+            label = "📋 Update Attendance" if total > 0 else "📋 Record Attendance"
+            if st.button(label, key=f"att_btn_{idx}_{event['id']}", use_container_width=True):
+                st.session_state.events_attendance_event_id = event["id"]
+                st.rerun()
+
+    # Attendance roster (shown if attendance has been recorded)
+    if status == "Past" and total > 0:
+        with st.expander("View attendance roster", expanded=False):
+            roster_cols = st.columns(3)
+            for i, fellow in enumerate(analytics.eligible):
+                fid = fellow["id"]
+                was_present = ev_att.get(fid)
+                if was_present is None:
+                    continue
+                row_bg = "var(--tc-present-bg)" if was_present else "var(--tc-absent-bg)"
+                dot_color = "#22c55e" if was_present else "#ef4444"
+                name_color = "var(--tc-present-text)" if was_present else "var(--tc-absent-text)"
+                with roster_cols[i % 3]:
+                    st.markdown(
+                        f'<div style="display:flex;align-items:center;gap:0.4rem;'
+                        f'padding:0.3rem 0.65rem;border-radius:0.4rem;background:{row_bg};'
+                        f'margin-bottom:0.3rem;">'
+                        f'<span style="width:7px;height:7px;border-radius:50%;'
+                        f'background:{dot_color};flex-shrink:0;display:inline-block;"></span>'
+                        f'<span style="font-size:0.82rem;color:{name_color};">'
+                        f'{fellow["name"]}</span></div>',
+                        unsafe_allow_html=True,
+                    )
+
+
+def show_events_tab(analytics):
+    events = analytics.events
     # ── Filters ───────────────────────────────────────────────────────────────
     col_search, col_type, col_quarter, col_btn = st.columns([3, 2, 2, 1.2])
     with col_search:
@@ -433,15 +484,13 @@ def show_events_tab(fellows, events, attendance):
     if st.session_state.events_attendance_event_id:
         target = next((e for e in events if e["id"] == st.session_state.events_attendance_event_id), None)
         if target:
-            show_attendance_form(target, fellows, attendance)
+            show_attendance_form(target, analytics)
 
     # ── Filter logic ──────────────────────────────────────────────────────────
     filtered = events
     if search:
-        sl = search.lower()
-        filtered = [e for e in filtered if sl in e["name"].lower()
-                    or sl in e.get("description", "").lower()
-                    or sl in e.get("location", "").lower()]
+        search_rank = search_tab(EVENTS_SHEET, search)   # name, venue, location, description
+        filtered = sorted((e for e in filtered if e["id"] in search_rank), key=lambda e: search_rank[e["id"]])
     if type_filter != "All Types":
         filtered = [e for e in filtered if e["type"] == type_filter]
     if quarter_filter != "All Quarters":
@@ -449,99 +498,9 @@ def show_events_tab(fellows, events, attendance):
 
     st.caption(f"Showing {len(filtered)} of {len(events)} events")
 
-    # ── Event cards ───────────────────────────────────────────────────────────
-    att_by_event = {}
-    for rec in attendance:
-        att_by_event.setdefault(rec["event_id"], {})[rec["fellow_id"]] = rec["attended"]
-
-    eligible = [f for f in fellows if f.get("fellow_type") != "AISF" and _is_tracked_cohort(f.get("cohort", ""))]
-
-    for idx, event in enumerate(filtered):
-        status = _event_status(event["date"])
-        ev_att = att_by_event.get(event["id"], {})
-        total = len(ev_att)
-        attended_count = sum(ev_att.values())
-        pct = int(round(attended_count / total * 100)) if total else 0
-
-        required_label = ""
-        if not event.get("required"):
-            required_label = '<span class="tc-badge tc-badge-gray">Not Required</span> '
-
-        staffed_html = ""
-        if event.get("staffed_by"):
-            staffed_html = (f'<span style="font-size:0.78rem;color:var(--tc-text2);">👤 {event["staffed_by"]}</span>')
-
-        location_parts = [p for p in [event.get("venue"), event.get("location")] if p]
-        location_str = " · ".join(location_parts) if location_parts else ""
-
-        location_span = f'<span>📍 {location_str}</span>' if location_str else ''
-        quarter_span  = f'<span>🗓 {event.get("quarter","")}</span>' if event.get("quarter") else ''
-        card_left = (
-            f'<div style="flex:1;min-width:0;">'
-            f'<div style="display:flex;align-items:center;gap:0.4rem;flex-wrap:wrap;margin-bottom:0.3rem;">'
-            f'<span style="font-weight:600;font-size:0.95rem;color:var(--tc-text);">{event["name"]}</span>'
-            f'{_type_badge(event["type"])}{_status_badge(status)}{required_label}'
-            f'</div>'
-            f'<p style="font-size:0.82rem;color:var(--tc-text2);margin:0 0 0.4rem 0;">{event.get("description","")}</p>'
-            f'<div style="display:flex;flex-wrap:wrap;gap:1rem;font-size:0.78rem;color:var(--tc-text3);">'
-            f'<span>📅 {_fmt_date_long(event["date"])}</span>'
-            f'{location_span}{quarter_span}{staffed_html}'
-            f'</div></div>'
-        )
-
-        if status == "Past" and total > 0:
-            card_right = (f'<div style="text-align:right;flex-shrink:0;margin-left:1rem;">'
-                          f'<p style="font-size:1.5rem;font-weight:700;color:var(--tc-text);margin:0;">{pct}%</p>'
-                          f'<p style="font-size:0.75rem;color:var(--tc-text3);margin:0 0 0.25rem 0;">'
-                          f'{attended_count}/{total} attended</p>'
-                          f'<div style="width:7rem;">{_att_bar(pct)}</div></div>')
-        else:
-            card_right = ""
-
-        st.markdown(
-            f'<div class="event-card">'
-            f'<div style="display:flex;align-items:flex-start;">'
-            f'{card_left}{card_right}</div></div>',
-            unsafe_allow_html=True,
-        )
-
-        # Action buttons beneath each card
-        btn_cols = st.columns([1, 1, 4])
-        with btn_cols[0]:
-            if st.button("✏️ Edit", key=f"edit_{idx}_{event['id']}", use_container_width=True):
-                st.session_state.events_editing = event["id"]
-                st.session_state.events_show_form = False
-                st.rerun()
-        with btn_cols[1]:
-            if status == "Past":
-                label = "📋 Update Attendance" if total > 0 else "📋 Record Attendance"
-                if st.button(label, key=f"att_btn_{idx}_{event['id']}", use_container_width=True):
-                    st.session_state.events_attendance_event_id = event["id"]
-                    st.rerun()
-
-        # Attendance roster (shown if attendance has been recorded)
-        if status == "Past" and total > 0:
-            with st.expander("View attendance roster", expanded=False):
-                roster_cols = st.columns(3)
-                for i, fellow in enumerate(eligible):
-                    fid = fellow["id"]
-                    was_present = ev_att.get(fid)
-                    if was_present is None:
-                        continue
-                    row_bg = "var(--tc-present-bg)" if was_present else "var(--tc-absent-bg)"
-                    dot_color = "#22c55e" if was_present else "#ef4444"
-                    name_color = "var(--tc-present-text)" if was_present else "var(--tc-absent-text)"
-                    with roster_cols[i % 3]:
-                        st.markdown(
-                            f'<div style="display:flex;align-items:center;gap:0.4rem;'
-                            f'padding:0.3rem 0.65rem;border-radius:0.4rem;background:{row_bg};'
-                            f'margin-bottom:0.3rem;">'
-                            f'<span style="width:7px;height:7px;border-radius:50%;'
-                            f'background:{dot_color};flex-shrink:0;display:inline-block;"></span>'
-                            f'<span style="font-size:0.82rem;color:{name_color};">'
-                            f'{fellow["name"]}</span></div>',
-                            unsafe_allow_html=True,
-                        )
+    # ── Event cards (one page at a time) ─────────────────────────────────────
+    card_grid(list(enumerate(filtered)), lambda item: show_event_card(item[1], analytics, item[0]),
+              key="events_grid", columns=1, page_sizes=(10, 25, 50), item_id=lambda item: item[1]["id"])
 
     if not filtered:
         st.info("No events match your filters.")
@@ -549,37 +508,25 @@ def show_events_tab(fellows, events, attendance):
 
 # ============ FELLOWS TAB ============
 
-def show_fellows_tab(fellows, events, attendance):
+def show_fellows_tab(analytics):
     st.caption(
         "Tracking attendance for Jan 2026 CIF/SCIF fellows and future cohorts. "
         "Each fellow must attend at least one required event per quarter."
     )
     st.markdown("<div style='margin-bottom:0.75rem;'></div>", unsafe_allow_html=True)
 
-    eligible = [f for f in fellows if f.get("fellow_type") != "AISF" and _is_tracked_cohort(f.get("cohort", ""))]
-    compliance = get_quarter_compliance(eligible, events, attendance)
-    quarters = sorted({q for qc in compliance.values() for q in qc.keys()})
-
-    # Build attendance lookup: {fellow_id: {event_id: attended}}
-    att_lookup = {}
-    for rec in attendance:
-        att_lookup.setdefault(rec["fellow_id"], {})[rec["event_id"]] = rec["attended"]
-
-    past_events = [e for e in events if _is_past(e["date"])]
+    eligible = analytics.eligible
+    quarters = analytics.quarters
 
     col1, col2 = st.columns(2)
     for i, fellow in enumerate(eligible):
         fid = fellow["id"]
-        qc = compliance.get(fid, {})
-        at_risk = "not_met" in qc.values()
-
-        f_att = att_lookup.get(fid, {})
-        total = len([e for e in past_events if fid in att_lookup.get(fid, {}) or True])
-        # Count only events where we have a record for this fellow
-        fellow_past_records = [e for e in past_events if fid in att_lookup.get(fid, {})]
-        attended_count = sum(1 for e in fellow_past_records if att_lookup[fid].get(e["id"], False))
-        recorded_total = len(fellow_past_records)
-        pct = int(round(attended_count / recorded_total * 100)) if recorded_total else 0
+        summary = analytics.summaries[fid]
+        qc = summary["quarters"]
+        at_risk = summary["at_risk"]
+        attended_count = summary["attended"]
+        recorded_total = summary["recorded"]
+        pct = summary["pct"]
 
         border_color = "#fca5a5" if at_risk else "var(--tc-border)"
 
@@ -628,11 +575,12 @@ def show_fellows_tab(fellows, events, attendance):
 
             # Expandable event history
             with st.expander("View event history"):
+                # Only past events with a record for this fellow
+                fellow_past_records = [(e, was) for e, was in analytics.index.history(fid) if was is not None]
                 if not fellow_past_records:
                     st.caption("No attendance recorded yet.")
                 else:
-                    for e in fellow_past_records:
-                        was_present = att_lookup[fid].get(e["id"], False)
+                    for e, was_present in fellow_past_records:
                         dot = TYPE_COLORS.get(e["type"], {}).get("dot", "#6366f1")
                         badge_cls = "tc-badge-met" if was_present else "tc-badge-not-met"
                         badge_text = "✓ Attended" if was_present else "✗ Absent"
@@ -659,19 +607,17 @@ st.markdown("## 📅 Events & Attendance")
 st.caption("Jan 2026 CIF/SCIF cohort · Required: ≥1 event per quarter")
 st.markdown("<div style='margin-bottom:0.5rem;'></div>", unsafe_allow_html=True)
 
-# Fetch data
-fellows = fetch_fellows()
-events = fetch_events()
-attendance = fetch_all_event_attendance()
+# Fetch data (one batched read for all three tabs) with the page's derived lookups
+analytics = get_events_analytics()
 
 # Main tabs
 tab_overview, tab_events, tab_fellows = st.tabs(["Overview", "Events", "Fellows"])
 
 with tab_overview:
-    show_overview(fellows, events, attendance)
+    show_overview(analytics)
 
 with tab_events:
-    show_events_tab(fellows, events, attendance)
+    show_events_tab(analytics)
 
 with tab_fellows:
-    show_fellows_tab(fellows, events, attendance)
+    show_fellows_tab(analytics)
@@ -0,0 +1,74 @@
+import html
+import streamlit as st
+from helpers import search_notes, NOTE_SOURCES
+from styles import get_css
+
+# ============ AUTH GUARD ============
+if not st.session_state.get("authenticated"):
+    st.warning("Please log in first.")
+    st.stop()
+
+# ============ CUSTOM CSS ============
+st.markdown(get_css(), unsafe_allow_html=True)
+
+# Badge class per indexed source (see NOTE_SOURCES in helpers.py)
+SOURCE_BADGES = {
+    "Fellow Notes":     "tc-badge-blue",
+    "Engagement Notes": "tc-badge-emerald",
+    "Alumni Notes":     "tc-badge-green",
+    "Check-in Notes":   "tc-badge-purple",
+}
+
+
+# ============ MAIN PAGE ============
+
+def main():
+    st.image("TechCongress Logo (black).png", width=200)
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        st.title("Search")
+    with col2:
+        if st.button("Logout", use_container_width=True):
+            st.session_state["authenticated"] = False
+            st.rerun()
+
+    st.caption("Search fellow notes, alumni engagement notes and check-in notes")
+
+    col_query, col_source = st.columns([3, 1])
+    with col_query:
+        query = st.text_input("Search", placeholder="e.g. appropriations hearing, AI policy…")
+    with col_source:
+        source_options = ["All Sources"] + [label for _, _, label in NOTE_SOURCES]
+        source_filter = st.selectbox("Source", source_options)
+
+    if not query.strip():
+        st.info("Type a word or phrase to search. Best matches are listed first.")
+        return
+
+    hits = search_notes(query, label=None if source_filter == "All Sources" else source_filter)
+
+    st.caption(f"{len(hits)} result(s)")
+    if not hits:
+        st.info("No notes match your search.")
+        return
+
+    for hit in hits:
+        badge_cls = SOURCE_BADGES.get(hit["label"], "tc-badge-gray")
+        date_html = (
+            f'<span style="font-size:0.75rem;color:var(--tc-text3);margin-left:0.5rem;">{html.escape(hit["date"])}</span>'
+            if hit["date"] else ""
+        )
+        st.markdown(
+            f'<div style="background:var(--tc-surface);padding:1rem 1.25rem;border-radius:0.75rem;'
+            f'border:1px solid var(--tc-border);margin-bottom:0.75rem;box-shadow:0 1px 3px var(--tc-shadow);">'
+            f'<div style="display:flex;align-items:center;gap:0.5rem;margin-bottom:0.4rem;">'
+            f'<span style="font-weight:600;color:var(--tc-text);">{html.escape(hit["name"] or "Unknown")}</span>'
+            f'<span class="tc-badge {badge_cls}">{hit["label"]}</span>{date_html}</div>'
+            f'<p style="font-size:0.85rem;color:var(--tc-text4);margin:0;">{html.escape(hit["snippet"])}</p>'
+            f'</div>',
+            unsafe_allow_html=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+records.py — Compact record types for the rows the dashboard caches
+
+Every row helpers.py decodes becomes one of these classes instead of a plain
+dict. They use __slots__, so each record stores its values in a fixed layout
+with no per-instance dict; the shared snapshot cache holds one per sheet row.
+
+They keep the dict-style interface the pages were written against:
+
+    fellow["name"], fellow.get("party", ""), "notes" in fellow, dict(fellow)
+
+A record decoded for a column-projected view (e.g. FELLOW_CARDS) only has the
+view's fields set: reading any other field with [] raises KeyError, and
+.get() returns the default.
+
+Records are shared by every session and are read-only by convention — copy
+one with dict(record) before changing it.
+
+Date columns also carry a parsed "<field>_dt" companion (datetime or None),
+filled in once when the row is decoded, and fellows and alumni carry a parsed
+CohortKey for sorting and filtering by cohort. Low-cardinality text columns (party,
+chamber, cohort, fellow type, status, sector, event type) are interned with
+intern_str(), so thousands of records share one copy of each value.
+
+This module does NOT depend on Streamlit or gspread.
+"""
+
+import sys
+from typing import NamedTuple
+
+
+def intern_str(val) -> str:
+    """str(val), interned — for categorical columns that repeat on every row."""
+    return sys.intern(str(val))
+
+
+class CohortKey(NamedTuple):
+    """
+    A cohort label parsed once into sortable parts:
+    "Jan 2026 CIF/SCIF" -> CohortKey(2026, 1, "CIF/SCIF"), "2020" -> CohortKey(2020, 0, "").
+    month is 0 for year-only cohorts; year is 0 (and program the whole label)
+    when no year can be found. Keys compare chronologically.
+    """
+    year: int
+    month: int
+    program: str
+
+
+class Record:
+    """Base class: dict-style read access over the __slots__ declared by subclasses."""
+
+    __slots__ = ()
+    _fields: tuple = ()
+    _field_set: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            fields.extend(klass.__dict__.get("__slots__", ()))
+        cls._fields = tuple(fields)
+        cls._field_set = frozenset(fields)
+
+    def __init__(self, **values):
+        for key, value in values.items():
+            setattr(self, key, value)   # an unknown field raises AttributeError
+
+    # ── Mapping interface ────────────────────────────────────────────────────
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:      # slot not loaded (column-projected view)
+                pass
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        return key in self._field_set and hasattr(self, key)
+
+    def keys(self) -> list[str]:
+        return [key for key in self._fields if hasattr(self, key)]
+
+    def values(self) -> list:
+        return [self[key] for key in self.keys()]
+
+    def items(self) -> list[tuple]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Record, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class Fellow(Record):
+    __slots__ = (
+        "id", "name", "email", "congressional_email", "phone", "fellow_type", "party",
+        "office", "chamber", "linkedin", "start_date", "end_date", "cohort", "status",
+        "last_check_in", "prior_role", "education", "notes", "requires_monthly_reports",
+        "report_start_date", "report_end_month", "supervisor_email",
+        # parsed dates
+        "start_date_dt", "end_date_dt", "last_check_in_dt", "report_start_date_dt",
+        # derived (helpers._FELLOW_DECODER / helpers._enrich_fellow)
+        "cohort_key", "attendance_tracked", "is_aisf", "type_label", "days_since_checkin", "needs_checkin", "days_until_end",
+    )
+
+
+class CheckIn(Record):
+    __slots__ = ("id", "fellow_id", "fellow", "date", "check_in_type", "notes", "staff_member", "date_dt")
+
+
+class StatusReport(Record):
+    __slots__ = (
+        "id", "fellow_id", "fellow", "month", "submitted", "date_submitted", "notes", "late",
+        "date_submitted_dt",
+    )
+
+
+class Alumni(Record):
+    __slots__ = (
+        "id", "name", "email", "phone", "cohort", "fellow_types", "office_served", "chamber",
+        "party", "current_role", "sector", "location", "contact", "linkedin", "last_engaged",
+        "engagement_notes", "notes", "prior_role", "education", "currently_on_hill",
+        "last_engaged_dt", "cohort_key",
+    )
+
+
+class Event(Record):
+    __slots__ = (
+        "id", "name", "date", "type", "location", "venue", "cohort", "quarter",
+        "description", "required", "staffed_by", "date_dt",
+    )
+
+
+class AttendanceRecord(Record):
+    __slots__ = ("id", "event_id", "fellow_id", "fellow_name", "attended", "notes")
+
+
+class FormResponse(Record):
+    __slots__ = ("timestamp", "email", "first_name", "last_name")
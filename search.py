@@ -0,0 +1,197 @@
+"""
+search.py — In-memory search indexes over cached records
+
+TokenIndex backs the roster search boxes. It maps every word in a few text
+fields of a record list to the records containing it, plus a sorted vocabulary
+so a query word also matches the words it is a prefix of:
+
+    index = TokenIndex(fellows, {"name": 3, "office": 2, "cohort": 1})
+    index.search("sen wa")   # -> positions of e.g. "Sen. Warner" staff, best first
+
+Every query word must match (exactly or as a prefix) somewhere in the record.
+Each match scores the field's weight — doubled for a whole-word match — and
+records are ranked by their total, ties kept in list order. A query costs a
+dictionary lookup and a binary search per word, however many records there are.
+
+FullTextIndex backs the global Search page. It ranks free-text documents
+(fellow notes, alumni engagement notes, check-in notes) against a query with
+BM25, and documents can be added, replaced or removed one at a time:
+
+    index = FullTextIndex()
+    index.add(("Check-ins", "notes", checkin_id), checkin["notes"])
+    index.search("appropriations hearing")   # -> [(key, score), ...], best first
+    snippet(index.text(key), "appropriations hearing")
+
+This module does NOT depend on Streamlit or gspread.
+"""
+
+import bisect
+import math
+import re
+from collections import Counter
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text) -> list[str]:
+    """Lower-cased words of a text ("Sen. O'Neil, HSGAC" -> ["sen", "o", "neil", "hsgac"])."""
+    return _WORD.findall(str(text or "").casefold())
+
+
+class TokenIndex:
+    """
+    Word and prefix index over `fields` ({record key: weight}) of `records`.
+    Results are positions in `records`. Fields a record doesn't have (e.g.
+    column-projected views) are skipped.
+    """
+
+    def __init__(self, records: list, fields: dict[str, float]):
+        self._postings: dict[str, dict[int, float]] = {}   # word -> {position: best field weight}
+        for pos, record in enumerate(records):
+            for field, weight in fields.items():
+                for word in tokenize(record.get(field, "")):
+                    posting = self._postings.setdefault(word, {})
+                    if weight > posting.get(pos, 0):
+                        posting[pos] = weight
+        self._vocabulary = sorted(self._postings)
+
+    def _word_scores(self, term: str) -> dict[int, float]:
+        """position -> best score for one query word (exact match 2x weight, prefix match 1x)."""
+        scores = {pos: 2 * weight for pos, weight in self._postings.get(term, {}).items()}
+        start = bisect.bisect_left(self._vocabulary, term)
+        for word in self._vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            if word == term:
+                continue
+            for pos, weight in self._postings[word].items():
+                if weight > scores.get(pos, 0):
+                    scores[pos] = weight
+        return scores
+
+    def search(self, query: str) -> list[int]:
+        """Positions of the records matching every word of `query`, best match first."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        totals = None
+        for term in dict.fromkeys(terms):
+            scores = self._word_scores(term)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {pos: total + scores[pos] for pos, total in totals.items() if pos in scores}
+            if not totals:
+                return []
+        return sorted(totals, key=lambda pos: (-totals[pos], pos))
+
+
+class FullTextIndex:
+    """
+    BM25 (k1, b) over documents addressed by a hashable key. Each query word
+    also matches the words it is a prefix of, at half weight, so partial
+    words still find something.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._docs: dict = {}                              # key -> (text, length)
+        self._postings: dict[str, dict] = {}               # word -> {key: term frequency}
+        self._vocabulary: list[str] = []                   # sorted words, rebuilt lazily
+        self._vocabulary_stale = False
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, key, text: str) -> None:
+        """Index `text` under `key`, replacing what was there. Blank text just removes it."""
+        self.remove(key)
+        words = tokenize(text)
+        if not words:
+            return
+        self._docs[key] = (str(text), len(words))
+        self._total_length += len(words)
+        for word, tf in Counter(words).items():
+            posting = self._postings.setdefault(word, {})
+            if not posting:
+                self._vocabulary_stale = True
+            posting[key] = tf
+
+    def remove(self, key) -> None:
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        self._total_length -= doc[1]
+        for word in set(tokenize(doc[0])):
+            posting = self._postings.get(word)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self._postings[word]
+                    self._vocabulary_stale = True
+
+    def text(self, key) -> str:
+        doc = self._docs.get(key)
+        return doc[0] if doc else ""
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """(word, weight) pairs a query word matches: itself, plus longer words it prefixes at 0.5."""
+        if self._vocabulary_stale:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_stale = False
+        matches = [(term, 1.0)] if term in self._postings else []
+        start = bisect.bisect_left(self._vocabulary, term)
+        for word in self._vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            if word != term:
+                matches.append((word, 0.5))
+        return matches
+
+    def search(self, query: str, limit: int = 50, keep=None) -> list[tuple]:
+        """
+        Up to `limit` (key, score) pairs for documents matching any query word,
+        best first. keep(key) -> bool, if given, drops documents before the
+        limit is applied (scores still use the whole index).
+        """
+        if not self._docs:
+            return []
+        n = len(self._docs)
+        avg_length = self._total_length / n
+        scores: dict = {}
+        for term in dict.fromkeys(tokenize(query)):
+            for word, weight in self._expand(term):
+                posting = self._postings[word]
+                idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+                for key, tf in posting.items():
+                    length = self._docs[key][1]
+                    norm = tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+                    scores[key] = scores.get(key, 0.0) + weight * idf * norm
+        if keep is not None:
+            scores = {key: score for key, score in scores.items() if keep(key)}
+        return sorted(scores.items(), key=lambda item: -item[1])[:limit]
+
+
+def snippet(text: str, query: str, width: int = 160) -> str:
+    """
+    About `width` characters of `text` around the first word that starts with
+    a query word, with "…" where it was cut. The start of the text if nothing matches.
+    """
+    text = " ".join(str(text or "").split())
+    terms = tokenize(query)
+    first = None
+    for match in _WORD.finditer(text):
+        word = match.group().casefold()
+        if any(word.startswith(term) for term in terms):
+            first = match.start()
+            break
+    if first is None or len(text) <= width:
+        start = 0
+    else:
+        start = max(0, min(first - width // 3, len(text) - width))
+        space = text.rfind(" ", 0, start)          # don't cut a word in half
+        start = space + 1 if space >= 0 and start - space < 20 else start
+    end = min(len(text), start + width)
+    return ("…" if start > 0 else "") + text[start:end].strip() + ("…" if end < len(text) else "")
@@ -0,0 +1,202 @@
+"""
+sheets_gateway.py — Quota-aware request gateway for every Google Sheets call
+
+Google Sheets allows 60 read and 60 write requests per minute per user, and
+the dashboard and sync script both act as a single service-account user. This
+module puts all of their HTTP traffic through one RequestGateway that:
+
+  - waits on a token bucket per quota (reads / writes) instead of letting a
+    burst hit the API and come back as 429 errors
+  - sends Drive API requests (the change-detection version probe) through a
+    bucket of their own, since they count against the Drive quota, not Sheets
+  - retries 429 and 5xx responses with jittered exponential backoff
+  - counts the requests it has sent (per process)
+
+gspread is wired to the gateway through its HTTP client hook:
+
+    client = gspread.authorize(creds, http_client=gateway_http_client(gateway))
+
+so every gspread call (open_by_key, get_all_values, append_row, batch_update,
+...) is throttled and retried without changes at the call sites.
+
+The gateway takes its clock, sleep and random functions as arguments, so it can
+be driven by a fake clock and a fake request function. It does NOT depend on
+Streamlit; helpers.py and sync_status_reports.py each build their own.
+"""
+
+import random
+import threading
+import time
+
+from gspread.http_client import HTTPClient
+
+
+# Sheets API per-user quotas (requests per minute)
+DEFAULT_READS_PER_MINUTE  = 60
+DEFAULT_WRITES_PER_MINUTE = 60
+
+# Drive API requests (file metadata for change detection) have their own,
+# much larger quota; this only keeps a runaway probe loop in check
+DEFAULT_DRIVE_PER_MINUTE = 600
+DRIVE_API_URL = "https://www.googleapis.com/drive/"
+
+# Retry policy for 429 / 5xx responses
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BASE_DELAY  = 1.0    # seconds; doubled on each attempt
+DEFAULT_MAX_DELAY   = 32.0   # seconds; cap on a single backoff sleep
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at per_minute / 60 tokens per second,
+    holding at most `capacity` tokens (defaults to one minute's quota).
+    """
+
+    def __init__(self, per_minute: float, capacity: float = None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        # Caller holds self._lock
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+def status_code(exc: Exception):
+    """HTTP status carried by an exception (gspread.APIError or anything with .response), or None."""
+    code = getattr(exc, "code", None)
+    if isinstance(code, int):
+        return code
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_retryable(exc: Exception) -> bool:
+    """True for quota (429) and server-side (5xx) errors."""
+    code = status_code(exc)
+    return code is not None and (code == 429 or 500 <= code < 600)
+
+
+class RequestGateway:
+    """
+    Throttle, retry and count Sheets API requests.
+
+    call(kind, send) takes a token from the "read", "write" or "drive" bucket, runs
+    send(), and retries it on 429/5xx up to max_retries times, sleeping a
+    random fraction of base_delay * 2**attempt (capped at max_delay) between
+    attempts ("full jitter", so concurrent sessions don't retry in lockstep).
+    Every attempt, including retries, takes a token and is counted.
+    """
+
+    def __init__(
+        self,
+        reads_per_minute: float = DEFAULT_READS_PER_MINUTE,
+        writes_per_minute: float = DEFAULT_WRITES_PER_MINUTE,
+        drive_per_minute: float = DEFAULT_DRIVE_PER_MINUTE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        clock=time.monotonic,
+        sleep=time.sleep,
+        rand=random.random,
+    ):
+        self.buckets = {
+            "read":  TokenBucket(reads_per_minute, clock=clock, sleep=sleep),
+            "write": TokenBucket(writes_per_minute, clock=clock, sleep=sleep),
+            "drive": TokenBucket(drive_per_minute, clock=clock, sleep=sleep),
+        }
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._rand = rand
+        self._lock = threading.Lock()
+        self.counts = {"read": 0, "write": 0, "drive": 0, "retries": 0, "throttled_seconds": 0.0}
+
+    @classmethod
+    def from_config(cls, config, **kwargs) -> "RequestGateway":
+        """
+        Build a gateway from the [gsheets] secrets table. Optional keys:
+            reads_per_minute, writes_per_minute, drive_per_minute, max_retries
+        """
+        return cls(
+            reads_per_minute=float(config.get("reads_per_minute", DEFAULT_READS_PER_MINUTE)),
+            writes_per_minute=float(config.get("writes_per_minute", DEFAULT_WRITES_PER_MINUTE)),
+            drive_per_minute=float(config.get("drive_per_minute", DEFAULT_DRIVE_PER_MINUTE)),
+            max_retries=int(config.get("max_retries", DEFAULT_MAX_RETRIES)),
+            **kwargs,
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        return self._rand() * min(self.max_delay, self.base_delay * (2 ** attempt))
+
+    def call(self, kind: str, send):
+        """Run send() as one `kind` ("read", "write" or "drive") request, throttled and retried."""
+        attempt = 0
+        while True:
+            waited = self.buckets[kind].acquire()
+            with self._lock:
+                self.counts[kind] += 1
+                self.counts["throttled_seconds"] += waited
+            try:
+                return send()
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+            delay = self._backoff(attempt)
+            with self._lock:
+                self.counts["retries"] += 1
+            self._sleep(delay)
+            attempt += 1
+
+    def stats(self) -> dict:
+        """Snapshot of the request counters for this process."""
+        with self._lock:
+            stats = dict(self.counts)
+        stats["total"] = stats["read"] + stats["write"] + stats["drive"]
+        return stats
+
+
+def request_kind(method: str, url: str = "") -> str:
+    """
+    Which quota a request counts against: "drive" for Drive API URLs, else the
+    Sheets quotas by method (GET is a read, anything else a write).
+    """
+    if str(url).startswith(DRIVE_API_URL):
+        return "drive"
+    return "read" if method.upper() == "GET" else "write"
+
+
+def gateway_http_client(gateway: RequestGateway) -> type:
+    """
+    Return a gspread HTTPClient class whose requests all go through `gateway`.
+    Pass it as gspread.authorize(creds, http_client=...).
+    """
+
+    class GatewayHTTPClient(HTTPClient):
+        def request(self, method, endpoint, *args, **kwargs):
+            return gateway.call(
+                request_kind(method, endpoint),
+                lambda: super(GatewayHTTPClient, self).request(method, endpoint, *args, **kwargs),
+            )
+
+    return GatewayHTTPClient
@@ -53,6 +53,7 @@ except FileNotFoundError:
 
 import gspread
 from google.oauth2.service_account import Credentials
+from sheets_gateway import RequestGateway, gateway_http_client
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -63,7 +64,9 @@ creds = Credentials.from_service_account_info(
     dict(secrets["gcp_service_account"]),
     scopes=SCOPES,
 )
-client      = gspread.authorize(creds)
+# Every request is throttled to the Sheets quotas and retried on 429/5xx
+gateway     = RequestGateway.from_config(secrets["gsheets"])
+client      = gspread.authorize(creds, http_client=gateway_http_client(gateway))
 spreadsheet = client.open_by_key(secrets["gsheets"]["spreadsheet_id"])
 
 # The form responses live in a separate spreadsheet (linked from the Google Form).
@@ -226,6 +229,12 @@ def sync(year: int, month: int) -> dict:
         for r in all_reports
     }
 
+    # Report ID → sheet row number, taken from the same read (row 1 is the
+    # header), so upserts below don't need a ws.find() scan per fellow.
+    row_of = {}
+    for i, r in enumerate(all_reports, start=2):
+        row_of.setdefault(str(r.get("ID", "")), i)
+
     # Build set of (fellow_id, date_submitted) pairs already consumed as late
     # submissions for a DIFFERENT month. These must be skipped to prevent
     # double-counting (e.g. an April 3rd submission already attributed to March).
@@ -298,6 +307,27 @@ def sync(year: int, month: int) -> dict:
     # ── 7. Upsert Status Report records ───────────────────────────────────────
     ws_reports = _ws(REPORTS_SHEET)
 
+    # Confirm the rows from step 4 against column A (one read) before writing:
+    # a row inserted or deleted by hand since then shifts the rows below it,
+    # and a stale row number would overwrite another fellow's report.
+    to_update = [existing[(fellow_id, month_label)] for fellow_id in deduped_fellows
+                 if (fellow_id, month_label) in existing]
+    if to_update:
+        try:
+            report_ids = [str(v) for v in ws_reports.col_values(1)]
+        except Exception as e:
+            result["errors"].append(f"Failed to re-read status report IDs: {e}")
+            return result
+        moved = [
+            report_id for report_id in to_update
+            if row_of[report_id] > len(report_ids) or report_ids[row_of[report_id] - 1] != report_id
+        ]
+        if moved:
+            print(f"   ↻ {len(moved)} status report row(s) moved since they were read; re-locating by ID")
+            row_of = {}
+            for i, report_id in enumerate(report_ids[1:], start=2):
+                row_of.setdefault(report_id, i)
+
     for fellow_id, response in deduped_fellows.items():
         fellow_name    = response["fellow_name"]
         date_submitted = _to_est(response["timestamp"]).strftime("%Y-%m-%d")
@@ -307,12 +337,12 @@ def sync(year: int, month: int) -> dict:
         report_key = (fellow_id, month_label)
         try:
             if report_key in existing:
-                report_id = existing[report_key]
-                cell = ws_reports.find(report_id, in_column=1)
-                if cell:
-                    ws_reports.update_cell(cell.row, 5, "TRUE")                              # E: Submitted
-                    ws_reports.update_cell(cell.row, 6, date_submitted)                      # F: Date Submitted
-                    ws_reports.update_cell(cell.row, 8, "TRUE" if is_late else "FALSE")      # H: Late
+                row = row_of.get(existing[report_key])
+                if row:
+                    ws_reports.batch_update([
+                        {"range": f"E{row}:F{row}", "values": [["TRUE", date_submitted]]},   # E: Submitted, F: Date Submitted
+                        {"range": f"H{row}",        "values": [["TRUE" if is_late else "FALSE"]]},  # H: Late
+                    ], value_input_option="USER_ENTERED")
             else:
                 ws_reports.append_row([
                     _new_id(),                              # A: ID
@@ -387,6 +417,9 @@ if __name__ == "__main__":
         for u in result["unmatched"]:
             print(f"   {u['first_name']} {u['last_name']} ({u['email']})")
 
+    stats = gateway.stats()
+    print(f"\n📡 Sheets API requests: {stats['total']} ({stats['read']} read, {stats['write']} write, {stats['retries']} retried)")
+
     if result["errors"]:
         print(f"\n🔴 Errors ({len(result['errors'])}):")
         for e in result["errors"]:
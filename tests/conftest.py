@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# The app's modules live at the repository root, next to this tests/ folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def helpers(monkeypatch):
+    """helpers.py on a fresh synthetic in-memory workbook, with empty process-wide caches."""
+    st = pytest.importorskip("streamlit")
+    pytest.importorskip("gspread")
+    monkeypatch.setattr(st, "secrets", {"gsheets": {"spreadsheet_id": "test", "backend": "memory"}})
+    import helpers
+    st.cache_resource.clear()
+    return helpers
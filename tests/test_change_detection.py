@@ -0,0 +1,86 @@
+"""
+Change detection: an expired snapshot is kept while the spreadsheet's version
+is unchanged, and re-read once it moves (InMemoryBackend.touch() stands in for
+an edit made directly in the sheet).
+"""
+
+import pytest
+
+
+class CountingLoader:
+    """A _SnapshotCache loader that hands out a new snapshot object per load."""
+
+    def __init__(self):
+        self.loads = []
+
+    def __call__(self, tabs):
+        self.loads.append(list(tabs))
+        return {tab: object() for tab in tabs}
+
+
+@pytest.fixture
+def backend(helpers):
+    return helpers.InMemoryBackend({"Fellows": [["ID", "Name"], ["1", "Ada"]]})
+
+
+def expired_cache(helpers, probe):
+    """A cache whose snapshots are always past their TTL, so every read consults the probe."""
+    return helpers._SnapshotCache(ttl=0, probe=probe)
+
+
+def test_unchanged_version_skips_the_reload(helpers, backend):
+    cache, loader = expired_cache(helpers, backend.version), CountingLoader()
+
+    first = cache.get_many(["Fellows"], loader)["Fellows"]
+    second = cache.get_many(["Fellows"], loader)["Fellows"]
+
+    assert second is first
+    assert loader.loads == [["Fellows"]]
+    assert backend.calls["version"] == 2
+
+
+def test_touch_bumps_the_version_and_reloads(helpers, backend):
+    cache, loader = expired_cache(helpers, backend.version), CountingLoader()
+    first = cache.get_many(["Fellows"], loader)["Fellows"]
+    version = backend.version()
+
+    backend.touch()
+
+    assert backend.version() != version
+    assert cache.get_many(["Fellows"], loader)["Fellows"] is not first
+    assert len(loader.loads) == 2
+
+
+def test_a_write_moves_the_version(helpers, backend):
+    cache, loader = expired_cache(helpers, backend.version), CountingLoader()
+    cache.get_many(["Fellows"], loader)
+
+    backend.append_rows("Fellows", [["2", "Grace"]])
+    cache.get_many(["Fellows"], loader)
+
+    assert len(loader.loads) == 2
+
+
+def test_failed_probe_reloads(helpers):
+    def probe():
+        raise RuntimeError("Drive unavailable")
+
+    cache, loader = expired_cache(helpers, probe), CountingLoader()
+    cache.get_many(["Fellows"], loader)
+    cache.get_many(["Fellows"], loader)
+
+    assert len(loader.loads) == 2
+
+
+def test_fetch_helpers_read_the_sheet_only_after_it_changes(helpers, monkeypatch):
+    monkeypatch.setattr(helpers, "CHANGE_DETECTION", True)
+    monkeypatch.setattr(helpers, "CACHE_TTL_SECONDS", 0)
+    calls = helpers._backend().calls
+
+    helpers.fetch_fellows()
+    helpers.fetch_fellows()
+    assert calls["read_tabs"] == 1
+
+    helpers._backend().touch()
+    helpers.fetch_fellows()
+    assert calls["read_tabs"] == 2
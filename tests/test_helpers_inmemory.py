@@ -0,0 +1,101 @@
+"""
+CRUD helpers run against InMemoryBackend: every write lands on the right row,
+and the write-through patches leave the cached snapshot identical to a fresh
+read of the tab (the `helpers` fixture is in conftest.py).
+"""
+
+from datetime import date
+
+
+def assert_matches_sheet(helpers, tab):
+    """The cached snapshot of `tab` holds what a fresh read of the backend would."""
+    cached = helpers._snapshot(tab)
+    fresh = helpers._TabSnapshot(helpers._spec(tab), helpers._backend().read_tabs([tab])[tab])
+    fresh.enrich(date.today())
+    assert cached.row_of == fresh.row_of
+    assert [dict(r) for r in cached.records] == [dict(r) for r in fresh.records]
+
+
+def sheet_row(helpers, tab, record_id):
+    """The backend row (cells) whose column A holds record_id."""
+    return next(row for row in helpers._backend().read_tabs([tab])[tab] if row[0] == record_id)
+
+
+def test_create_fellow_is_patched_into_the_cache(helpers):
+    before = len(helpers.fetch_fellows())
+    helpers._backend().calls.clear()
+
+    assert helpers.create_fellow({"name": "New Fellow", "cohort": "January 2026", "status": "Active"})
+
+    assert helpers._backend().calls["read_tabs"] == 0   # served from the patched snapshot
+    names = [f["name"] for f in helpers.fetch_fellows()]
+    assert len(names) == before + 1 and "New Fellow" in names
+    assert_matches_sheet(helpers, helpers.FELLOWS_SHEET)
+
+
+def test_update_fellow_overwrites_its_own_row(helpers):
+    fellow = helpers.fetch_fellows()[3]
+
+    assert helpers.update_fellow(fellow["id"], {**dict(fellow), "notes": "Moved to the Senate side"})
+
+    assert helpers.fetch_fellow(fellow["id"])["notes"] == "Moved to the Senate side"
+    assert "Moved to the Senate side" in sheet_row(helpers, helpers.FELLOWS_SHEET, fellow["id"])
+    assert_matches_sheet(helpers, helpers.FELLOWS_SHEET)
+
+
+def test_add_checkin_then_delete_keeps_rows_aligned(helpers):
+    fellow_id = helpers.fetch_fellows()[0]["id"]
+    assert helpers.add_checkin({"fellow_id": fellow_id, "date": "2026-10-01",
+                                "check_in_type": "Call", "notes": "Quarterly call"})
+    added = helpers.fetch_checkins(fellow_id)[0]
+    assert added["notes"] == "Quarterly call"
+    assert_matches_sheet(helpers, helpers.CHECKINS_SHEET)
+
+    # Deleting a row near the top shifts every row below it up by one
+    doomed = helpers._snapshot(helpers.CHECKINS_SHEET).items()[1][1]
+    assert helpers.delete_checkin(doomed["id"])
+
+    snapshot = helpers._snapshot(helpers.CHECKINS_SHEET)
+    assert snapshot.record(doomed["id"]) is None
+    assert helpers.fetch_checkins(fellow_id)[0]["id"] == added["id"]
+    assert_matches_sheet(helpers, helpers.CHECKINS_SHEET)
+
+    # A later delete addresses the shifted row, not the one cached before
+    assert helpers.delete_checkin(added["id"])
+    grid = helpers._backend().read_tabs([helpers.CHECKINS_SHEET])[helpers.CHECKINS_SHEET]
+    assert all(row[0] != added["id"] for row in grid)
+    assert_matches_sheet(helpers, helpers.CHECKINS_SHEET)
+
+
+def test_delete_unknown_checkin_fails(helpers):
+    assert not helpers.delete_checkin("no-such-id")
+
+
+def test_row_deleted_by_hand_is_relocated(helpers, monkeypatch):
+    monkeypatch.setattr(helpers, "ROW_CHECK_SECONDS", 0)   # confirm column A before every write
+    fellow = helpers.fetch_fellows()[5]
+    helpers._backend().delete_row(helpers.FELLOWS_SHEET, 2)   # edited in the sheet, not through helpers
+
+    assert helpers.update_fellow(fellow["id"], {**dict(fellow), "notes": "Still here"})
+
+    assert "Still here" in sheet_row(helpers, helpers.FELLOWS_SHEET, fellow["id"])
+    assert_matches_sheet(helpers, helpers.FELLOWS_SHEET)
+
+
+def test_attendance_batch_updates_and_inserts_in_one_write_each(helpers):
+    event_id = helpers.fetch_events()[0]["id"]
+    recorded = [a for a in helpers.fetch_all_event_attendance() if a["event_id"] == event_id]
+    existing = recorded[0]["fellow_id"]
+    new = next(f["id"] for f in helpers.fetch_fellows() if f["id"] not in {a["fellow_id"] for a in recorded})
+    helpers._backend().calls.clear()
+
+    assert helpers.save_event_attendance_batch(event_id, {
+        existing: ("Existing", False, "left early"),
+        new:      ("New", True, ""),
+    })
+
+    calls = helpers._backend().calls
+    assert calls["batch_update"] == 1 and calls["append_rows"] == 1
+    saved = {a["fellow_id"]: a for a in helpers.fetch_all_event_attendance() if a["event_id"] == event_id}
+    assert saved[existing]["notes"] == "left early" and saved[new]["attended"]
+    assert_matches_sheet(helpers, helpers.EVENT_ATTENDANCE_SHEET)
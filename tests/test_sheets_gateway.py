@@ -0,0 +1,163 @@
+"""
+RequestGateway driven by a fake clock and a fake request function: token
+bucket waiting, jittered exponential backoff, and which errors are retried.
+"""
+
+import pytest
+
+pytest.importorskip("gspread")   # sheets_gateway subclasses gspread's HTTP client
+
+from sheets_gateway import RequestGateway, is_retryable
+
+
+class FakeClock:
+    """time.monotonic / time.sleep stand-ins: sleeping just moves the clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class FakeAPIError(Exception):
+    """Carries the HTTP status on .response, like gspread.exceptions.APIError."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.response = FakeResponse(status_code)
+
+
+def failing(*status_codes, result="ok"):
+    """A send() that raises FakeAPIError for each status in turn, then returns result."""
+    calls = []
+
+    def send():
+        calls.append(None)
+        if len(calls) <= len(status_codes):
+            raise FakeAPIError(status_codes[len(calls) - 1])
+        return result
+
+    send.calls = calls
+    return send
+
+
+def make_gateway(clock, **kwargs):
+    return RequestGateway(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+# ── Token bucket ─────────────────────────────────────────────────────────────
+
+def test_requests_within_quota_do_not_wait():
+    clock = FakeClock()
+    gateway = make_gateway(clock, reads_per_minute=60)
+    for _ in range(60):
+        assert gateway.call("read", lambda: "ok") == "ok"
+    assert clock.sleeps == []
+    assert gateway.stats()["read"] == 60
+
+
+def test_request_over_quota_waits_for_a_token():
+    clock = FakeClock()
+    gateway = make_gateway(clock, reads_per_minute=60)
+    for _ in range(61):
+        gateway.call("read", lambda: "ok")
+    # One token per second at 60/min: the 61st request waits exactly one second
+    assert clock.sleeps == [pytest.approx(1.0)]
+    assert gateway.stats()["throttled_seconds"] == pytest.approx(1.0)
+
+
+def test_bucket_refills_with_time():
+    clock = FakeClock()
+    gateway = make_gateway(clock, writes_per_minute=60)
+    for _ in range(60):
+        gateway.call("write", lambda: "ok")
+    clock.now += 30.0   # half a minute later, 30 tokens are back
+    for _ in range(30):
+        gateway.call("write", lambda: "ok")
+    assert clock.sleeps == []
+
+
+def test_reads_writes_and_drive_have_separate_buckets():
+    clock = FakeClock()
+    gateway = make_gateway(clock, reads_per_minute=1, writes_per_minute=1, drive_per_minute=1)
+    for kind in ("read", "write", "drive"):
+        gateway.call(kind, lambda: "ok")
+    assert clock.sleeps == []
+    assert gateway.stats()["total"] == 3
+
+
+# ── Backoff ──────────────────────────────────────────────────────────────────
+
+def test_backoff_is_jittered_and_doubles():
+    clock = FakeClock()
+    gateway = make_gateway(clock, base_delay=1.0, rand=lambda: 0.5)
+    send = failing(429, 503, 500)
+    assert gateway.call("read", send) == "ok"
+    assert len(send.calls) == 4
+    # rand() * base_delay * 2**attempt
+    assert clock.sleeps == [0.5, 1.0, 2.0]
+    assert gateway.stats()["retries"] == 3
+
+
+def test_backoff_is_capped_at_max_delay():
+    clock = FakeClock()
+    gateway = make_gateway(clock, base_delay=1.0, max_delay=4.0, max_retries=6, rand=lambda: 1.0)
+    gateway.call("read", failing(*[429] * 6))
+    assert clock.sleeps == [1.0, 2.0, 4.0, 4.0, 4.0, 4.0]
+
+
+def test_gives_up_after_max_retries():
+    clock = FakeClock()
+    gateway = make_gateway(clock, max_retries=2, rand=lambda: 0.0)
+    send = failing(429, 429, 429, 429)
+    with pytest.raises(FakeAPIError):
+        gateway.call("read", send)
+    assert len(send.calls) == 3   # first attempt + 2 retries
+
+
+# ── Retry classification ─────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_quota_and_server_errors_are_retried(status):
+    clock = FakeClock()
+    gateway = make_gateway(clock, rand=lambda: 0.0)
+    send = failing(status)
+    assert gateway.call("write", send) == "ok"
+    assert len(send.calls) == 2
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404])
+def test_other_client_errors_are_not_retried(status):
+    clock = FakeClock()
+    gateway = make_gateway(clock, rand=lambda: 0.0)
+    send = failing(status)
+    with pytest.raises(FakeAPIError):
+        gateway.call("write", send)
+    assert len(send.calls) == 1
+    assert gateway.stats()["retries"] == 0
+
+
+def test_errors_without_a_status_are_not_retried():
+    assert not is_retryable(ValueError("boom"))
+    clock = FakeClock()
+    gateway = make_gateway(clock)
+    calls = []
+
+    def send():
+        calls.append(None)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        gateway.call("read", send)
+    assert len(calls) == 1